@@ -0,0 +1,65 @@
+"""
+Benchmark: throughput of One Call Api accessors, with and without per-access debug logging.
+
+The accessors are measured with :attr:`~pocar.OneCallApi.OneCallApi.trace_access` set to True (default)
+and False, with logging at WARNING level, as in production.
+
+Run from the repository root with: python -m benchmarks.bench_accessors
+"""
+import argparse
+import logging
+import sys
+import timeit
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+from pocar.OneCallApiStubServer import build_payload
+
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def accessors():
+    """Returns the accessors to measure, by name, on objects holding a full response."""
+    rawdata = build_payload(45.1234, 1.2345)
+    objs = {}
+    for cls in (OneCallApiCurrent, OneCallApiMinutely, OneCallApiHourly, OneCallApiDaily, OneCallApiAlerts):
+        objs[cls] = cls(45.1234, 1.2345, KEY)
+        objs[cls]._rawdata = rawdata  # pylint: disable=protected-access
+    current, minutely = objs[OneCallApiCurrent], objs[OneCallApiMinutely]
+    hourly, daily, alerts = objs[OneCallApiHourly], objs[OneCallApiDaily], objs[OneCallApiAlerts]
+    return {
+        "OneCallApi.lat/lon/key/exc": lambda: (current.lat, current.lon, current.key, current.exc),
+        "Current.temperature": current.temperature,
+        "Current.weather_condition_id": current.weather_condition_id,
+        "Minutely.precipitation(all)": lambda: minutely.precipitation(all_values=True),
+        "Hourly.temp": lambda: hourly.temp(5),
+        "Hourly.temp(all)": lambda: hourly.temp(all_values=True),
+        "Hourly.weather_id(all)": lambda: hourly.weather_id(all_values=True),
+        "Hourly.data_time(all)": lambda: hourly.data_time(all_values=True),
+        "Daily.temp_max(all)": lambda: daily.temp_max(all_values=True),
+        "Alerts.event": alerts.event,
+    }
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000, help="number of calls per accessor and mode")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    sys.stdout.write(f"{'accessor':<30}{'trace on':>14}{'trace off':>14}{'speedup':>10}\n")
+    for name, func in accessors().items():
+        rates = []
+        for trace_access in (True, False):
+            OneCallApi.trace_access = trace_access
+            rates.append(args.calls / timeit.timeit(func, number=args.calls))
+        sys.stdout.write(f"{name:<30}{rates[0]:>12.0f}/s{rates[1]:>12.0f}/s{rates[1] / rates[0]:>9.2f}x\n")
+    OneCallApi.trace_access = True
+
+
+if __name__ == "__main__":
+    main()
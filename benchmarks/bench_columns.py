@@ -0,0 +1,47 @@
+"""
+Benchmark: memory and read time of the Hourly section, as a list of dictionaries and as columns.
+
+The memory is measured with tracemalloc, for one location, the read time is the one of reading
+all the values of one field: walking the list of dictionaries, or reading the column.
+
+Run from the repository root with: python -m benchmarks.bench_columns
+"""
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+
+from pocar.OneCallApiColumns import OneCallApiColumns
+from pocar.OneCallApiHourly import HOURLY_COLUMNS
+from pocar.OneCallApiStubServer import build_payload
+
+
+def allocated(func):
+    """Returns the result of func and the memory, in bytes, it allocated and still holds."""
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000, help="number of reads per representation")
+    args = parser.parse_args()
+    text = json.dumps(build_payload(45.1234, 1.2345)["hourly"])
+    hourly, list_size = allocated(lambda: json.loads(text))
+    columns, columns_size = allocated(lambda: OneCallApiColumns(hourly, HOURLY_COLUMNS))
+    list_time = timeit.timeit(
+        lambda: [entry["temp"] if "temp" in entry else "N/A" for entry in hourly], number=args.calls
+    )
+    columns_time = timeit.timeit(lambda: columns.values("temp", 48), number=args.calls)
+    sys.stdout.write(f"{'representation':<20}{'memory':>12}{'temp(all)':>14}\n")
+    sys.stdout.write(f"{'list of dict':<20}{list_size:>10} B{args.calls / list_time:>12.0f}/s\n")
+    sys.stdout.write(f"{'columns':<20}{columns_size:>10} B{args.calls / columns_time:>12.0f}/s\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: decode time and peak memory of a full One Call Api response, per JSON library installed.
+
+The response is the full-size payload of the stub server (61 minutely, 48 hourly and 8 daily entries,
+and alerts), or a response recorded from OpenWeatherMap given with --payload.
+Each library decodes the bytes of the response, as received, "requests" is `requests.Response.json`,
+the decoding used before :class:`~pocar.OneCallApiDecoder.OneCallApiDecoder`.
+The "lazy" rows decode the Current section only, with :class:`~pocar.OneCallApiLazyResponse.OneCallApiLazyResponse`.
+
+Run from the repository root with: python -m benchmarks.bench_decoder
+"""
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+
+import requests
+
+from pocar.OneCallApiDecoder import OneCallApiDecoder
+from pocar.OneCallApiLazyResponse import OneCallApiLazyResponse
+from pocar.OneCallApiStubServer import build_payload
+
+
+def requests_json(content):
+    """Returns a function decoding the content as requests does."""
+    resp = requests.models.Response()
+    resp._content = content  # pylint: disable=protected-access
+    resp.encoding = None
+    resp.headers["Content-Type"] = "application/json"
+    return resp.json
+
+
+def peak_memory(func):
+    """Returns the peak memory, in bytes, allocated while calling func."""
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payload", help="path of a recorded One Call Api response, the stub payload if omitted")
+    parser.add_argument("--calls", type=int, default=2000, help="number of decodes per library")
+    args = parser.parse_args()
+    if args.payload is None:
+        content = json.dumps(build_payload(45.1234, 1.2345)).encode()
+    else:
+        with open(args.payload, "rb") as payload:
+            content = payload.read()
+    decoders = {"requests": requests_json(content)}
+    for backend in OneCallApiDecoder.available():
+        decoder = OneCallApiDecoder(backend)
+        decoders[backend] = lambda decoder=decoder: decoder.decode(content)
+        decoders[f"{backend} lazy"] = lambda decoder=decoder: OneCallApiLazyResponse(content, decoder.decode)["current"]
+    sys.stdout.write(f"payload of {len(content)} bytes\n")
+    sys.stdout.write(f"{'library':<14}{'decode':>12}{'peak memory':>16}\n")
+    for name, func in decoders.items():
+        duration = timeit.timeit(func, number=args.calls) / args.calls
+        sys.stdout.write(f"{name:<14}{duration * 1e6:>9.1f} us{peak_memory(func):>14} B\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: a reduction over the hourly forecasts of many locations, per object and with a fleet.
+
+The reduction is the maximum wind gust per location over the next 12 hours: read per object, with
+`wind_gust(all_values=True)`, and with :class:`~pocar.OneCallApiFleet.OneCallApiFleet`.
+
+Run from the repository root with: python -m benchmarks.bench_fleet
+"""
+import argparse
+import json
+import sys
+import time
+
+from pocar.OneCallApiFleet import OneCallApiFleet
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiStubServer import build_payload
+
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def build_objects(count):
+    """Returns Hourly objects holding a response, one per location, responses are not shared."""
+    text = json.dumps(build_payload(45.0, 1.0))
+    objects = []
+    for idx in range(count):
+        oca = OneCallApiHourly(45.0, -180.0 + idx * 360.0 / count, KEY)
+        oca._rawdata = json.loads(text)  # pylint: disable=protected-access
+        objects.append(oca)
+    return objects
+
+
+def per_object(objects):
+    """Returns the maximum wind gust over the next 12 hours, per object."""
+    result = []
+    for oca in objects:
+        gusts = [value for value in oca.wind_gust(all_values=True)[:12] if value != "N/A"]
+        result.append(max(gusts) if gusts else None)
+    return result
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--locations", type=int, default=10000, help="number of locations")
+    args = parser.parse_args()
+    objects = build_objects(args.locations)
+    start = time.perf_counter()
+    per_object(objects)
+    loop_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fleet = OneCallApiFleet(objects)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    fleet.reduce("wind_gust", "max", steps=12)
+    reduce_time = time.perf_counter() - start
+    sys.stdout.write(f"{args.locations} locations, fleet of {fleet.data.nbytes / 1e6:.1f} MB\n")
+    sys.stdout.write(f"{'per object loop':<24}{loop_time * 1e3:>10.1f} ms\n")
+    sys.stdout.write(f"{'fleet build':<24}{build_time * 1e3:>10.1f} ms\n")
+    sys.stdout.write(f"{'fleet reduce':<24}{reduce_time * 1e3:>10.1f} ms\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: cost of storing a full One Call Api response with DEBUG logging disabled.
+
+Compares the former eager json.dumps(indent=2) argument with the lazy payload logging,
+then measures a full update_data call against a local stub server.
+
+Run from the repository root with: python -m benchmarks.bench_logging
+"""
+import argparse
+import json
+import logging
+import sys
+import timeit
+
+from pocar.OneCallApi import logger
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiStubServer import build_payload
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def store_data_eager(oca, rawdata):
+    """Reproduces the former _store_data: the payload is serialized even when DEBUG is disabled."""
+    oca._rawdata = rawdata  # pylint: disable=protected-access
+    logger.debug("OneCallApi response, as json raw data:\n%s", json.dumps(rawdata, indent=2))
+
+
+def report(name, seconds, calls):
+    """Writes the time per call to the standard output."""
+    sys.stdout.write(f"{name:<28} {seconds / calls * 1e6:10.2f} us/call\n")
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000, help="number of calls per measure")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    rawdata = build_payload(45.1234, 1.2345)
+    oca = OneCallApi(45.1234, 1.2345, KEY)
+    report(
+        "store, eager json.dumps", timeit.timeit(lambda: store_data_eager(oca, rawdata), number=args.calls), args.calls
+    )
+    store_data = oca._store_data  # pylint: disable=protected-access
+    report("store, lazy payload log", timeit.timeit(lambda: store_data(rawdata), number=args.calls), args.calls)
+    with OneCallApiStubServer() as server:
+        OneCallApi.base_url = server.url
+        oca = OneCallApi(45.1234, 1.2345, KEY)
+        calls = max(args.calls // 10, 1)
+        report("update_data, full payload", timeit.timeit(oca.update_data, number=calls), calls)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark: memory of the Current and Daily sections, as decoded dictionaries and as records.
+
+The memory is measured with tracemalloc, for a number of locations, the sections being held
+as decoded by json, and as compacted by :mod:`pocar.OneCallApiRecords`.
+
+Run from the repository root with: python -m benchmarks.bench_records
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+
+from pocar.OneCallApiRecords import OneCallApiCurrentRecord
+from pocar.OneCallApiRecords import OneCallApiDailyRecord
+from pocar.OneCallApiStubServer import build_payload
+
+
+def allocated(func):
+    """Returns the result of func and the memory, in bytes, it allocated and still holds."""
+    tracemalloc.start()
+    result = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--locations", type=int, default=1000, help="number of locations held")
+    args = parser.parse_args()
+    payload = build_payload(45.1234, 1.2345)
+    texts = {section: json.dumps(payload[section]) for section in ("current", "daily")}
+    sections, dict_size = allocated(
+        lambda: [{name: json.loads(text) for name, text in texts.items()} for _ in range(args.locations)]
+    )
+    _, records_size = allocated(
+        lambda: [
+            (
+                OneCallApiCurrentRecord.from_dict(item["current"]),
+                [OneCallApiDailyRecord.from_dict(entry) for entry in item["daily"]],
+            )
+            for item in sections
+        ]
+    )
+    sys.stdout.write(f"{'representation':<20}{'memory':>14}{'per location':>16}\n")
+    for name, size in (("dict", dict_size), ("records", records_size)):
+        sys.stdout.write(f"{name:<20}{size:>12} B{size / max(args.locations, 1):>14.0f} B\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: update_data calls per second served from a recorded archive, without network.
+
+The responses of a number of locations are recorded from the local stub server, then replayed through
+the full fetch and parse path of update_data, for a stored and for a compressed archive.
+
+Run from the repository root with: python -m benchmarks.bench_replay
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiArchive import OneCallApiRecordSession
+from pocar.OneCallApiArchive import OneCallApiReplaySession
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def record(path, locations, compression):
+    """Records the Hourly responses of the locations from the stub server."""
+    with OneCallApiStubServer() as server:
+        OneCallApi.base_url = server.url
+        with OneCallApiRecordSession(path, compression=compression) as recorder:
+            OneCallApi.session = recorder
+            for lat, lon in locations:
+                OneCallApiHourly(lat, lon, KEY).update_data()
+    OneCallApi.session = None
+
+
+def replay(path, objects, calls):
+    """Returns the update_data calls per second served from the archive."""
+    with OneCallApiReplaySession(path) as session:
+        OneCallApi.session = session
+        start = time.perf_counter()
+        for idx in range(calls):
+            objects[idx % len(objects)].update_data()
+        elapsed = time.perf_counter() - start
+    OneCallApi.session = None
+    return calls / elapsed
+
+
+def main():
+    """Runs the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--locations", type=int, default=100, help="number of locations recorded")
+    parser.add_argument("--calls", type=int, default=5000, help="number of update_data calls replayed")
+    args = parser.parse_args()
+    locations = [(45.0 + idx * 0.01, 1.0 + idx * 0.01) for idx in range(args.locations)]
+    sys.stdout.write(f"{'archive':<12}{'size':>12}{'lazy':>8}{'update_data':>16}\n")
+    with tempfile.TemporaryDirectory() as directory:
+        for name, compression in (("stored", zipfile.ZIP_STORED), ("deflated", zipfile.ZIP_DEFLATED)):
+            path = os.path.join(directory, f"{name}.zip")
+            record(path, locations, compression)
+            objects = [OneCallApiHourly(lat, lon, KEY) for lat, lon in locations]
+            for lazy in (False, True):
+                OneCallApi.lazy_sections = lazy
+                rate = replay(path, objects, args.calls)
+                sys.stdout.write(f"{name:<12}{os.path.getsize(path):>10} B{str(lazy):>8}{rate:>14.0f}/s\n")
+            OneCallApi.lazy_sections = False
+
+
+if __name__ == "__main__":
+    main()
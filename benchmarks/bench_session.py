@@ -0,0 +1,68 @@
+"""
+Benchmark: per-call latency of One Call Api requests with and without connection pooling.
+
+Run from the repository root with: python -m benchmarks.bench_session
+"""
+import argparse
+import statistics
+import sys
+import time
+
+import requests
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiSession import OneCallApiSession
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+KEY = "abcdef1234567890abcdef1234567890"
+EXC = "minutely,hourly,daily,alerts"
+
+
+class _NoPoolSession:  # pylint: disable=too-few-public-methods
+    """Session stand-in reproducing the former behaviour: one requests.get, one connection, per call."""
+
+    @staticmethod
+    def get(url, **kwargs):
+        """Makes an HTTP GET request on a new connection."""
+        return requests.get(url, **kwargs)  # pylint: disable=missing-timeout
+
+
+def measure(session, calls):
+    """Returns the latency, in milliseconds, of each update_data call made with the given session."""
+    oca = OneCallApi(45.1234, 1.2345, KEY, EXC)
+    oca.session = session
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        if oca.update_data() is False:
+            raise RuntimeError("update_data failed against the local stub server")
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return latencies
+
+
+def report(name, latencies):
+    """Writes latency statistics to the standard output."""
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    sys.stdout.write(
+        f"{name:<12} calls={len(latencies):<6} mean={statistics.mean(latencies):.3f}ms "
+        f"p50={statistics.median(latencies):.3f}ms p95={p95:.3f}ms\n"
+    )
+
+
+def main():
+    """Runs the benchmark against a local stub server."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500, help="number of update_data calls per mode")
+    args = parser.parse_args()
+    with OneCallApiStubServer() as server:
+        OneCallApi.base_url = server.url
+        report("no pooling", measure(_NoPoolSession(), args.calls))
+        pooled = OneCallApiSession()
+        report("pooled", measure(pooled, args.calls))
+        pooled.close()
+        sys.stdout.write(f"server connections: {server.connections}, requests: {server.requests}\n")
+
+
+if __name__ == "__main__":
+    main()
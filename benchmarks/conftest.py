@@ -0,0 +1,7 @@
+"""Hooks of the pytest-benchmark suite."""
+
+
+def pytest_benchmark_update_json(config, benchmarks, output_json):  # pylint: disable=unused-argument
+    """Drops the time of each round from the results, the statistics are kept, so that a baseline stays small."""
+    for bench in output_json["benchmarks"]:
+        bench["stats"].pop("data", None)
@@ -0,0 +1,98 @@
+"""
+Benchmark suite: accessors, construction cost and memory of One Call Api objects.
+
+Measures every accessor of every class on a full response, with `all_values=True` where the accessor
+takes it, the construction of each class, and the memory held by an instance, empty and with its response.
+
+The suite is not run by the default test run, see `testpaths` in pyproject.toml.
+Run it, and store its results as the baseline, from the repository root with:
+python -m pytest benchmarks --benchmark-json benchmarks/baseline.json
+Compare results with the baseline with: pytest-benchmark compare benchmarks/baseline.json results.json
+"""
+import inspect
+import json
+import tracemalloc
+
+import pytest
+
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiDecoder import OneCallApiDecoder
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+from pocar.OneCallApiStubServer import build_payload
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+CLASSES = {
+    "Current": OneCallApiCurrent,
+    "Minutely": OneCallApiMinutely,
+    "Hourly": OneCallApiHourly,
+    "Daily": OneCallApiDaily,
+    "Alerts": OneCallApiAlerts,
+    "Combined": OneCallApiCombined,
+}
+CONTENT = json.dumps(build_payload(LAT, LON)).encode()
+# The public methods that are not accessors of a single field
+NOT_ACCESSORS = ("columns", "compact", "record", "records")
+INSTANCES = 1000
+
+
+def accessors():
+    """Returns the (class name, accessor name) of the accessors of each class holding a section."""
+    found = []
+    for name, cls in CLASSES.items():
+        if cls is OneCallApiCombined:
+            continue
+        for attr, func in vars(cls).items():
+            if callable(func) and not attr.startswith(("_", "raw_data")) and attr not in NOT_ACCESSORS:
+                found.append((name, attr))
+    return found
+
+
+def loaded(cls):
+    """Returns an object of the class holding a full response."""
+    oca = cls(LAT, LON, KEY)
+    oca._rawdata = OneCallApiDecoder.shared().decode(CONTENT)  # pylint: disable=protected-access
+    return oca
+
+
+@pytest.mark.benchmark(group="accessors")
+@pytest.mark.parametrize("name,attr", accessors(), ids=[f"{name}.{attr}" for name, attr in accessors()])
+def test_accessor(benchmark, name, attr):
+    """Benchmark: an accessor, on all entries of the section when it takes all_values."""
+    method = getattr(loaded(CLASSES[name]), attr)
+    if "all_values" in inspect.signature(method).parameters:
+        benchmark(method, all_values=True)
+    else:
+        benchmark(method)
+
+
+@pytest.mark.benchmark(group="accessors")
+def test_accessor_combined_views(benchmark):
+    """Benchmark: the temperature of the first hour of the Hourly view of Combined, views included."""
+    oca = loaded(OneCallApiCombined)
+    assert benchmark(lambda: oca.hourly().temp(0)) is not None
+
+
+@pytest.mark.benchmark(group="construction")
+@pytest.mark.parametrize("name", list(CLASSES))
+def test_construction(benchmark, name):
+    """Benchmark: constructing an object, memory per instance, empty and holding its response, in extra_info."""
+    cls = CLASSES[name]
+    benchmark(cls, LAT, LON, KEY)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [cls(LAT + idx * 1e-4, LON, KEY) for idx in range(INSTANCES)]
+    empty = tracemalloc.get_traced_memory()[0]
+    for oca in objects:
+        oca._rawdata = OneCallApiDecoder.shared().decode(CONTENT)  # pylint: disable=protected-access
+    full = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    benchmark.extra_info["bytes_per_instance"] = (empty - before) // INSTANCES
+    benchmark.extra_info["bytes_per_instance_with_response"] = (full - before) // INSTANCES
+    assert len(objects) == INSTANCES
@@ -0,0 +1,115 @@
+"""
+Benchmark suite: fetch and parse path of One Call Api responses.
+
+Measures update_data against the local stub server, per class, blocking and asyncio,
+and the decoding of a full response, per JSON library installed.
+
+The suite is not run by the default test run, see `testpaths` in pyproject.toml.
+Run it, and store its results as the baseline, from the repository root with:
+python -m pytest benchmarks --benchmark-json benchmarks/baseline.json
+Compare results with the baseline with: pytest-benchmark compare benchmarks/baseline.json results.json
+"""
+import asyncio
+import json
+
+import pytest
+import requests
+
+from pocar.AsyncOneCallApi import AsyncOneCallApiHourly
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiDecoder import OneCallApiDecoder
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiLazyResponse import OneCallApiLazyResponse
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+from pocar.OneCallApiStubServer import build_payload
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+CLASSES = {
+    "Current": OneCallApiCurrent,
+    "Minutely": OneCallApiMinutely,
+    "Hourly": OneCallApiHourly,
+    "Daily": OneCallApiDaily,
+    "Alerts": OneCallApiAlerts,
+    "Combined": OneCallApiCombined,
+}
+
+
+@pytest.fixture(name="content", scope="module")
+def fixture_content():
+    """Fixture: a full One Call Api response, as the bytes received (61 minutely, 48 hourly and 8 daily entries)."""
+    return json.dumps(build_payload(LAT, LON)).encode()
+
+
+@pytest.fixture(name="stub_server")
+def fixture_stub_server(monkeypatch):
+    """Fixture: run a local One Call Api server, and point One Call Api objects to it."""
+    with OneCallApiStubServer() as server:
+        monkeypatch.setattr(OneCallApi, "base_url", server.url)
+        yield server
+
+
+@pytest.mark.benchmark(group="update_data")
+@pytest.mark.parametrize("name", list(CLASSES))
+def test_update_data(benchmark, stub_server, name):
+    """Benchmark: update_data of a class, request, decode and store, through a kept-alive connection."""
+    oca = CLASSES[name](LAT, LON, KEY)
+    assert benchmark(oca.update_data) is True
+    benchmark.extra_info["connections"] = stub_server.connections
+
+
+@pytest.mark.benchmark(group="update_data")
+def test_update_data_lazy(benchmark, stub_server, monkeypatch):  # pylint: disable=unused-argument
+    """Benchmark: update_data of Combined with lazy sections, the sections are not decoded."""
+    monkeypatch.setattr(OneCallApi, "lazy_sections", True)
+    oca = CLASSES["Combined"](LAT, LON, KEY)
+    assert benchmark(oca.update_data) is True
+
+
+@pytest.mark.benchmark(group="update_data")
+def test_update_data_async(benchmark, stub_server):  # pylint: disable=unused-argument
+    """Benchmark: update_data of Hourly with asyncio, in a single event loop."""
+    oca = AsyncOneCallApiHourly(LAT, LON, KEY)
+
+    async def close():
+        await AsyncOneCallApiSession.shared().close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert benchmark(lambda: loop.run_until_complete(oca.update_data())) is True
+        loop.run_until_complete(close())
+    finally:
+        loop.close()
+
+
+@pytest.mark.benchmark(group="decode")
+@pytest.mark.parametrize("backend", OneCallApiDecoder.available())
+def test_decode(benchmark, content, backend):
+    """Benchmark: decoding a full response from the bytes received, per JSON library."""
+    decoder = OneCallApiDecoder(backend)
+    assert "hourly" in benchmark(decoder.decode, content)
+    benchmark.extra_info["bytes"] = len(content)
+
+
+@pytest.mark.benchmark(group="decode")
+def test_decode_requests(benchmark, content):
+    """Benchmark: decoding a full response as requests.Response.json does, through text."""
+    resp = requests.models.Response()
+    resp._content = content  # pylint: disable=protected-access
+    resp.headers["Content-Type"] = "application/json"
+    assert "hourly" in benchmark(resp.json)
+
+
+@pytest.mark.benchmark(group="decode")
+def test_decode_lazy(benchmark, content):
+    """Benchmark: decoding the Current section only of a full response."""
+    decode = OneCallApiDecoder.shared().decode
+    assert "temp" in benchmark(lambda: OneCallApiLazyResponse(content, decode)["current"])
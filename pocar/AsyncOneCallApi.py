@@ -0,0 +1,309 @@
+"""This module provides asyncio classes to handle One Call Api response from OpenWeatherMap."""
+import asyncio
+import json
+import logging
+import weakref
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, installed with extra "async"
+    aiohttp = None
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMetrics import trace_config
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The background refreshes in flight, referenced until done so that they are not garbage collected
+_REVALIDATIONS = set()
+
+
+class AsyncOneCallApiSession:
+    """
+    Class to handle a pooled aiohttp session to OpenWeatherMap.
+
+    | The aiohttp session is created on first use, in the running event loop, and is bound to it.
+    | The session returned by :meth:`shared` is used by every :class:`AsyncOneCallApi` object
+    | that has no session of its own, there is one shared session per event loop.
+
+    :param limit: Maximum number of simultaneous connections, no limit if 0
+    :type limit: int, optional
+
+    :param limit_per_host: Maximum number of simultaneous connections to the same host, no limit if 0
+    :type limit_per_host: int, optional
+
+    :param keepalive_timeout: Time, in seconds, an idle connection is kept open
+    :type keepalive_timeout: float, optional
+    """
+
+    __shared = weakref.WeakKeyDictionary()
+
+    def __init__(self, limit=100, limit_per_host=0, keepalive_timeout=15.0):
+        """This is the constructor method."""
+        if aiohttp is None:
+            raise ImportError("AsyncOneCallApiSession requires aiohttp, install pocar with extra 'async'")
+        if limit < 0 or limit_per_host < 0:
+            raise ValueError("The 'limit' and 'limit_per_host' arguments must be greater or equal to 0")
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._session = None
+
+    @classmethod
+    def shared(cls):
+        """
+        | The shared method.
+
+        | Returns the session shared by all Async One Call Api objects of the running event loop.
+
+        :return: The shared session
+        :rtype: AsyncOneCallApiSession
+        """
+        loop = asyncio.get_running_loop()
+        session = cls.__shared.get(loop)
+        if session is None:
+            session = cls()
+            cls.__shared[loop] = session
+        return session
+
+    def config(self):
+        """
+        | The config method.
+
+        | Returns a dictionary containing the configuration of the session.
+
+        :return: Configuration of the session
+        :rtype: dict
+        """
+        return {
+            "limit": self._limit,
+            "limit_per_host": self._limit_per_host,
+            "keepalive_timeout": self._keepalive_timeout,
+        }
+
+    def _client(self):
+        """Returns the aiohttp session, created in the running event loop on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ssl=False,
+            )
+            self._session = aiohttp.ClientSession(connector=connector, trace_configs=[trace_config()])
+        return self._session
+
+    async def get_json(self, url, decode=None, timeout=None):
+        """
+        | The get_json method.
+
+        | Makes an HTTP GET request reusing a pooled connection when one is available.
+        | The response body is decoded from bytes by `decode`, e.g.
+        | :meth:`~pocar.OneCallApiDecoder.OneCallApiDecoder.decode`.
+
+        :param url: The URL to request
+        :type url: str
+
+        :param decode: The function decoding the response body, :func:`json.loads` if `None`
+        :type decode: callable, optional
+
+        :param timeout: The (connect, read) timeouts, in seconds, the session default if `None`
+        :type timeout: tuple, optional
+
+        :return: The decoded JSON response
+        :rtype: dict
+
+        :raises aiohttp.ClientError: on HTTP error status or connection failure
+        :raises ValueError: if the response body is not valid JSON
+        """
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+        async with self._client().get(url, **kwargs) as resp:
+            resp.raise_for_status()
+            content = await resp.read()
+        return (decode or json.loads)(content)
+
+    async def close(self):
+        """
+        | The close method.
+
+        | Closes all pooled connections of the session.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncOneCallApi(OneCallApi):
+    """
+    Base Class to handle OneCallApi response from OpenWeatherMap with asyncio.
+
+    This Class is derived from :class:`~pocar.OneCallAPi.OneCallAPi`, only
+    :meth:`update_data` differs: it is a coroutine.
+
+    :ivar session: The HTTP session used to perform the One Call Api call,
+        :meth:`AsyncOneCallApiSession.shared` is used when `None`
+    :vartype session: :class:`AsyncOneCallApiSession`
+    """
+
+    session = None
+
+    async def __get_data(self):  # pylint: disable=invalid-overridden-method
+        """
+        | The __get_data method.
+
+        | This method makes an HTTP request to OpenWeatherMap, through a pooled
+        | :class:`AsyncOneCallApiSession` connection.
+        | With a :attr:`coalescer`, concurrent calls for the same URL share a single request.
+        | While :attr:`breaker` is open, no request is made, and the last response is kept as stale.
+
+        :return: `True` if data successfully retrieved, `False` otherwise
+        :rtype: bool
+
+        :raises ImportError: if aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncOneCallApi requires aiohttp, install pocar with extra 'async'")
+        ticket = self._allow_call()
+        if ticket is None:
+            return False
+        recorded = False
+        try:
+            rawdata, error = await self.__fetch()
+            if error is None:
+                self._store_data(rawdata)
+            self._record_call(error, ticket)
+            recorded = True
+            return error is None
+        finally:
+            if not recorded:
+                self._release_call(ticket)
+
+    async def __fetch(self):
+        """
+        | The __fetch coroutine.
+
+        | Makes the One Call Api call, through :attr:`coalescer` if set.
+        | Request and decoding errors are logged and returned, other errors, and cancellation, are raised.
+
+        :return: The One Call Api response and `None`, or `None` and the error raised by the call
+        :rtype: tuple
+        """
+        try:
+            if self.coalescer is not None:
+                return await self.coalescer.run_async(self.url, self.__request), None
+            return await self.__request(), None
+        except aiohttp.ClientResponseError as errh:
+            logger.warning(errh)
+            return None, errh
+        except aiohttp.ClientError as errc:
+            logger.warning(errc)
+            return None, errc
+        except asyncio.TimeoutError as errt:
+            logger.warning(errt)
+            return None, errt
+        except ValueError as errd:
+            logger.warning("Invalid JSON in One Call Api response: %s", errd)
+            return None, errd
+
+    async def __request(self):  # pylint: disable=invalid-overridden-method
+        """
+        | The __request coroutine.
+
+        | Makes the HTTP request to :attr:`url`, bounded by :attr:`timeout`,
+        | or retried on transient errors as set by :attr:`retry`, each attempt waiting for :attr:`rate_limiter`.
+
+        :return: The One Call Api response, as a dictionary
+        :rtype: dict
+
+        :raises aiohttp.ClientError: on HTTP error status or connection failure
+        :raises ValueError: if the response body is not valid JSON
+        """
+        session = self.session if self.session is not None else AsyncOneCallApiSession.shared()
+
+        async def attempt(timeout):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            return await session.get_json(self.url, self._decode, timeout)
+
+        if self.retry is None:
+            return await attempt(self.timeout)
+        return await self.retry.call_async(attempt)
+
+    def _revalidate(self):
+        """
+        | The _revalidate method.
+
+        | Refreshes the One Call Api response in the background, as a task of the running event loop
+        | awaiting the One Call Api call, which skips :attr:`cache` as in
+        | :meth:`~pocar.OneCallAPi.OneCallAPi._revalidate`. Without running event loop, the response is not refreshed.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running event loop, the One Call Api response is not refreshed")
+            return
+        task = loop.create_task(self.__get_data())
+        _REVALIDATIONS.add(task)
+        task.add_done_callback(_REVALIDATIONS.discard)
+
+    async def update_data(self):  # pylint: disable=invalid-overridden-method
+        """
+        | The update_data coroutine.
+
+        This coroutine awaits a call to :meth:`__get_data`,
+        unless a response that has not expired is found in :attr:`cache`.
+
+        :return: `True` if data successfully update, `False` otherwise
+        :rtype: bool
+        """
+        if self._get_cached_data() is True:
+            return True
+        return await self.__get_data()
+
+
+class AsyncOneCallApiCurrent(OneCallApiCurrent, AsyncOneCallApi):
+    """
+    Class to handle OneCallApi response for Current with asyncio.
+
+    This Class is derived from :class:`~pocar.OneCallApiCurrent.OneCallApiCurrent` and :class:`AsyncOneCallApi`.
+    """
+
+
+class AsyncOneCallApiMinutely(OneCallApiMinutely, AsyncOneCallApi):
+    """
+    Class to handle OneCallApi response for Minutely with asyncio.
+
+    This Class is derived from :class:`~pocar.OneCallApiMinutely.OneCallApiMinutely` and :class:`AsyncOneCallApi`.
+    """
+
+
+class AsyncOneCallApiHourly(OneCallApiHourly, AsyncOneCallApi):
+    """
+    Class to handle OneCallApi response for Hourly with asyncio.
+
+    This Class is derived from :class:`~pocar.OneCallApiHourly.OneCallApiHourly` and :class:`AsyncOneCallApi`.
+    """
+
+
+class AsyncOneCallApiDaily(OneCallApiDaily, AsyncOneCallApi):
+    """
+    Class to handle OneCallApi response for Daily with asyncio.
+
+    This Class is derived from :class:`~pocar.OneCallApiDaily.OneCallApiDaily` and :class:`AsyncOneCallApi`.
+    """
+
+
+class AsyncOneCallApiAlerts(OneCallApiAlerts, AsyncOneCallApi):
+    """
+    Class to handle OneCallApi response for Alerts with asyncio.
+
+    This Class is derived from :class:`~pocar.OneCallApiAlerts.OneCallApiAlerts` and :class:`AsyncOneCallApi`.
+    """
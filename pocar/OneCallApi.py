@@ -1,10 +1,26 @@
 """This module provides a base class to handle One Call Api response from OpenWeatherMap."""
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
 
 import requests
 
+from pocar.OneCallApiColumns import OneCallApiColumns
+from pocar.OneCallApiDecoder import OneCallApiDecoder
+from pocar.OneCallApiLazyResponse import OneCallApiLazyResponse
+from pocar.OneCallApiMetrics import CACHE_LOOKUPS
+from pocar.OneCallApiMetrics import decode_measured
+from pocar.OneCallApiMetrics import note
+from pocar.OneCallApiMetrics import REQUESTS
+from pocar.OneCallApiMetrics import report_call
+from pocar.OneCallApiMetrics import start_call
+from pocar.OneCallApiSession import OneCallApiSession
+
 # Uncomment this line to suppress warning message due to:
 #    InsecureRequestWarning: Unverified HTTPS request is being made.
 #    Adding certificate verification is strongly advised.
@@ -15,6 +31,23 @@ requests.packages.urllib3.disable_warnings()
 # Set local logger to the root logger, to inherit root settings
 logger = logging.getLogger(__name__)
 
+# Set a child logger for the responses content, to enable or disable it apart from the other debug messages
+payload_logger = logging.getLogger(f"{__name__}.payload")
+
+
+class _LazyJson:  # pylint: disable=too-few-public-methods
+    """Formats a dictionary as indented JSON only when a log record is actually emitted."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        """This is the constructor method."""
+        self._data = data
+
+    def __str__(self):
+        """Returns the dictionary as indented JSON."""
+        return json.dumps(self._data, indent=2, default=dict)
+
 
 class OneCallApi:
     """
@@ -37,25 +70,126 @@ class OneCallApi:
     :ivar _timestamp: Timestamp of when One Call Api call response was received
 
     :ivar __url: The URL used to perform the One Call Api call
+
+    :ivar base_url: The One Call Api endpoint, shared by all objects unless overridden
+    :vartype base_url: str
+
+    :ivar session: The HTTP session used to perform the One Call Api call,
+        :meth:`~pocar.OneCallApiSession.OneCallApiSession.shared` is used when `None`
+    :vartype session: :class:`~pocar.OneCallApiSession.OneCallApiSession`
+
+    :ivar decoder: The JSON decoder of the One Call Api response,
+        :meth:`~pocar.OneCallApiDecoder.OneCallApiDecoder.shared` is used when `None`
+    :vartype decoder: :class:`~pocar.OneCallApiDecoder.OneCallApiDecoder`
+
+    :ivar lazy_sections: Keep the One Call Api response as the bytes received and decode each section
+        on its first access, see :class:`~pocar.OneCallApiLazyResponse.OneCallApiLazyResponse`
+    :vartype lazy_sections: bool
+
+    :ivar cache: The cache consulted before performing the One Call Api call, no cache when `None`
+    :vartype cache: :class:`~pocar.OneCallApiCache.OneCallApiCache`
+
+    :ivar snap: The grid size, in degrees, coordinates are rounded to in the One Call Api call,
+        exact coordinates when `None`, e.g. 0.01 rounds to 2 decimals,
+        the poles and the antimeridian being grid points too
+    :vartype snap: float
+
+    :ivar coalescer: The coalescer sharing concurrent identical One Call Api calls, no coalescing when `None`
+    :vartype coalescer: :class:`~pocar.OneCallApiCoalescer.OneCallApiCoalescer`
+
+    :ivar trace_access: Log a debug message on each attribute read and response field read,
+        set to `False` to skip these messages on the hot path of readers
+    :vartype trace_access: bool
+
+    :ivar numpy_series: Return the series read with `all_values=True` as numpy arrays: float64 with NaN
+        for missing values, datetime64 for data times, instead of lists with `"N/A"`; requires numpy
+    :vartype numpy_series: bool
+
+    :ivar timeout: The (connect, read) timeouts, in seconds, of the One Call Api call without :attr:`retry`
+    :vartype timeout: tuple
+
+    :ivar retry: The retry policy of the One Call Api call, with its own timeouts, a single attempt when `None`
+    :vartype retry: :class:`~pocar.OneCallApiRetry.OneCallApiRetry`
+
+    :ivar rate_limiter: The limiter each One Call Api call waits for, no limit when `None`,
+        each retry of :attr:`retry` is a call and waits for it too
+    :vartype rate_limiter: :class:`~pocar.OneCallApiRateLimiter.OneCallApiRateLimiter`
+
+    :ivar breaker: The circuit breaker failing One Call Api calls at once during OpenWeatherMap outages,
+        no breaker when `None`
+    :vartype breaker: :class:`~pocar.OneCallApiCircuitBreaker.OneCallApiCircuitBreaker`
+
+    :ivar soft_ttl: Stale-while-revalidate mode: the age, in seconds, after which reading the response
+        triggers its refresh in the background, see :meth:`_revalidate`; reads never wait for a refresh,
+        they return the response held until the new one replaces it; disabled when `None`
+    :vartype soft_ttl: float
+
+    :ivar revalidate_executor: The executor running the refreshes of :attr:`soft_ttl`,
+        a shared pool of 4 threads is used when `None`
+    :vartype revalidate_executor: :class:`concurrent.futures.Executor`
+
+    :ivar metrics: The sink of the metrics of One Call Api calls, e.g. requests by outcome, latency histograms,
+        cache hit ratio, see :class:`~pocar.OneCallApiMetrics.OneCallApiMetrics`; no measure is taken when `None`
+    :vartype metrics: :class:`~pocar.OneCallApiMetrics.OneCallApiMetrics`
+
+    :ivar response_timezone: Format the data times in the time zone of the location, given by the
+        `timezone_offset` of the response, instead of the local time zone of the host
+    :vartype response_timezone: bool
     """
 
+    base_url = "https://api.openweathermap.org/data/2.5/onecall"
+    session = None
+    decoder = None
+    lazy_sections = False
+    cache = None
+    snap = None
+    coalescer = None
+    trace_access = True
+    numpy_series = False
+    response_timezone = False
+    timeout = (3.05, 30.0)
+    retry = None
+    rate_limiter = None
+    breaker = None
+    soft_ttl = None
+    revalidate_executor = None
+    metrics = None
+
+    __executor = None
+    __executor_lock = threading.Lock()
+
     def __init__(self, lat, lon, key, exc=""):
         """This is the constructor method."""
         self.lat = lat
         self.lon = lon
         self.key = key
         self.exc = exc
+        self.__revalidated = 0.0
         self._rawdata = {}
         self._timestamp = 0
+        self._stale = False
+        self.__columns = {}
+        self.__times = (None, {})
+        self._compacted = (None, {})
+        self.__coords = (self.__snap_coord(self._lat, 90.0), self.__snap_coord(self._lon, 180.0))
         self.__url = (
-            f"https://api.openweathermap.org/data/2.5/onecall?lat={self._lat}&lon={self._lon}"
+            f"{self.base_url}?lat={self.__coords[0]}&lon={self.__coords[1]}"
             f"&exclude={self._exc}&units=metric&appid={self._key}"
         )
 
+    def __snap_coord(self, coord, bound):
+        """Returns the coordinate rounded to the grid of size :attr:`snap`, within [-bound, bound]."""
+        if self.snap is None:
+            return coord
+        snapped = min(max(round(round(coord / self.snap) * self.snap, 10), -bound), bound)
+        # The bounds are grid points too, so that a coordinate at a pole or the antimeridian stays there
+        return min((snapped, -bound, bound), key=lambda point: abs(point - coord))
+
     @property
     def lat(self):
         """The getter/setter for attribute :attr:`lat`."""
-        logger.debug("Get method for 'lat' attribute")
+        if self.trace_access:
+            logger.debug("Get method for 'lat' attribute")
         return self._lat
 
     @lat.setter
@@ -69,7 +203,8 @@ class OneCallApi:
     @property
     def lon(self):
         """The getter/setter for attribute :attr:`lon`."""
-        logger.debug("Get method for 'lon' attribute")
+        if self.trace_access:
+            logger.debug("Get method for 'lon' attribute")
         return self._lon
 
     @lon.setter
@@ -83,7 +218,8 @@ class OneCallApi:
     @property
     def key(self):
         """The getter/setter for attribute :attr:`key`."""
-        logger.debug("Get method for 'key' attribute")
+        if self.trace_access:
+            logger.debug("Get method for 'key' attribute")
         return self._key
 
     @key.setter
@@ -104,7 +240,8 @@ class OneCallApi:
     @property
     def exc(self):
         """The getter/setter for attribute :attr:`exc`."""
-        logger.debug("Get method for 'exc' attribute")
+        if self.trace_access:
+            logger.debug("Get method for 'exc' attribute")
         return self._exc
 
     @exc.setter
@@ -133,6 +270,53 @@ class OneCallApi:
             self._exc = exc
         logger.debug("Set 'exc' value to: %s", self._exc)
 
+    @property
+    def _rawdata(self):
+        """The getter/setter for the One Call Api response, triggering its refresh once older than :attr:`soft_ttl`."""
+        if self.soft_ttl is not None:
+            self.__check_revalidate()
+        return self.__rawdata
+
+    @_rawdata.setter
+    def _rawdata(self, rawdata):
+        self.__rawdata = rawdata
+
+    def __check_revalidate(self):
+        """Triggers a refresh if the response, and the last refresh triggered, are older than :attr:`soft_ttl`."""
+        now = time.time()
+        if now - max(self._timestamp, self.__revalidated) <= self.soft_ttl:
+            return
+        with OneCallApi.__executor_lock:
+            if now - max(self._timestamp, self.__revalidated) <= self.soft_ttl:
+                return
+            self.__revalidated = now
+        logger.debug("OneCallApi response older than %s s, refreshing in the background", self.soft_ttl)
+        self._revalidate()
+
+    def _revalidate(self):
+        """
+        | The _revalidate method.
+
+        | Refreshes the One Call Api response in the background, with the One Call Api call run by
+        | :attr:`revalidate_executor`. The call skips :attr:`cache`, which may still hold the response
+        | being refreshed, and stores the new one in it.
+        | The response is replaced at once when the new one is received,
+        | readers get either the previous response or the new one, never a part of both.
+        | A refresh is triggered at most once per :attr:`soft_ttl`, whether it succeeds or not.
+        """
+        executor = self.revalidate_executor
+        if executor is None:
+            with OneCallApi.__executor_lock:
+                if OneCallApi.__executor is None:
+                    OneCallApi.__executor = ThreadPoolExecutor(4, thread_name_prefix="pocar-revalidate")
+                executor = OneCallApi.__executor
+        executor.submit(self.__get_data)
+
+    @property
+    def url(self):
+        """The getter for attribute :attr:`__url`."""
+        return self.__url
+
     def config(self):
         """
         | The config method.
@@ -164,65 +348,397 @@ class OneCallApi:
         logger.debug("   API url        : %s", self.__url)
         return conf_dict
 
+    def cache_key(self):
+        """
+        | The cache_key method.
+
+        | Returns the key identifying the One Call Api response of this object in a cache.
+        | The key is a tuple: (lat, lon, excluded sections sorted, units),
+        | with the coordinates rounded to the grid of :attr:`snap`.
+
+        :return: Cache key
+        :rtype: tuple
+        """
+        return (self.__coords[0], self.__coords[1], tuple(sorted(filter(None, self._exc.split(",")))), "metric")
+
     def raw_data(self):
         """
         | The raw_data method.
 
         | Returns the variable :attr:`~pocar.OneCallAPi.OneCallAPi._raw_data`.
         | This variable contains the One Call Api response raw data as a dictionary
+        | The sections replaced by their records, see :meth:`_compact`, are returned rebuilt from the records,
+        | as plain dictionaries, in a copy of the response built on each call.
 
         :return: raw data as a dictionary
         :rtype: dict
         """
-        return self._rawdata
+        rawdata, sections = self._compacted
+        if rawdata is not self._rawdata:
+            return self._rawdata
+        for section, value in sections.items():
+            value = [record.as_dict() for record in value] if isinstance(value, list) else value.as_dict()
+            if isinstance(rawdata, OneCallApiLazyResponse):
+                rawdata = rawdata.replace(section, value)
+            else:
+                rawdata = dict(rawdata, **{section: value})
+        return rawdata
 
     def __get_data(self):
         """
         | The __get_data method.
 
-        | This method makes an HTTP request to OpenWeatherMap.
+        | This method makes an HTTP request to OpenWeatherMap, through a pooled
+        | :class:`~pocar.OneCallApiSession.OneCallApiSession` connection.
         | The URL for the call is :attr:`~pocar.OneCallAPi.OneCallAPi.__url`
+        | With a :attr:`coalescer`, concurrent calls for the same URL share a single request.
         | The retrieved data is stored in :attr:`~pocar.OneCallAPi.OneCallAPi._rawdata`
+        | While :attr:`breaker` is open, no request is made, and the last response is kept as stale.
 
         :return: `True` if data successfully retrieved, `False` otherwise
         :rtype: bool
         """
-        is_data_updated = False
-        req = requests.get(self.__url, verify=False)
+        ticket = self._allow_call()
+        if ticket is None:
+            return False
+        recorded = False
         try:
-            req.raise_for_status()
+            rawdata, error = self.__fetch()
+            if error is None:
+                self._store_data(rawdata)
+            self._record_call(error, ticket)
+            recorded = True
+            return error is None
+        finally:
+            if not recorded:
+                self._release_call(ticket)
+
+    def __fetch(self):
+        """
+        | The __fetch method.
+
+        | Makes the One Call Api call, through :attr:`coalescer` if set.
+        | Request and decoding errors are logged and returned, other errors are raised.
+
+        :return: The One Call Api response and `None`, or `None` and the error raised by the call
+        :rtype: tuple
+        """
+        try:
+            if self.coalescer is not None:
+                return self.coalescer.run(self.__url, self.__request), None
+            return self.__request(), None
         except requests.exceptions.HTTPError as errh:
             logger.warning(errh)
-            # raise
+            return None, errh
         except requests.exceptions.ConnectionError as errc:
             logger.warning(errc)
-            # raise
-        except requests.exceptions.TimeoutError as errt:
+            return None, errc
+        except requests.exceptions.Timeout as errt:
             logger.warning(errt)
-            # raise
-        except requests.exceptions.RequestsException as err:
+            return None, errt
+        except requests.exceptions.RequestException as err:
             logger.warning(err)
-            # raise
+            return None, err
+        except ValueError as errd:
+            logger.warning("Invalid JSON in One Call Api response: %s", errd)
+            return None, errd
+
+    def __request(self):
+        """
+        | The __request method.
+
+        | Makes the HTTP request to :attr:`~pocar.OneCallAPi.OneCallAPi.__url`, bounded by :attr:`timeout`,
+        | or retried on transient errors as set by :attr:`retry`, each attempt waiting for :attr:`rate_limiter`.
+
+        :return: The One Call Api response, as a dictionary
+        :rtype: dict
+
+        :raises requests.exceptions.RequestException: on HTTP error status or connection failure
+        :raises ValueError: if the response body is not valid JSON
+        """
+        session = self.session if self.session is not None else OneCallApiSession.shared()
+
+        def attempt(timeout):
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            req = session.get(self.__url, verify=False, timeout=timeout)
+            if self.metrics is not None:
+                note("status", req.status_code)
+            req.raise_for_status()
+            return req
+
+        req = attempt(self.timeout) if self.retry is None else self.retry.call(attempt)
+        return self._decode(req.content)
+
+    def _decode(self, content):
+        """
+        | The _decode method.
+
+        | Decodes the body of a One Call Api response with :attr:`decoder`.
+        | With :attr:`lazy_sections`, only the head of the response is decoded, the sections are decoded
+        | on their first access.
+        | With :attr:`metrics`, the size of the body and the decoding time are measured.
+
+        :param content: The response body
+        :type content: bytes
+
+        :return: The One Call Api response, as a dictionary or a mapping with :attr:`lazy_sections`
+        :rtype: dict or :class:`~pocar.OneCallApiLazyResponse.OneCallApiLazyResponse`
+
+        :raises ValueError: if the body is not valid JSON
+        """
+        if self.metrics is not None:
+            return decode_measured(self.__decode, content)
+        return self.__decode(content)
+
+    def __decode(self, content):
+        """Decodes the body of a One Call Api response, see :meth:`_decode`."""
+        decoder = self.decoder if self.decoder is not None else OneCallApiDecoder.shared()
+        if self.lazy_sections:
+            return OneCallApiLazyResponse(content, decoder.decode)
+        return decoder.decode(content)
+
+    def _store_data(self, rawdata):
+        """
+        | The _store_data method.
+
+        | Stores a One Call Api response in :attr:`~pocar.OneCallAPi.OneCallAPi._rawdata`
+        | and the time it was received in :attr:`~pocar.OneCallAPi.OneCallAPi._timestamp`.
+        | The response is logged, as indented JSON, by the logger `pocar.OneCallApi.payload` at DEBUG level,
+        | it is serialized only when a handler emits the record.
+
+        :param rawdata: The One Call Api response, as a dictionary
+        :type rawdata: dict
+        """
+        self._rawdata = rawdata
+        if payload_logger.isEnabledFor(logging.DEBUG):
+            payload_logger.debug("OneCallApi response, as json raw data:\n%s", _LazyJson(rawdata))
+        self._timestamp = time.time()
+        logger.debug("OneCallApi response timestamp: %s", self._timestamp)
+        if self.cache is not None:
+            self.cache.put(self.cache_key(), self._rawdata, self._timestamp)
+
+    def _allow_call(self):
+        """
+        | The _allow_call method.
+
+        | Returns the ticket of the One Call Api call if it can be made, as told by :attr:`breaker`,
+        | see :meth:`~pocar.OneCallApiCircuitBreaker.OneCallApiCircuitBreaker.acquire`.
+        | A call made must end with :meth:`_record_call`, or :meth:`_release_call` if it did not complete.
+        | When it can not, the response held is flagged as stale, see :meth:`stale`.
+        | With :attr:`metrics`, the measure of the call starts when it can be made, see :meth:`_record_call`.
+
+        :return: The ticket of the call, 0 without :attr:`breaker`, `None` if the call can not be made
+        :rtype: int
+        """
+        ticket = self.breaker.acquire() if self.breaker is not None else 0
+        if ticket is not None:
+            if self.metrics is not None:
+                start_call()
+            return ticket
+        logger.warning("Circuit breaker open, One Call Api call not made, serving the last response")
+        self._stale = True
+        if self.metrics is not None:
+            self.metrics.inc(REQUESTS, outcome="rejected")
+        return None
+
+    def _record_call(self, error, ticket):
+        """
+        | The _record_call method.
+
+        | Reports the outcome of a One Call Api call to :attr:`breaker` and to :attr:`metrics`,
+        | and flags the response held as stale when the call failed, see :meth:`stale`.
+
+        :param error: The error raised by the call, `None` if it succeeded
+        :type error: Exception
+
+        :param ticket: The ticket of the call, returned by :meth:`_allow_call`
+        :type ticket: int
+        """
+        self._stale = error is not None
+        if self.breaker is not None:
+            self.breaker.record(error, ticket)
+        if self.metrics is not None:
+            report_call(self.metrics, error)
+
+    def _release_call(self, ticket):
+        """
+        | The _release_call method.
+
+        | Ends a One Call Api call allowed by :meth:`_allow_call` which did not complete, e.g. its task
+        | was cancelled: its :attr:`breaker` probe slot is released, no outcome is reported.
+
+        :param ticket: The ticket of the call, returned by :meth:`_allow_call`
+        :type ticket: int
+        """
+        if self.breaker is not None:
+            self.breaker.release(ticket)
+
+    def stale(self):
+        """
+        | The stale method.
+
+        | Returns whether the last update failed, or was not attempted because :attr:`breaker` is open.
+        | The response held is then the last one received, if any: see :meth:`timestamp` for its age.
+
+        :return: `True` if the response held is stale, `False` otherwise
+        :rtype: bool
+        """
+        return self._stale
+
+    def _get_cached_data(self):
+        """
+        | The _get_cached_data method.
+
+        | Reads the One Call Api response from :attr:`cache` into
+        | :attr:`~pocar.OneCallAPi.OneCallAPi._rawdata` and :attr:`~pocar.OneCallAPi.OneCallAPi._timestamp`,
+        | without any network request. A response read as bytes, from a disk cache, is decoded by :meth:`_decode`.
+
+        :return: `True` on cache hit, `False` otherwise
+        :rtype: bool
+        """
+        if self.cache is None:
+            return False
+        cached = self.cache.get(self.cache_key(), self._decode)
+        if self.metrics is not None:
+            self.metrics.inc(CACHE_LOOKUPS, result="miss" if cached is None else "hit")
+        if cached is None:
+            return False
+        self._rawdata, self._timestamp = cached
+        self._stale = False
+        return True
+
+    def _columns(self, section, fields):
+        """
+        | The _columns method.
+
+        | Returns the numeric fields of a list section of the response as columns.
+        | The columns are built once per response, on first use, and rebuilt when the response changes.
+        | When the response holds no such section, the columns hold no entry.
+
+        :param section: The list section, e.g. "hourly"
+        :type section: str
+
+        :param fields: The fields to hold, as {field: typecode}
+        :type fields: dict
+
+        :return: The columns of the section
+        :rtype: :class:`~pocar.OneCallApiColumns.OneCallApiColumns`
+        """
+        entries = self._rawdata.get(section, ())
+        source, columns = self.__columns.get(section, (None, None))
+        if columns is None or source is not entries:
+            columns = OneCallApiColumns(entries, fields)
+            self.__columns[section] = (entries, columns)
+        return columns
+
+    def __formatted_times(self):
+        """Returns the formatted times of the response, emptied when the response changes."""
+        source, times = self.__times
+        if source is not self._rawdata:
+            times = {}
+            self.__times = (self._rawdata, times)
+        return times
+
+    def _format_time(self, unix_time):
+        """
+        | The _format_time method.
+
+        | Returns a Unix time formatted as `"%Y-%m-%d %H:%M:%S"`, in the local time zone of the host,
+        | or in the time zone of the location with :attr:`response_timezone`.
+        | Formatted times are kept until the response changes, a time read again is a dictionary lookup.
+
+        :param unix_time: The Unix time, in seconds
+        :type unix_time: int
+
+        :return: The formatted time
+        :rtype: str
+        """
+        times = self.__formatted_times()
+        key = (unix_time, self.response_timezone)
+        value = times.get(key)
+        if value is None:
+            if self.response_timezone:
+                tzinfo = timezone(timedelta(seconds=self._rawdata.get("timezone_offset", 0)))
+                value = f"{datetime.fromtimestamp(unix_time, tzinfo):%Y-%m-%d %H:%M:%S}"
+            else:
+                value = f"{datetime.fromtimestamp(unix_time):%Y-%m-%d %H:%M:%S}"
+            times[key] = value
+        return value
+
+    def _format_times(self, columns, field, size):
+        """
+        | The _format_times method.
+
+        | Returns the values of a column of Unix times formatted by :meth:`_format_time`, `"N/A"` where missing.
+        | The formatted list is kept until the response changes, each call returns a copy of it.
+
+        :param columns: The columns holding the field
+        :type columns: :class:`~pocar.OneCallApiColumns.OneCallApiColumns`
+
+        :param field: The field holding Unix times
+        :type field: str
+
+        :param size: The number of values to return
+        :type size: int
+
+        :return: The formatted times
+        :rtype: list
+        """
+        times = self.__formatted_times()
+        key = (columns, field, size, self.response_timezone)
+        values = times.get(key)
+        if values is None:
+            values = [value if value == "N/A" else self._format_time(value) for value in columns.values(field, size)]
+            times[key] = values
+        return list(values)
+
+    def _compact(self, section, compacted, fields=None):
+        """
+        | The _compact method.
+
+        | Replaces a section of the response by a compact representation of it, e.g. records.
+        | The response is copied, not modified, as it can be shared with other objects and caches,
+        | a lazy response is copied without decoding its other sections.
+        | With `fields`, the columns of the section are built before and kept, see :meth:`_columns`.
+        | The compact representation, a record or a list of records, must rebuild the section with `as_dict`,
+        | see :meth:`raw_data`.
+
+        :param section: The section, e.g. "daily"
+        :type section: str
+
+        :param compacted: The compact representation of the section
+        :type compacted: object
+
+        :param fields: The fields of the section columns, as {field: typecode}
+        :type fields: dict, optional
+        """
+        columns = self._columns(section, fields) if fields is not None else None
+        source, sections = self._compacted
+        sections = dict(sections) if source is self._rawdata else {}
+        if isinstance(self._rawdata, OneCallApiLazyResponse):
+            self._rawdata = self._rawdata.replace(section, compacted)
         else:
-            self._rawdata = req.json()
-            logger.debug(
-                "OneCallApi response, as json raw data:\n%s",
-                json.dumps(self._rawdata, indent=2),
-            )
-            self._timestamp = time.time()
-            logger.debug("OneCallApi response timestamp: %s", self._timestamp)
-            is_data_updated = True
-        return is_data_updated
+            rawdata = dict(self._rawdata)
+            rawdata[section] = compacted
+            self._rawdata = rawdata
+        sections[section] = compacted
+        self._compacted = (self._rawdata, sections)
+        if columns is not None:
+            self.__columns[section] = (compacted, columns)
 
     def update_data(self):
         """
         | The update_data method.
 
-        This method triggers a call to :meth:`~pocar.OneCallAPi.OneCallAPi.__get_data`.
+        This method triggers a call to :meth:`~pocar.OneCallAPi.OneCallAPi.__get_data`,
+        unless a response that has not expired is found in :attr:`cache`.
 
         :return: `True` if data successfully update, `False` otherwise
         :rtype: bool
         """
+        if self._get_cached_data() is True:
+            return True
         return self.__get_data()
 
     def timezone(self):
@@ -1,6 +1,5 @@
 """This module provides a class to handle One Call Api response for Alerts from OpenWeatherMap."""
 import logging
-from datetime import datetime
 
 import requests
 
@@ -51,7 +50,8 @@ class OneCallApiAlerts(OneCallApi):
         value = "N/A"
         if self.__is_data_available(field) is True:
             value = self._rawdata["alerts"][0][field]
-        logger.debug("Value for %s is: %s", field, value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_date_field(self, field, metrics=0):
@@ -59,11 +59,11 @@ class OneCallApiAlerts(OneCallApi):
         value = "N/A"
         if self.__is_data_available(field) is True:
             if metrics == 0:
-                alert_dt = datetime.fromtimestamp(self._rawdata["alerts"][0][field])
-                value = f"{alert_dt:%Y-%m-%d %H:%M:%S}"
+                value = self._format_time(self._rawdata["alerts"][0][field])
             else:
                 value = self._rawdata["alerts"][0][field]
-        logger.debug("Value for %s is: %s", field, value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def raw_data_alerts(self):
@@ -0,0 +1,335 @@
+"""This module provides sessions recording One Call Api responses to an archive, and replaying them offline."""
+import itertools
+import json
+import logging
+import mmap
+import struct
+import threading
+import zipfile
+import zlib
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, installed with extra "async"
+    aiohttp = None
+
+from pocar.OneCallApiSession import OneCallApiSession
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The fixed part of a zip local file header, followed by the file name and the extra field
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def request_key(url):
+    """
+    | The request_key function.
+
+    | Returns the key of a One Call Api request in an archive: the path and the sorted query of the URL,
+    | without the `appid` parameter, so that no API key is written to an archive,
+    | and an archive recorded against a server can be replayed for any server.
+
+    :param url: The URL of the request
+    :type url: str
+
+    :return: The key of the request, e.g. `"data/2.5/onecall?exclude=&lat=45.1&lon=1.2&units=metric"`
+    :rtype: str
+    """
+    parts = urlsplit(url)
+    query = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True) if name != "appid")
+    return f"{parts.path.lstrip('/')}?{urlencode(query)}"
+
+
+class _ArchiveResponse:
+    """Holds a replayed HTTP response: status code, body and URL, as read by One Call Api objects."""
+
+    __slots__ = ("status_code", "content", "url", "headers")
+
+    def __init__(self, status_code, content, url):
+        """This is the constructor method."""
+        self.status_code = status_code
+        self.content = content
+        self.url = url
+        self.headers = {"Content-Type": "application/json; charset=utf-8"}
+
+    def raise_for_status(self):
+        """Raises `requests.exceptions.HTTPError` for an error status, as `requests.Response` does."""
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error (replayed) for url: {self.url}", response=self
+            )
+
+    def json(self):
+        """Returns the body decoded."""
+        return json.loads(self.content)
+
+
+class OneCallApiRecordSession:
+    """
+    Class to record the One Call Api responses received through a session into a zip archive.
+
+    | It is used as :attr:`~pocar.OneCallApi.OneCallApi.session`: each request is made by the wrapped session,
+    | and its response body is written to the archive, keyed by :func:`request_key`, with its status code.
+    | The first successful (2xx) response of each request is recorded, the following ones are only returned.
+    | An error response is recorded only if no successful response of the request follows before
+    | :meth:`close`, so that a request retried after an error replays its success.
+    | The archive is compressed by default; stored archives (`compression=zipfile.ZIP_STORED`)
+    | are larger, and replayed without decompression, see :class:`OneCallApiReplaySession`.
+    | Responses are appended to an existing archive, the responses it holds are kept as they are.
+
+    :param path: The archive file
+    :type path: str
+
+    :param session: The session making the requests, the shared session if `None`
+    :type session: :class:`~pocar.OneCallApiSession.OneCallApiSession`, optional
+
+    :param compression: The zip compression method
+    :type compression: int, optional
+    """
+
+    def __init__(self, path, session=None, compression=zipfile.ZIP_DEFLATED):
+        """This is the constructor method."""
+        self._session = session
+        self._lock = threading.Lock()
+        self._zip = zipfile.ZipFile(path, "a", compression=compression)  # pylint: disable=consider-using-with
+        self._keys = set(self._zip.namelist())
+        self._errors = {}
+        self._recorded = 0
+
+    def get(self, url, **kwargs):
+        """
+        | The get method.
+
+        | Makes an HTTP GET request with the wrapped session, and records its response.
+
+        :param url: The URL to request
+        :type url: str
+
+        :return: The HTTP response
+        :rtype: requests.Response
+        """
+        session = self._session if self._session is not None else OneCallApiSession.shared()
+        resp = session.get(url, **kwargs)
+        key = request_key(url)
+        with self._lock:
+            if key not in self._keys and self._zip.fp is not None:
+                if 200 <= resp.status_code < 300:
+                    self._errors.pop(key, None)
+                    self.__write(key, resp.status_code, resp.content)
+                else:
+                    self._errors.setdefault(key, (resp.status_code, resp.content))
+        return resp
+
+    def __write(self, key, status, content):
+        """Writes a response to the archive, the lock being held."""
+        info = zipfile.ZipInfo(key)
+        info.compress_type = self._zip.compression
+        info.comment = str(status).encode()
+        self._zip.writestr(info, content)
+        self._keys.add(key)
+        self._recorded += 1
+        logger.debug("Recorded %s bytes for %s", len(content), key)
+
+    def recorded(self):
+        """
+        | The recorded method.
+
+        :return: The number of responses recorded by this session, error responses counted on :meth:`close`
+        :rtype: int
+        """
+        return self._recorded
+
+    def close(self):
+        """
+        | The close method.
+
+        | Writes the error responses of the requests which never succeeded, the archive directory,
+        | and closes the archive.
+        """
+        with self._lock:
+            if self._zip.fp is not None:
+                for key, (status, content) in self._errors.items():
+                    self.__write(key, status, content)
+            self._errors.clear()
+            self._zip.close()
+
+    def __enter__(self):
+        """Returns the session when entering a with block."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes the archive when leaving a with block."""
+        self.close()
+
+
+class OneCallApiReplaySession:
+    """
+    Class to replay the One Call Api responses of an archive, without network.
+
+    | It is used as :attr:`~pocar.OneCallApi.OneCallApi.session` or as
+    | :attr:`~pocar.AsyncOneCallApi.AsyncOneCallApi.session`: each request is answered with the response
+    | recorded for its key, see :func:`request_key`, with the recorded status code.
+    | The archive is mapped in memory: the body of a stored entry is copied from the mapping,
+    | the body of a compressed entry is decompressed, on its first request only; the following requests
+    | of the same key return the same bytes object.
+    | A request missing from the archive raises `requests.exceptions.ConnectionError` when `strict`,
+    | otherwise it is answered with the recorded responses in turn, e.g. to load test many locations
+    | with the responses of a few.
+
+    :param path: The archive file, written by :class:`OneCallApiRecordSession`
+    :type path: str
+
+    :param strict: Fail the requests missing from the archive
+    :type strict: bool, optional
+    """
+
+    def __init__(self, path, strict=True):
+        """This is the constructor method."""
+        self._strict = strict
+        self._lock = threading.Lock()
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        with zipfile.ZipFile(path) as archive:
+            self._index = {info.filename: self.__locate(info) for info in archive.infolist()}
+        if not self._index:
+            raise ValueError(f"The archive holds no response: {path}")
+        self._bodies = {}
+        self._cycle = itertools.cycle(list(self._index))
+        self._stats = {"hits": 0, "misses": 0}
+        logger.debug("Replaying %s responses from %s", len(self._index), path)
+
+    def __locate(self, info):
+        """Returns the (start, end, compression, status code) of an entry in the mapping."""
+        header = _LOCAL_HEADER.unpack_from(self._mmap, info.header_offset)
+        start = info.header_offset + _LOCAL_HEADER.size + header[-2] + header[-1]
+        status = int(info.comment or b"200")
+        return start, start + info.compress_size, info.compress_type, status
+
+    def keys(self):
+        """
+        | The keys method.
+
+        :return: The keys of the requests recorded in the archive
+        :rtype: list of str
+        """
+        return list(self._index)
+
+    def __body(self, key):
+        """Returns the body of an entry, copied or decompressed on first use, then the same object."""
+        body = self._bodies.get(key)
+        if body is None:
+            start, end, compression, _ = self._index[key]
+            if compression == zipfile.ZIP_STORED:
+                body = self._mmap[start:end]
+            elif compression == zipfile.ZIP_DEFLATED:
+                body = zlib.decompress(self._mmap[start:end], -zlib.MAX_WBITS)
+            else:
+                raise ValueError(f"The compression of the archive entry is not supported: {key}")
+            self._bodies[key] = body
+        return body
+
+    def response(self, url):
+        """
+        | The response method.
+
+        | Returns the recorded response of a request.
+
+        :param url: The URL of the request
+        :type url: str
+
+        :return: The recorded response
+        :rtype: object with `status_code`, `content`, `raise_for_status()`, as `requests.Response`
+
+        :raises requests.exceptions.ConnectionError: if the request is missing from the archive, when `strict`
+        """
+        key = request_key(url)
+        with self._lock:
+            if key in self._index:
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+                if self._strict:
+                    raise requests.exceptions.ConnectionError(f"No recorded response for {key}")
+                key = next(self._cycle)
+            return _ArchiveResponse(self._index[key][3], self.__body(key), url)
+
+    def get(self, url, **kwargs):  # pylint: disable=unused-argument
+        """
+        | The get method.
+
+        | Answers an HTTP GET request with its recorded response, the request options are ignored.
+
+        :param url: The URL to request
+        :type url: str
+
+        :return: The recorded response
+        :rtype: object with `status_code`, `content`, `raise_for_status()`, as `requests.Response`
+        """
+        return self.response(url)
+
+    async def get_json(self, url, decode=None, timeout=None):  # pylint: disable=unused-argument
+        """
+        | The get_json coroutine.
+
+        | Answers a request of :class:`~pocar.AsyncOneCallApi.AsyncOneCallApi` with its recorded response,
+        | as :meth:`~pocar.AsyncOneCallApi.AsyncOneCallApiSession.get_json` does.
+
+        :param url: The URL to request
+        :type url: str
+
+        :param decode: The function decoding the response body, :func:`json.loads` if `None`
+        :type decode: callable, optional
+
+        :param timeout: Ignored, the response is not received from the network
+        :type timeout: tuple, optional
+
+        :return: The decoded JSON response
+        :rtype: dict
+
+        :raises aiohttp.ClientError: if the request is missing from the archive, when `strict`,
+            or the recorded status code is an error, as the asyncio session does
+        """
+        try:
+            resp = self.response(url)
+        except requests.exceptions.ConnectionError as err:
+            raise aiohttp.ClientConnectionError(str(err)) from err
+        if resp.status_code >= 400:
+            raise aiohttp.ClientResponseError(
+                None, (), status=resp.status_code, message="replayed error status", headers=resp.headers
+            )
+        return (decode or json.loads)(resp.content)
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the replay counters, as a dictionary: hits (requests found in the archive) and misses.
+
+        :return: Replay counters
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self):
+        """
+        | The close method.
+
+        | Unmaps the archive.
+        """
+        self._bodies.clear()
+        self._mmap.close()
+
+    def __enter__(self):
+        """Returns the session when entering a with block."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Unmaps the archive when leaving a with block."""
+        self.close()
@@ -0,0 +1,111 @@
+"""This module provides a class to update many One Call Api objects concurrently."""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from pocar.OneCallApi import OneCallApi
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+class OneCallApiBatch:
+    """
+    Class to update the One Call Api response of many locations concurrently.
+
+    | Locations are given either as One Call Api objects, or as (lat, lon) coordinates from which
+    | objects of class `cls` are built with `key` and, when given, `exc`.
+    | The blocking objects share the pooled :class:`~pocar.OneCallApiSession.OneCallApiSession`,
+    | size its pool to at least `max_workers` connections to have every worker reuse a connection.
+
+    :param locations: The locations to update, as One Call Api objects or (lat, lon) tuples
+    :type locations: list
+
+    :param key: The OpenWeatherMap One Call Api key value, required for (lat, lon) tuples
+    :type key: hex, 128-bit hash key, optional
+
+    :param cls: The One Call Api class used to build objects from (lat, lon) tuples
+    :type cls: class, optional, derived from :class:`~pocar.OneCallAPi.OneCallAPi`
+
+    :param exc: The excluded fields in One Call Api response, the `cls` default if `None`
+    :type exc: comma separated str, optional
+
+    :param max_workers: Maximum number of updates in flight at the same time
+    :type max_workers: int, optional, greater than 0
+    """
+
+    def __init__(self, locations, key=None, cls=OneCallApi, exc=None, max_workers=10):
+        """This is the constructor method."""
+        if max_workers < 1:
+            raise ValueError("The 'max_workers' argument must be greater than 0")
+        self._max_workers = max_workers
+        self._objects = []
+        for location in locations:
+            if isinstance(location, OneCallApi):
+                self._objects.append(location)
+            elif key is None:
+                raise ValueError("The 'key' argument is required to build objects from (lat, lon) coordinates")
+            elif exc is None:
+                self._objects.append(cls(location[0], location[1], key))
+            else:
+                self._objects.append(cls(location[0], location[1], key, exc))
+        logger.debug("Batch of %s locations, max_workers=%s", len(self._objects), max_workers)
+
+    def objects(self):
+        """
+        | The objects method.
+
+        | Returns the One Call Api objects of the batch, in the order locations were given.
+
+        :return: One Call Api objects
+        :rtype: list
+        """
+        return self._objects
+
+    @staticmethod
+    def __update_one(oca):
+        """Updates one object, reporting an unexpected error as a failed update."""
+        try:
+            return oca.update_data()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Update failed for lat=%s, lon=%s: %r", oca.lat, oca.lon, err)
+            return False
+
+    def update_data(self):
+        """
+        | The update_data method.
+
+        | Updates all objects of the batch with a pool of `max_workers` threads.
+        | Each object stores its response in its own `_rawdata` and `_timestamp`.
+
+        :return: `True` for each object successfully updated, `False` otherwise, in the order of :meth:`objects`
+        :rtype: list of bool
+        """
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return list(executor.map(self.__update_one, self._objects))
+
+    async def async_update_data(self):
+        """
+        | The async_update_data coroutine.
+
+        | Updates all objects of the batch with at most `max_workers` updates in flight.
+        | Objects with a coroutine `update_data` (see :mod:`~pocar.AsyncOneCallApi`) are awaited,
+        | the others are run in the default executor of the event loop.
+
+        :return: `True` for each object successfully updated, `False` otherwise, in the order of :meth:`objects`
+        :rtype: list of bool
+        """
+        semaphore = asyncio.Semaphore(self._max_workers)
+        loop = asyncio.get_running_loop()
+
+        async def update_one(oca):
+            async with semaphore:
+                if asyncio.iscoroutinefunction(oca.update_data):
+                    try:
+                        return await oca.update_data()
+                    except Exception as err:  # pylint: disable=broad-except
+                        logger.warning("Update failed for lat=%s, lon=%s: %r", oca.lat, oca.lon, err)
+                        return False
+                return await loop.run_in_executor(None, self.__update_one, oca)
+
+        return list(await asyncio.gather(*(update_one(oca) for oca in self._objects)))
@@ -0,0 +1,184 @@
+"""This module provides an in-process cache of One Call Api responses."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The sections of One Call Api response
+SECTIONS = ("current", "minutely", "hourly", "daily", "alerts")
+
+# Default time to live, in seconds, of each section of One Call Api response
+DEFAULT_TTL = {"current": 600, "minutely": 60, "hourly": 1800, "daily": 3600, "alerts": 600}
+
+
+def section_ttl(key, ttl):
+    """
+    | The section_ttl function.
+
+    | Returns the time to live of a cached response: the shortest time to live of the sections it holds.
+
+    :param key: The cache key, as returned by :meth:`~pocar.OneCallAPi.OneCallAPi.cache_key`
+    :type key: tuple
+
+    :param ttl: The time to live, in seconds, of each section
+    :type ttl: dict
+
+    :return: Time to live, in seconds
+    :rtype: float
+    """
+    included = [section for section in SECTIONS if section not in key[2]] or SECTIONS
+    return min(ttl[section] for section in included)
+
+
+class OneCallApiCache:
+    """
+    Class to cache One Call Api responses in memory, with a time to live and LRU eviction.
+
+    | Responses are keyed by :meth:`~pocar.OneCallAPi.OneCallAPi.cache_key`: the coordinates,
+    | the excluded sections and the units of the request.
+    | A response expires after the time to live of the shortest-lived section it holds.
+    | When the cache holds `maxsize` responses, the least recently used one is evicted.
+    | A cached response is shared, not copied, between the objects reading it.
+    | With a `backend`, such as :class:`~pocar.OneCallApiDiskCache.OneCallApiDiskCache`, responses are also
+    | written to the backend, and a memory miss is looked up in the backend before reporting a miss.
+
+    :param maxsize: Maximum number of responses held
+    :type maxsize: int, optional, greater than 0
+
+    :param ttl: Time to live, in seconds, of each section, overriding :data:`DEFAULT_TTL`
+    :type ttl: dict, optional
+
+    :param backend: A second level cache, with the same methods `get` and `put`
+    :type backend: object, optional
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, backend=None):
+        """This is the constructor method."""
+        if maxsize < 1:
+            raise ValueError("The 'maxsize' argument must be greater than 0")
+        self._maxsize = maxsize
+        self._ttl = dict(DEFAULT_TTL)
+        if ttl is not None:
+            for section in ttl:
+                if section not in SECTIONS:
+                    raise ValueError(f"The 'ttl' argument contains an invalid section: {section}")
+            self._ttl.update(ttl)
+        self._backend = backend
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def ttl(self, key):
+        """
+        | The ttl method.
+
+        :param key: The cache key
+        :type key: tuple
+
+        :return: Time to live, in seconds, of the response for the given key
+        :rtype: float
+        """
+        return section_ttl(key, self._ttl)
+
+    def get(self, key, decode=None):
+        """
+        | The get method.
+
+        | Returns the cached response for the given key, if it has not expired.
+
+        :param key: The cache key
+        :type key: tuple
+
+        :param decode: Function decoding a response read from the backend, passed to the backend `get`
+        :type decode: callable, optional
+
+        :return: The response and the timestamp it was received at, `None` on cache miss
+        :rtype: tuple (dict, float)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= time.time():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if entry is None:
+            return self.__get_backend(key, decode)
+        logger.debug("Cache hit for %s", key)
+        return entry[0], entry[1]
+
+    def __get_backend(self, key, decode):
+        """Returns the response for the given key from the backend, keeping it in memory, `None` on miss."""
+        if self._backend is None:
+            return None
+        cached = self._backend.get(key, decode)
+        if cached is not None:
+            self.__put_memory(key, cached[0], cached[1])
+        return cached
+
+    def put(self, key, rawdata, timestamp):
+        """
+        | The put method.
+
+        | Stores a response, evicting the least recently used one when the cache is full.
+
+        :param key: The cache key
+        :type key: tuple
+
+        :param rawdata: The One Call Api response
+        :type rawdata: dict
+
+        :param timestamp: Unix time the response was received at
+        :type timestamp: float
+        """
+        self.__put_memory(key, rawdata, timestamp)
+        if self._backend is not None:
+            self._backend.put(key, rawdata, timestamp)
+
+    def __put_memory(self, key, rawdata, timestamp):
+        """Stores a response in memory, evicting the least recently used one when the cache is full."""
+        expires = timestamp + self.ttl(key)
+        with self._lock:
+            self._entries[key] = (rawdata, timestamp, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        """
+        | The clear method.
+
+        | Removes all responses, the counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the in-memory cache counters, as a dictionary: hits, misses, evictions (LRU),
+        | expirations (time to live) and size (responses held). The backend has counters of its own.
+
+        :return: Cache counters
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,208 @@
+"""This module provides a circuit breaker failing One Call Api calls fast during OpenWeatherMap outages."""
+import logging
+import threading
+import time
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The states of the circuit breaker
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class OneCallApiCircuitBreaker:
+    """
+    Class to stop calling One Call Api while OpenWeatherMap is failing.
+
+    | The breaker is closed while calls succeed: every call is made.
+    | After `failures` consecutive failed calls, it opens: calls are not made, they fail at once,
+    | and the objects keep serving their last response, flagged as stale,
+    | see :meth:`~pocar.OneCallApi.OneCallApi.stale`.
+    | After `cooldown` seconds, it is half-open: `probes` calls are made to test OpenWeatherMap,
+    | the other calls still fail at once. The first probe succeeding closes the breaker,
+    | a probe failing opens it for another cooldown.
+    | A call is tagged with the state it started in, see :meth:`acquire`: the outcome of a call ending
+    | after the breaker changed state, e.g. a call started before the breaker opened and failing while
+    | it is half-open, is ignored, only the probes decide whether a half-open breaker closes.
+    | A failure is an outage of OpenWeatherMap: a connection error, a timeout, an invalid response body,
+    | a 429 or a 5xx response. Other errors, e.g. 401 for an invalid key, show OpenWeatherMap is up.
+    | The breaker set to :attr:`~pocar.OneCallApi.OneCallApi.breaker` is shared by all objects and threads.
+
+    :param failures: The number of consecutive failures opening the breaker
+    :type failures: int, optional, greater than 0
+
+    :param cooldown: Time, in seconds, the breaker stays open before testing OpenWeatherMap again
+    :type cooldown: float, optional
+
+    :param probes: The number of calls made at once while half-open
+    :type probes: int, optional, greater than 0
+    """
+
+    def __init__(self, failures=5, cooldown=30.0, probes=1):
+        """This is the constructor method."""
+        if failures < 1:
+            raise ValueError("The 'failures' argument must be greater than 0")
+        if cooldown < 0:
+            raise ValueError("The 'cooldown' argument must be greater or equal to 0")
+        if probes < 1:
+            raise ValueError("The 'probes' argument must be greater than 0")
+        self._failures = failures
+        self._cooldown = cooldown
+        self._probes = probes
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._count = 0
+        self._opened_at = 0.0
+        self._in_flight = 0
+        self._generation = 0
+        self._stats = {"opened": 0, "rejected": 0}
+
+    def config(self):
+        """
+        | The config method.
+
+        | Returns a dictionary containing the configuration of the breaker.
+
+        :return: Configuration of the breaker
+        :rtype: dict
+        """
+        return {"failures": self._failures, "cooldown": self._cooldown, "probes": self._probes}
+
+    def state(self):
+        """
+        | The state method.
+
+        :return: The state of the breaker: :data:`CLOSED`, :data:`OPEN` or :data:`HALF_OPEN`
+        :rtype: str
+        """
+        with self._lock:
+            self.__cool_down()
+            return self._state
+
+    def __cool_down(self):
+        """Moves the breaker from open to half-open once the cooldown is over, the lock being held."""
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self._cooldown:
+            self.__move(HALF_OPEN)
+            self._in_flight = 0
+            logger.info("Circuit breaker half-open, testing OpenWeatherMap")
+
+    def __move(self, state):
+        """Moves the breaker to a state, the lock being held: the calls started before are of the past state."""
+        self._state = state
+        self._generation += 1
+
+    def acquire(self):
+        """
+        | The acquire method.
+
+        | Returns the ticket of a call, if it can be made: the tag of the state of the breaker it starts in.
+        | A call acquired must report its outcome to :meth:`record`, or call :meth:`release` if it did not
+        | complete, with its ticket.
+
+        :return: The ticket of the call, `None` if the call must fail at once
+        :rtype: int
+        """
+        with self._lock:
+            self.__cool_down()
+            if self._state == CLOSED:
+                return self._generation
+            if self._state == HALF_OPEN and self._in_flight < self._probes:
+                self._in_flight += 1
+                return self._generation
+            self._stats["rejected"] += 1
+            return None
+
+    def allow(self):
+        """
+        | The allow method.
+
+        | Returns whether a call can be made, see :meth:`acquire`. A call allowed must report its outcome
+        | to :meth:`record`, or call :meth:`release` if it did not complete, as a call of the current state.
+
+        :return: `True` if the call can be made, `False` if it must fail at once
+        :rtype: bool
+        """
+        return self.acquire() is not None
+
+    def release(self, ticket=None):
+        """
+        | The release method.
+
+        | Ends a call allowed by :meth:`acquire` which did not complete, e.g. its task was cancelled,
+        | without reporting an outcome: a probe made while half-open frees its slot for another call.
+
+        :param ticket: The ticket of the call, the call is of the current state if `None`
+        :type ticket: int, optional
+        """
+        with self._lock:
+            if self._state == HALF_OPEN and ticket in (None, self._generation):
+                self._in_flight = max(self._in_flight - 1, 0)
+
+    @staticmethod
+    def is_outage(err):
+        """
+        | The is_outage method.
+
+        | Returns whether an error of a One Call Api call shows an outage of OpenWeatherMap.
+
+        :param err: The error raised by the call
+        :type err: Exception
+
+        :return: `False` for an HTTP error status other than 429 and 5xx, `True` otherwise
+        :rtype: bool
+        """
+        status = getattr(getattr(err, "response", None), "status_code", None)
+        if status is None:
+            status = getattr(err, "status", None)
+        if isinstance(status, int):
+            return status == 429 or status >= 500
+        return True
+
+    def record(self, err=None, ticket=None):
+        """
+        | The record method.
+
+        | Reports the outcome of a call allowed by :meth:`acquire`.
+        | The outcome of a call started in a state the breaker has left since is ignored.
+
+        :param err: The error raised by the call, `None` if it succeeded
+        :type err: Exception, optional
+
+        :param ticket: The ticket of the call, the call is of the current state if `None`
+        :type ticket: int, optional
+        """
+        failed = err is not None and self.is_outage(err)
+        with self._lock:
+            if ticket not in (None, self._generation):
+                logger.debug("Circuit breaker %s, ignoring a call started in a past state", self._state)
+                return
+            if self._state == HALF_OPEN:
+                self._in_flight = max(self._in_flight - 1, 0)
+            if not failed:
+                if self._state != CLOSED:
+                    logger.info("Circuit breaker closed, OpenWeatherMap is back")
+                    self.__move(CLOSED)
+                self._count = 0
+                return
+            self._count += 1
+            if self._state == HALF_OPEN or (self._state == CLOSED and self._count >= self._failures):
+                self.__move(OPEN)
+                self._opened_at = time.monotonic()
+                self._stats["opened"] += 1
+                logger.warning("Circuit breaker open for %s s after %s failures", self._cooldown, self._count)
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the breaker state and counters, as a dictionary: state, failures (consecutive),
+        | opened (times the breaker opened) and rejected (calls failed at once).
+
+        :return: Breaker state and counters
+        :rtype: dict
+        """
+        with self._lock:
+            self.__cool_down()
+            return dict(self._stats, state=self._state, failures=self._count)
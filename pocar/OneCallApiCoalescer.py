@@ -0,0 +1,140 @@
+"""This module provides a class to share in-flight One Call Api requests between callers."""
+import asyncio
+import logging
+import threading
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# Outcome shared with the waiting tasks when the task performing the request is cancelled
+_RETRY = object()
+
+
+class _InFlightCall:  # pylint: disable=too-few-public-methods
+    """Holds the outcome of a request, once the caller performing it is done."""
+
+    def __init__(self):
+        """This is the constructor method."""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class OneCallApiCoalescer:
+    """
+    Class to coalesce concurrent One Call Api requests for the same key into a single request.
+
+    | The first caller for a key performs the request, the callers arriving while it is in flight
+    | wait for it and receive the same response (or the same error), the response is shared, not copied.
+    | Combined with :attr:`~pocar.OneCallAPi.OneCallAPi.snap`, nearby locations share one request.
+    """
+
+    def __init__(self):
+        """This is the constructor method."""
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._futures = {}
+        self._requests = 0
+        self._coalesced = 0
+
+    def run(self, key, func):
+        """
+        | The run method.
+
+        | Returns the result of `func()`, performed once for all concurrent callers with the same key.
+
+        :param key: The key identifying the request
+        :type key: hashable
+
+        :param func: The function performing the request
+        :type func: callable
+
+        :return: The result of `func()`
+        :raises Exception: the exception raised by `func()`
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._requests += 1
+            else:
+                self._coalesced += 1
+        if leader:
+            try:
+                call.result = func()
+            except Exception as err:  # pylint: disable=broad-except
+                call.error = err
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            logger.debug("Request coalesced for %s", key)
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    async def run_async(self, key, func):
+        """
+        | The run_async coroutine.
+
+        | Returns the result of `await func()`, performed once for all concurrent tasks
+        | of the running event loop with the same key.
+        | When the task performing the request is cancelled, the waiting tasks are not:
+        | the first of them performs the request again, for all of them.
+
+        :param key: The key identifying the request
+        :type key: hashable
+
+        :param func: The coroutine function performing the request
+        :type func: callable
+
+        :return: The result of `await func()`
+        :raises Exception: the exception raised by `await func()`
+        """
+        loop_key = (asyncio.get_running_loop(), key)
+        future = self._futures.get(loop_key)
+        while future is not None:
+            with self._lock:
+                self._coalesced += 1
+            logger.debug("Request coalesced for %s", key)
+            result = await asyncio.shield(future)
+            if result is not _RETRY:
+                return result
+            # the task performing the request was cancelled, the first waiting task performs it again
+            with self._lock:
+                self._coalesced -= 1
+            future = self._futures.get(loop_key)
+        future = asyncio.get_running_loop().create_future()
+        self._futures[loop_key] = future
+        with self._lock:
+            self._requests += 1
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.set_result(_RETRY)
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            future.exception()  # the leader re-raises it, do not report it as never retrieved
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            del self._futures[loop_key]
+        return result
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the coalescer counters, as a dictionary: requests (performed) and coalesced (shared).
+
+        :return: Coalescer counters
+        :rtype: dict
+        """
+        with self._lock:
+            return {"requests": self._requests, "coalesced": self._coalesced}
@@ -0,0 +1,261 @@
+"""This module provides a columnar store for the list sections of One Call Api response."""
+import logging
+from array import array
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency, installed with extra "numpy"
+    numpy = None
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+class OneCallApiColumns:
+    """
+    Class to hold a list section of One Call Api response (hourly, daily, minutely) as typed columns.
+
+    | Each numeric field is held in one :class:`array.array`, `"d"` for floats and `"q"` for integers,
+    | with a mask telling which entries hold the field: 1 if present, 0 if missing.
+    | A missing value is stored as 0 in the column, and read as `"N/A"`, as done by the accessors.
+    | A field is given by its name, or by a tuple of keys for a nested field, e.g. `("temp", "max")`.
+    | With numpy installed, :meth:`array` and :meth:`datetimes` return the columns as read-only numpy arrays,
+    | built on first use and shared by all the readers of the columns.
+
+    :param entries: The entries of the section, e.g. `rawdata["hourly"]`
+    :type entries: list of dict, or of :mod:`~pocar.OneCallApiRecords` records
+
+    :param fields: The fields to hold, as {field: typecode}
+    :type fields: dict
+    """
+
+    __slots__ = ("_size", "_columns", "_masks", "_complete", "_arrays")
+
+    def __init__(self, entries, fields):
+        """This is the constructor method."""
+        self._size = len(entries)
+        self._columns = {}
+        self._masks = {}
+        self._complete = {}
+        self._arrays = {}
+        for field, typecode in fields.items():
+            values, mask = self.__extract(entries, field)
+            try:
+                column = array(typecode, values)
+            except TypeError:
+                # an integer field holding floats in this response
+                column = array("d", values)
+            self._columns[field] = column
+            self._masks[field] = mask
+            self._complete[field] = all(mask)
+
+    @staticmethod
+    def __extract(entries, field):
+        """Returns the values of a field, 0 when missing, and the mask of present values."""
+        if isinstance(field, tuple):
+            values = []
+            for entry in entries:
+                for key in field:
+                    entry = entry.get(key) if hasattr(entry, "get") else None
+                values.append(entry)
+        else:
+            values = [entry.get(field) for entry in entries]
+        mask = bytearray(value is not None for value in values)
+        if not all(mask):
+            values = [0 if value is None else value for value in values]
+        return values, mask
+
+    def __len__(self):
+        """Returns the number of entries."""
+        return self._size
+
+    def __contains__(self, field):
+        """Returns `True` if the field is held as a column."""
+        return field in self._columns
+
+    def fields(self):
+        """
+        | The fields method.
+
+        :return: The fields held as columns, in the order they were given
+        :rtype: tuple
+        """
+        return tuple(self._columns)
+
+    def column(self, field):
+        """
+        | The column method.
+
+        | Returns the column of a field, missing values are 0, see :meth:`mask`.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :return: The values of the field
+        :rtype: array.array
+        """
+        return self._columns[field]
+
+    def mask(self, field):
+        """
+        | The mask method.
+
+        | Returns the mask of a field: 1 where the entry holds the field, 0 where it is missing.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :return: The mask of the field
+        :rtype: bytearray
+        """
+        return self._masks[field]
+
+    def value(self, field, idx):
+        """
+        | The value method.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :param idx: The entry index
+        :type idx: int
+
+        :return: The value of the field for the entry, `"N/A"` if missing or beyond the last entry
+        :rtype: float, int or str
+        """
+        if idx < self._size and self._masks[field][idx]:
+            return self._columns[field][idx]
+        return "N/A"
+
+    def values(self, field, size=None):
+        """
+        | The values method.
+
+        | Returns the values of a field for all entries, `"N/A"` where missing.
+        | With `size`, the list is cut or padded with `"N/A"` to hold `size` values.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :param size: The number of values to return, the number of entries if `None`
+        :type size: int, optional
+
+        :return: The values of the field
+        :rtype: list
+        """
+        if self._complete[field]:
+            values = self._columns[field].tolist()
+        else:
+            mask = self._masks[field]
+            values = [value if mask[idx] else "N/A" for idx, value in enumerate(self._columns[field])]
+        if size is not None:
+            values = values[:size] + ["N/A"] * (size - len(values))
+        return values
+
+    def array(self, field, size=None):
+        """
+        | The array method.
+
+        | Returns the values of a field as a read-only numpy array of float64, NaN where missing.
+        | With `size`, the array is cut or padded with NaN to hold `size` values.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :param size: The number of values to return, the number of entries if `None`
+        :type size: int, optional
+
+        :return: The values of the field
+        :rtype: numpy.ndarray
+        """
+        self.__require_numpy()
+        key = ("array", field, size)
+        if key not in self._arrays:
+            values = numpy.empty(self._size if size is None else size)
+            self.fill(field, values)
+            values.flags.writeable = False
+            self._arrays[key] = values
+        return self._arrays[key]
+
+    def fill(self, field, out):
+        """
+        | The fill method.
+
+        | Writes the values of a field into a numpy array, NaN where missing and beyond the last entry.
+        | Unlike :meth:`array`, nothing is kept: the array can be a row of a larger array, see
+        | :class:`~pocar.OneCallApiFleet.OneCallApiFleet`.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :param out: The array written, its length sets the number of values
+        :type out: numpy.ndarray, 1-D, floating point
+        """
+        self.__require_numpy()
+        count = min(len(out), self._size)
+        out[:count] = self._columns[field][:count]
+        out[count:] = numpy.nan
+        out[:count][numpy.frombuffer(self._masks[field], dtype=numpy.uint8)[:count] == 0] = numpy.nan
+
+    def fill_fields(self, fields, out):
+        """
+        | The fill_fields method.
+
+        | Writes the values of many fields into the columns of a 2-D numpy array, one field per column,
+        | NaN where missing and beyond the last entry, as :meth:`fill` does for each field.
+
+        :param fields: The fields, one per column of `out`
+        :type fields: list
+
+        :param out: The array written, its number of rows sets the number of values
+        :type out: numpy.ndarray, 2-D, floating point
+        """
+        self.__require_numpy()
+        count = min(out.shape[0], self._size)
+        if fields:
+            block = numpy.array([self._columns[field] for field in fields], dtype=numpy.float64)
+            masks = numpy.frombuffer(b"".join(self._masks[field] for field in fields), dtype=numpy.uint8)
+            block[masks.reshape(len(fields), self._size) == 0] = numpy.nan
+            out[:count] = block.T[:count]
+        out[count:] = numpy.nan
+
+    def datetimes(self, field, size=None):
+        """
+        | The datetimes method.
+
+        | Returns the values of a field holding Unix times as a read-only numpy array of datetime64[s] (UTC),
+        | NaT where missing.
+        | With `size`, the array is cut or padded with NaT to hold `size` values.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :param size: The number of values to return, the number of entries if `None`
+        :type size: int, optional
+
+        :return: The values of the field
+        :rtype: numpy.ndarray
+        """
+        self.__require_numpy()
+        key = ("datetimes", field, size)
+        if key not in self._arrays:
+            values = numpy.array(self._columns[field], dtype=numpy.int64).astype("datetime64[s]")
+            values[numpy.frombuffer(self._masks[field], dtype=numpy.uint8) == 0] = numpy.datetime64("NaT")
+            self._arrays[key] = self.__resize(values, size, numpy.datetime64("NaT"))
+        return self._arrays[key]
+
+    @staticmethod
+    def __require_numpy():
+        """Raises ImportError if numpy is not installed."""
+        if numpy is None:
+            raise ImportError("OneCallApiColumns arrays require numpy, install pocar with extra 'numpy'")
+
+    def __resize(self, values, size, fill):
+        """Returns the values cut or padded with fill to hold size values, as a read-only array."""
+        if size is not None and size != self._size:
+            resized = numpy.full(size, fill, dtype=values.dtype)
+            count = min(size, self._size)
+            resized[:count] = values[:count]
+            values = resized
+        values.flags.writeable = False
+        return values
@@ -0,0 +1,190 @@
+"""This module provides a class to handle all sections of One Call Api response with a single request."""
+import logging
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+def _parent_attribute(name):
+    """Returns a property reading and setting the attribute `name` of the parent object of a view."""
+
+    def getter(self):
+        return getattr(self._parent, name)  # pylint: disable=protected-access
+
+    def setter(self, value):
+        setattr(self._parent, name, value)  # pylint: disable=protected-access
+
+    return property(getter, setter, doc=f"The getter/setter for :attr:`{name}`, stored in the parent object.")
+
+
+class _OneCallApiView:  # pylint: disable=too-few-public-methods
+    """
+    Mixin Class to read the One Call Api response of a parent object.
+
+    | The attributes `_rawdata`, `_timestamp`, `_stale` and `_compacted` are those of the parent,
+    | they are not copied, and :meth:`update_data` updates the parent.
+    | The switches :attr:`numpy_series`, :attr:`response_timezone` and :attr:`trace_access` are those
+    | of the parent too: set on the parent, they apply to all its views.
+    | A view is meant to be built by the constructor of its parent, before any response is stored.
+    """
+
+    numpy_series = _parent_attribute("numpy_series")
+    response_timezone = _parent_attribute("response_timezone")
+    trace_access = _parent_attribute("trace_access")
+    _compacted = _parent_attribute("_compacted")
+
+    def __init__(self, parent):
+        """This is the constructor method."""
+        self._parent = parent
+        super().__init__(parent.lat, parent.lon, parent.key)
+
+    @property
+    def _rawdata(self):
+        """The getter/setter for the One Call Api response, stored in the parent object."""
+        return self._parent._rawdata  # pylint: disable=protected-access
+
+    @_rawdata.setter
+    def _rawdata(self, rawdata):
+        self._parent._rawdata = rawdata  # pylint: disable=protected-access
+
+    @property
+    def _timestamp(self):
+        """The getter/setter for the One Call Api response timestamp, stored in the parent object."""
+        return self._parent._timestamp  # pylint: disable=protected-access
+
+    @_timestamp.setter
+    def _timestamp(self, timestamp):
+        self._parent._timestamp = timestamp  # pylint: disable=protected-access
+
+    @property
+    def _stale(self):
+        """The getter/setter for the stale flag of the One Call Api response, stored in the parent object."""
+        return self._parent._stale  # pylint: disable=protected-access
+
+    @_stale.setter
+    def _stale(self, stale):
+        self._parent._stale = stale  # pylint: disable=protected-access
+
+    def update_data(self):
+        """
+        | The update_data method.
+
+        This method triggers a call to the parent :meth:`~pocar.OneCallAPi.OneCallAPi.update_data`.
+
+        :return: `True` if data successfully update, `False` otherwise
+        :rtype: bool
+        """
+        return self._parent.update_data()
+
+    def stale(self):
+        """
+        | The stale method.
+
+        This method returns the parent :meth:`~pocar.OneCallAPi.OneCallAPi.stale`.
+
+        :return: `True` if the response held is stale, `False` otherwise
+        :rtype: bool
+        """
+        return self._parent.stale()
+
+
+class OneCallApiCurrentView(_OneCallApiView, OneCallApiCurrent):
+    """Class to read the Current section of a :class:`OneCallApiCombined` response."""
+
+
+class OneCallApiMinutelyView(_OneCallApiView, OneCallApiMinutely):
+    """Class to read the Minutely section of a :class:`OneCallApiCombined` response."""
+
+
+class OneCallApiHourlyView(_OneCallApiView, OneCallApiHourly):
+    """Class to read the Hourly section of a :class:`OneCallApiCombined` response."""
+
+
+class OneCallApiDailyView(_OneCallApiView, OneCallApiDaily):
+    """Class to read the Daily section of a :class:`OneCallApiCombined` response."""
+
+
+class OneCallApiAlertsView(_OneCallApiView, OneCallApiAlerts):
+    """Class to read the Alerts section of a :class:`OneCallApiCombined` response."""
+
+
+class OneCallApiCombined(OneCallApi):
+    """
+    Class to handle all sections of One Call Api response from OpenWeatherMap with a single request.
+
+    | One call to :meth:`~pocar.OneCallAPi.OneCallAPi.update_data` requests all sections, with no exclusion.
+    | Each section is read through a view, with the methods of its own class,
+    | over the same response: the data is neither copied nor requested again.
+
+    This Class is derived from :class:`~pocar.OneCallAPi.OneCallAPi`
+
+    :param lat: Geographical coordinates of the location (latitude)
+    :type lat: float, range [-90; 90]
+
+    :param lon: Geographical coordinates of the location (longitude)
+    :type lon: float, range [-180; 180]
+
+    :param key: The OpenWeatherMap One Call Api key value
+    :type key: hex, 128-bit hash key
+    """
+
+    def __init__(self, lat, lon, key):
+        """This is the constructor method."""
+        super().__init__(lat, lon, key, "")
+        self.__current = OneCallApiCurrentView(self)
+        self.__minutely = OneCallApiMinutelyView(self)
+        self.__hourly = OneCallApiHourlyView(self)
+        self.__daily = OneCallApiDailyView(self)
+        self.__alerts = OneCallApiAlertsView(self)
+
+    def current(self):
+        """
+        | The current method.
+
+        :return: The view on the Current section of the response
+        :rtype: :class:`OneCallApiCurrentView`, derived from :class:`~pocar.OneCallApiCurrent.OneCallApiCurrent`
+        """
+        return self.__current
+
+    def minutely(self):
+        """
+        | The minutely method.
+
+        :return: The view on the Minutely section of the response
+        :rtype: :class:`OneCallApiMinutelyView`, derived from :class:`~pocar.OneCallApiMinutely.OneCallApiMinutely`
+        """
+        return self.__minutely
+
+    def hourly(self):
+        """
+        | The hourly method.
+
+        :return: The view on the Hourly section of the response
+        :rtype: :class:`OneCallApiHourlyView`, derived from :class:`~pocar.OneCallApiHourly.OneCallApiHourly`
+        """
+        return self.__hourly
+
+    def daily(self):
+        """
+        | The daily method.
+
+        :return: The view on the Daily section of the response
+        :rtype: :class:`OneCallApiDailyView`, derived from :class:`~pocar.OneCallApiDaily.OneCallApiDaily`
+        """
+        return self.__daily
+
+    def alerts(self):
+        """
+        | The alerts method.
+
+        :return: The view on the Alerts section of the response
+        :rtype: :class:`OneCallApiAlertsView`, derived from :class:`~pocar.OneCallApiAlerts.OneCallApiAlerts`
+        """
+        return self.__alerts
@@ -1,10 +1,10 @@
 """This module provides a base class to handle One Call Api response for Current from OpenWeatherMap."""
 import logging
-from datetime import datetime
 
 import requests
 
 from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiRecords import OneCallApiCurrentRecord
 
 
 # Uncomment this line to suppress warning message due to:
@@ -38,41 +38,59 @@ class OneCallApiCurrent(OneCallApi):
     def __init__(self, lat, lon, key):
         """This is the constructor method."""
         super().__init__(lat, lon, key, "minutely,daily,hourly,alerts")
+        self.__record = (None, None)
 
-    def __is_data_available(self, field):
-        """TBD."""
-        value = False
-        if ("current" in self._rawdata) and (field in self._rawdata["current"]):
-            value = True
-        return value
+    def record(self):
+        """
+        | The record method.
+
+        | Returns the Current section of the response as a record, built once per response, on first use.
+
+        :return: The Current record, holding `"N/A"` only if the response holds no Current section
+        :rtype: :class:`~pocar.OneCallApiRecords.OneCallApiCurrentRecord`
+        """
+        current = self._rawdata.get("current")
+        if isinstance(current, OneCallApiCurrentRecord):
+            return current
+        source, record = self.__record
+        if record is None or source is not current:
+            record = OneCallApiCurrentRecord.from_dict(current if current is not None else {})
+            self.__record = (current, record)
+        return record
+
+    def compact(self):
+        """
+        | The compact method.
+
+        | Replaces the Current section of the response, nested dictionaries, by its record,
+        | to reduce the memory held by objects kept between updates.
+        | The accessors return the same values, :meth:`raw_data_current` rebuilds the section from the record,
+        | as does :meth:`raw_data` for the whole response.
+        | The response is copied, not modified, a response shared with a cache is kept as it is.
+        """
+        self._compact("current", self.record())
 
     def __extract_date_field(self, field, metrics=0):
         """TBD."""
-        value = "N/A"
-        if self.__is_data_available(field) is True:
-            if metrics == 0:
-                dt = datetime.fromtimestamp(self._rawdata["current"][field])
-                value = f"{dt:%Y-%m-%d %H:%M:%S}"
-            else:
-                value = self._rawdata["current"][field]
-        logger.debug("Value for %s is: %s", field, value)
+        value = getattr(self.record(), field)
+        if value != "N/A" and metrics == 0:
+            value = self._format_time(value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_value_field(self, field):
         """TBD."""
-        value = "N/A"
-        if self.__is_data_available(field) is True:
-            value = self._rawdata["current"][field]
-        logger.debug("Value for %s is: %s", field, value)
+        value = getattr(self.record(), field)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_weather_field(self, field):
         """TBD."""
-        value = "N/A"
-        if self.__is_data_available("weather") is True:
-            if field in self._rawdata["current"]["weather"][0]:
-                value = self._rawdata["current"]["weather"][0][field]
-        logger.debug("Value for %s is: %s", field, value)
+        value = getattr(self.record().weather, field)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def raw_data_current(self):
@@ -86,7 +104,9 @@ class OneCallApiCurrent(OneCallApi):
         :rtype: dict
         """
         value = {}
-        if "current" in self._rawdata:
+        if isinstance(self._rawdata.get("current"), OneCallApiCurrentRecord):
+            value = self._rawdata["current"].as_dict()
+        elif "current" in self._rawdata:
             value = self._rawdata["current"]
         return value
 
@@ -284,11 +304,7 @@ class OneCallApiCurrent(OneCallApi):
         :return: Rain volume for last hour, mm
         :rtype: int
         """
-        value = "N/A"
-        if self.__is_data_available("rain") is True:
-            if "1h" in self._rawdata["current"]["rain"]:
-                value = self._rawdata["current"]["rain"]["1h"]
-        return value
+        return self.record().rain_1h
 
     def snow_volume(self):
         """
@@ -301,11 +317,7 @@ class OneCallApiCurrent(OneCallApi):
         :return: Snow volume for last hour, mm
         :rtype: int
         """
-        value = "N/A"
-        if self.__is_data_available("snow") is True:
-            if "1h" in self._rawdata["current"]["snow"]:
-                value = self._rawdata["current"]["snow"]["1h"]
-        return value
+        return self.record().snow_1h
 
     def weather_condition_id(self):
         """
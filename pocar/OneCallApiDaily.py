@@ -1,10 +1,10 @@
 """This module provides a base class to handle One Call Api response from OpenWeatherMap."""
 import logging
-from datetime import datetime
 
 import requests
 
 from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiRecords import OneCallApiDailyRecord
 
 
 # Uncomment this line to suppress warning message due to:
@@ -17,6 +17,34 @@ requests.packages.urllib3.disable_warnings()
 # Set local logger to the root logger, to inherit root settings
 logger = logging.getLogger(__name__)
 
+# The numeric fields of Daily entries held as columns, with their array typecode
+DAILY_COLUMNS = {
+    "dt": "q",
+    "sunrise": "q",
+    "sunset": "q",
+    "moonrise": "q",
+    "moonset": "q",
+    ("temp", "day"): "d",
+    ("temp", "min"): "d",
+    ("temp", "max"): "d",
+    ("temp", "night"): "d",
+    ("temp", "eve"): "d",
+    ("temp", "morn"): "d",
+    ("feels_like", "day"): "d",
+    ("feels_like", "night"): "d",
+    ("feels_like", "eve"): "d",
+    ("feels_like", "morn"): "d",
+    "pressure": "q",
+    "humidity": "q",
+    "dew_point": "d",
+    "wind_speed": "d",
+    "wind_deg": "q",
+    "wind_gust": "d",
+    "clouds": "q",
+    "pop": "d",
+    "uvi": "d",
+}
+
 
 # Derived Class to handle Daily weather data API response
 # Daily holds the weather forecast for the next 7 days in a daily basis
@@ -27,86 +55,103 @@ class OneCallApiDaily(OneCallApi):
     def __init__(self, lat, lon, key):
         """This is the constructor method."""
         super().__init__(lat, lon, key, "current,hourly,minutely,alerts")
-
-    def __is_data_available(self, day, field):
-        """TBD."""
-        value = False
-        if ("daily" in self._rawdata) and (field in self._rawdata["daily"][day]):
-            value = True
+        self.__records = (None, None)
+
+    def columns(self):
+        """
+        | The columns method.
+
+        | Returns the numeric fields of the Daily section as columns, see :data:`DAILY_COLUMNS`.
+        | The columns are built once per response, on first use, and rebuilt when the response changes.
+
+        :return: The Daily columns, holding no entry if the response holds no Daily section
+        :rtype: :class:`~pocar.OneCallApiColumns.OneCallApiColumns`
+        """
+        return self._columns("daily", DAILY_COLUMNS)
+
+    def records(self):
+        """
+        | The records method.
+
+        | Returns the entries of the Daily section of the response as records, built once per response,
+        | on first use.
+
+        :return: The Daily records, empty if the response holds no Daily section
+        :rtype: list of :class:`~pocar.OneCallApiRecords.OneCallApiDailyRecord`
+        """
+        daily = self._rawdata.get("daily", ())
+        if daily and isinstance(daily[0], OneCallApiDailyRecord):
+            return daily
+        source, records = self.__records
+        if records is None or source is not daily:
+            records = [OneCallApiDailyRecord.from_dict(entry) for entry in daily]
+            self.__records = (daily, records)
+        return records
+
+    def compact(self):
+        """
+        | The compact method.
+
+        | Replaces the Daily section of the response, lists of nested dictionaries, by its records,
+        | to reduce the memory held by objects kept between updates. The Daily columns are built before.
+        | The accessors return the same values, :meth:`raw_data_daily` rebuilds the section from the records,
+        | as does :meth:`raw_data` for the whole response.
+        | The response is copied, not modified, a response shared with a cache is kept as it is.
+        """
+        self._compact("daily", self.records(), DAILY_COLUMNS)
+
+    def __record_value(self, day, path):
+        """Returns the value of a record field, given by its path of slots, `"N/A"` beyond the last record."""
+        records = self.records()
+        if day >= len(records):
+            return "N/A"
+        value = records[day]
+        for name in path:
+            value = getattr(value, name)
         return value
 
     def __extract_date_field(self, day, field, metrics=0):
         """TBD."""
-        value = "N/A"
-        if self.__is_data_available(day, field) is True:
-            if metrics == 0:
-                dt = datetime.fromtimestamp(self._rawdata["daily"][day][field])
-                value = f"{dt:%Y-%m-%d %H:%M:%S}"
-            else:
-                value = self._rawdata["daily"][day][field]
-        logger.debug("Value for %s is: %s", field, value)
+        value = self.__record_value(day, (field,))
+        if value != "N/A" and metrics == 0:
+            value = self._format_time(value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_date_set(self, day, field, metrics=0, all_values=False):
         """TBD."""
         if day < 0 or day > 7:
             raise ValueError("The 'day' argument must be within range [0, 7]")
-        if all_values is True:
-            value = [0] * 7  # Initialize the 48 data time values
-            for idx in range(7):
-                value[idx] = self.__extract_date_field(idx, field, metrics)
+        if all_values is True and self.numpy_series:
+            value = self.columns().datetimes(field, 7)
+        elif metrics != 0:
+            value = self.__extract_value_set(day, field, all_values)
+        elif all_values is True:
+            value = self._format_times(self.columns(), field, 7)
+            if self.trace_access:
+                logger.debug("Value for %s is: %s", field, value)
         else:
             value = self.__extract_date_field(day, field, metrics)
         return value
 
-    def __extract_temp_field(self, day, group, field):
-        """TBD."""
-        value = "N/A"
-        if self.__is_data_available(day, group) is True:
-            if field in self._rawdata["daily"][day][group]:
-                value = self._rawdata["daily"][day][group][field]
-        logger.debug("Value for %s is: %s", field, value)
-        return value
-
     def __extract_temp_set(self, day, group, field, all_values):
         """TBD."""
-        if day < 0 or day > 7:
-            raise ValueError("The 'day' argument must be within range [0, 7]")
-        if all_values is True:
-            value = [0] * 7  # Initialize the 7 data time values
-            for idx in range(7):
-                value[idx] = self.__extract_temp_field(idx, group, field)
-        else:
-            value = self.__extract_temp_field(day, group, field)
-        return value
-
-    def __extract_value_field(self, day, field):
-        """TBD."""
-        value = "N/A"
-        if self.__is_data_available(day, field) is True:
-            value = self._rawdata["daily"][day][field]
-        logger.debug("Value for %s is: %s", field, value)
-        return value
+        return self.__extract_value_set(day, (group, field), all_values)
 
     def __extract_value_set(self, day, field, all_values):
         """TBD."""
         if day < 0 or day > 7:
             raise ValueError("The 'day' argument must be within range [0, 7]")
-        if all_values is True:
-            value = [0] * 7  # Initialize the 7 data time values
-            for idx in range(7):
-                value[idx] = self.__extract_value_field(idx, field)
+        columns = self.columns()
+        if all_values is True and self.numpy_series:
+            value = columns.array(field, 7)
+        elif all_values is True:
+            value = columns.values(field, 7)
         else:
-            value = self.__extract_value_field(day, field)
-        return value
-
-    def __extract_weather_field(self, day, field):
-        """TBD."""
-        value = "N/A"
-        if ("daily" in self._rawdata) and ("weather" in self._rawdata["daily"][day]):
-            if field in self._rawdata["daily"][day]["weather"][0]:
-                value = self._rawdata["daily"][day]["weather"][0][field]
-        logger.debug("Value for %s is: %s", field, value)
+            value = self.__record_value(day, field if isinstance(field, tuple) else (field,))
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_weather_set(self, day, field, all_values):
@@ -114,11 +159,11 @@ class OneCallApiDaily(OneCallApi):
         if day < 0 or day > 7:
             raise ValueError("The 'hour' argument must be within range [0, 7]")
         if all_values is True:
-            value = [0] * 7  # Initialize the 7 data time values
-            for idx in range(7):
-                value[idx] = self.__extract_weather_field(idx, field)
+            value = [self.__record_value(idx, ("weather", field)) for idx in range(7)]
         else:
-            value = self.__extract_weather_field(day, field)
+            value = self.__record_value(day, ("weather", field))
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def raw_data_daily(self):
@@ -126,6 +171,8 @@ class OneCallApiDaily(OneCallApi):
         value = {}
         if "daily" in self._rawdata:
             value = self._rawdata["daily"]
+            if value and isinstance(value[0], OneCallApiDailyRecord):
+                value = [record.as_dict() for record in value]
         return value
 
     def data_time(self, day=0, metrics=0, all_values=False):
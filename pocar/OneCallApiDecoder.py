@@ -0,0 +1,98 @@
+"""This module provides a class to decode One Call Api responses with the fastest JSON library installed."""
+import json
+import logging
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency, installed with extra "json"
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # simdjson is an optional dependency
+    simdjson = None
+
+try:
+    import ujson
+except ImportError:  # ujson is an optional dependency
+    ujson = None
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The JSON libraries supported, from the fastest to the slowest, "json" is the standard library
+BACKENDS = ("orjson", "simdjson", "ujson", "json")
+
+# The JSON libraries, None when not installed
+_MODULES = {"orjson": orjson, "simdjson": simdjson, "ujson": ujson, "json": json}
+
+
+class OneCallApiDecoder:
+    """
+    Class to decode One Call Api responses from the bytes received.
+
+    | The bytes are decoded directly, without first decoding them to text as `requests.Response.json` does.
+    | The decoder returned by :meth:`shared` is used by every One Call Api object that has no decoder of its own,
+    | it uses the fastest library installed, see :data:`BACKENDS`.
+    | All libraries raise a `ValueError` on invalid JSON.
+
+    :param backend: The JSON library, one of :data:`BACKENDS`, the fastest installed if `None`
+    :type backend: str, optional
+    """
+
+    __shared = None
+
+    def __init__(self, backend=None):
+        """This is the constructor method."""
+        if backend is None:
+            backend = next(name for name in BACKENDS if _MODULES[name] is not None)
+        if backend not in BACKENDS:
+            raise ValueError(f"The 'backend' argument must be one of {BACKENDS}")
+        if _MODULES[backend] is None:
+            raise ImportError(f"The JSON library '{backend}' is not installed")
+        self._backend = backend
+        self._loads = _MODULES[backend].loads
+        logger.debug("JSON decoder backend: %s", backend)
+
+    @classmethod
+    def shared(cls):
+        """
+        | The shared method.
+
+        | Returns the decoder shared by all One Call Api objects, created on first use.
+
+        :return: The shared decoder
+        :rtype: :class:`OneCallApiDecoder`
+        """
+        if cls.__shared is None:
+            cls.__shared = cls()
+        return cls.__shared
+
+    @staticmethod
+    def available():
+        """
+        | The available method.
+
+        :return: The JSON libraries installed, from the fastest to the slowest
+        :rtype: list of str
+        """
+        return [name for name in BACKENDS if _MODULES[name] is not None]
+
+    @property
+    def backend(self):
+        """The getter for attribute :attr:`backend`, the JSON library used."""
+        return self._backend
+
+    def decode(self, content):
+        """
+        | The decode method.
+
+        :param content: The response body
+        :type content: bytes
+
+        :return: The decoded response
+        :rtype: dict
+
+        :raises ValueError: if the body is not valid JSON
+        """
+        return self._loads(content)
@@ -0,0 +1,183 @@
+"""This module provides an on-disk cache of One Call Api responses, shared between processes."""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from pocar.OneCallApiCache import DEFAULT_TTL
+from pocar.OneCallApiCache import section_ttl
+from pocar.OneCallApiCache import SECTIONS
+from pocar.OneCallApiLazyResponse import OneCallApiLazyResponse
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+class OneCallApiDiskCache:
+    """
+    Class to cache One Call Api responses in an SQLite file, with a time to live.
+
+    | The file can be shared by many processes (workers, cron jobs) and threads: SQLite serializes
+    | the writers, each response is written in a single transaction, and readers never see a partial write.
+    | The keys and time to live are those of :class:`~pocar.OneCallApiCache.OneCallApiCache`,
+    | which can use this cache as its `backend` to keep the most used responses in memory.
+
+    :param path: The path of the SQLite file, created if it does not exist
+    :type path: str
+
+    :param ttl: Time to live, in seconds, of each section, overriding :data:`~pocar.OneCallApiCache.DEFAULT_TTL`
+    :type ttl: dict, optional
+
+    :param timeout: Time, in seconds, to wait for another process to release the file
+    :type timeout: float, optional
+    """
+
+    def __init__(self, path, ttl=None, timeout=10.0):
+        """This is the constructor method."""
+        self._path = path
+        self._timeout = timeout
+        self._ttl = dict(DEFAULT_TTL)
+        if ttl is not None:
+            for section in ttl:
+                if section not in SECTIONS:
+                    raise ValueError(f"The 'ttl' argument contains an invalid section: {section}")
+            self._ttl.update(ttl)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        with self.__connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, timestamp REAL NOT NULL, expires REAL NOT NULL, data BLOB NOT NULL)"
+            )
+
+    def __connection(self):
+        """Returns the SQLite connection of the calling thread and process, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=self._timeout)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def __serialize_key(key):
+        """Returns the cache key as text."""
+        return json.dumps(key, separators=(",", ":"))
+
+    def ttl(self, key):
+        """
+        | The ttl method.
+
+        :param key: The cache key
+        :type key: tuple
+
+        :return: Time to live, in seconds, of the response for the given key
+        :rtype: float
+        """
+        return section_ttl(key, self._ttl)
+
+    def get(self, key, decode=None):
+        """
+        | The get method.
+
+        | Returns the cached response for the given key, if it has not expired.
+        | The response is stored as bytes, it is decoded by `decode`, with :func:`json.loads` by default.
+
+        :param key: The cache key
+        :type key: tuple
+
+        :param decode: Function decoding the stored bytes, such as :meth:`~pocar.OneCallAPi.OneCallAPi._decode`
+        :type decode: callable, optional
+
+        :return: The response and the timestamp it was received at, `None` on cache miss
+        :rtype: tuple (dict, float)
+        """
+        row = (
+            self.__connection()
+            .execute("SELECT timestamp, expires, data FROM responses WHERE key = ?", (self.__serialize_key(key),))
+            .fetchone()
+        )
+        with self._lock:
+            if row is not None and row[1] <= time.time():
+                self._expirations += 1
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        logger.debug("Disk cache hit for %s", key)
+        if decode is None:
+            return json.loads(row[2]), row[0]
+        return decode(row[2]), row[0]
+
+    def put(self, key, rawdata, timestamp):
+        """
+        | The put method.
+
+        | Stores a response, replacing the previous one for the same key.
+
+        :param key: The cache key
+        :type key: tuple
+
+        :param rawdata: The One Call Api response, a lazy response is stored as the bytes received
+        :type rawdata: dict or :class:`~pocar.OneCallApiLazyResponse.OneCallApiLazyResponse`
+
+        :param timestamp: Unix time the response was received at
+        :type timestamp: float
+        """
+        if isinstance(rawdata, OneCallApiLazyResponse):
+            data = rawdata.content
+        else:
+            data = json.dumps(rawdata, separators=(",", ":")).encode()
+        with self.__connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, timestamp, expires, data) VALUES (?, ?, ?, ?)",
+                (self.__serialize_key(key), timestamp, timestamp + self.ttl(key), data),
+            )
+
+    def purge(self):
+        """
+        | The purge method.
+
+        | Removes the expired responses from the file.
+
+        :return: Number of responses removed
+        :rtype: int
+        """
+        with self.__connection() as conn:
+            return conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),)).rowcount
+
+    def clear(self):
+        """
+        | The clear method.
+
+        | Removes all responses from the file, the counters are kept.
+        """
+        with self.__connection() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the cache counters of this process, as a dictionary: hits, misses, evictions (always 0,
+        | the file is not bounded in size), expirations and size (responses held in the file).
+
+        :return: Cache counters
+        :rtype: dict
+        """
+        size = self.__connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": 0,
+                "expirations": self._expirations,
+                "size": size,
+            }
@@ -0,0 +1,165 @@
+"""This module provides a class to analyze the forecasts of many locations as a single numpy array."""
+import logging
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency, installed with extra "numpy"
+    numpy = None
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The reductions of :meth:`OneCallApiFleet.reduce`, NaN (missing) values are ignored
+REDUCTIONS = ("max", "min", "mean", "sum", "std", "median")
+
+
+class OneCallApiFleet:
+    """
+    Class to stack the Hourly or Daily forecasts of many locations into one array.
+
+    | The forecasts are copied, once, from the columns of the given objects, see
+    | :meth:`~pocar.OneCallApiHourly.OneCallApiHourly.columns`, into :attr:`data`: a contiguous array
+    | of shape (locations, steps, fields), NaN where a value is missing.
+    | The fleet holds no reference to the objects: it costs the arrays only, whatever the number of locations.
+    | Each location has its own data times, in :attr:`times`, as responses may not be received at the same time.
+
+    :param objects: The objects holding the responses, all of the same section (Hourly or Daily)
+    :type objects: list of :class:`~pocar.OneCallApiHourly.OneCallApiHourly`
+        or :class:`~pocar.OneCallApiDaily.OneCallApiDaily`
+
+    :param fields: The fields to stack, all the numeric fields of the section but the data time if `None`
+    :type fields: list, optional
+
+    :param steps: The number of hours (or days) per location, the longest forecast if `None`
+    :type steps: int, optional
+
+    :param dtype: The floating point type of :attr:`data`, e.g. float32 to halve its size
+    :type dtype: numpy.dtype, optional
+
+    :ivar data: The forecasts, of shape (locations, steps, fields)
+    :vartype data: numpy.ndarray
+
+    :ivar times: The data times, of shape (locations, steps), NaT where missing
+    :vartype times: numpy.ndarray of datetime64[s]
+
+    :ivar coords: The coordinates, of shape (locations, 2): latitude, longitude
+    :vartype coords: numpy.ndarray
+
+    :ivar fields: The fields, in the order of the last axis of :attr:`data`
+    :vartype fields: tuple
+    """
+
+    def __init__(self, objects, fields=None, steps=None, dtype=None):
+        """This is the constructor method."""
+        if numpy is None:
+            raise ImportError("OneCallApiFleet requires numpy, install pocar with extra 'numpy'")
+        columns = [oca.columns() for oca in objects]
+        if fields is None:
+            fields = [field for field in columns[0].fields() if field != "dt"] if columns else []
+        if steps is None:
+            steps = max((len(item) for item in columns), default=0)
+        self.fields = tuple(fields)
+        self._index = {field: idx for idx, field in enumerate(self.fields)}
+        self.coords = numpy.array([(oca.lat, oca.lon) for oca in objects], dtype=numpy.float64).reshape(-1, 2)
+        self.data = numpy.empty((len(columns), steps, len(self.fields)), dtype=dtype or numpy.float64)
+        times = numpy.empty((len(columns), steps))
+        for row, item in enumerate(columns):
+            item.fill_fields(self.fields, self.data[row])
+            item.fill("dt", times[row])
+        missing = numpy.isnan(times)
+        self.times = numpy.where(missing, 0, times).astype(numpy.int64).astype("datetime64[s]")
+        self.times[missing] = numpy.datetime64("NaT")
+        logger.debug("Fleet of %s locations, %s steps, %s fields", *self.data.shape)
+
+    def __len__(self):
+        """Returns the number of locations."""
+        return self.data.shape[0]
+
+    def field(self, field):
+        """
+        | The field method.
+
+        | Returns the values of a field for all locations and steps, as a view on :attr:`data`, not a copy.
+
+        :param field: The field name, or tuple of keys for a nested field, e.g. `("temp", "max")`
+        :type field: str or tuple
+
+        :return: The values, of shape (locations, steps)
+        :rtype: numpy.ndarray
+        """
+        if field not in self._index:
+            raise ValueError(f"The 'field' argument is not a field of the fleet: {field}")
+        return self.data[:, :, self._index[field]]
+
+    def reduce(self, field, how="max", steps=None):
+        """
+        | The reduce method.
+
+        | Returns a reduction of a field over the steps of each location, ignoring missing values.
+        | For instance, the maximum wind gust per location over the next 12 hours:
+        | `fleet.reduce("wind_gust", "max", steps=12)`.
+        | A location with no value in the steps reduces to NaN.
+
+        :param field: The field name, or tuple of keys for a nested field
+        :type field: str or tuple
+
+        :param how: The reduction, one of :data:`REDUCTIONS`
+        :type how: str, optional
+
+        :param steps: The number of first steps reduced, all steps if `None`
+        :type steps: int, optional
+
+        :return: The reduced values, of shape (locations,)
+        :rtype: numpy.ndarray
+        """
+        if how not in REDUCTIONS:
+            raise ValueError(f"The 'how' argument must be one of {REDUCTIONS}")
+        values = self.field(field)[:, :steps]
+        reduced = numpy.full(values.shape[0], numpy.nan, dtype=values.dtype)
+        present = ~numpy.isnan(values).all(axis=1)
+        if values.shape[1] > 0 and present.any():
+            reduced[present] = getattr(numpy, f"nan{how}")(values[present], axis=1)
+        return reduced
+
+    def select(self, mask):
+        """
+        | The select method.
+
+        | Returns a fleet holding the locations selected by a mask or by indexes, e.g.
+        | `fleet.select(fleet.reduce("wind_gust", "max", steps=12) > 20.0)`.
+        | The arrays of the returned fleet are copies.
+
+        :param mask: The locations selected, a boolean array of shape (locations,) or an array of indexes
+        :type mask: numpy.ndarray
+
+        :return: The selected locations
+        :rtype: :class:`OneCallApiFleet`
+        """
+        fleet = self.__class__.__new__(self.__class__)
+        fleet.fields = self.fields
+        fleet._index = self._index  # pylint: disable=protected-access
+        fleet.coords = self.coords[mask]
+        fleet.data = self.data[mask]
+        fleet.times = self.times[mask]
+        return fleet
+
+    def locate(self, lat, lon):
+        """
+        | The locate method.
+
+        | Returns the index of the location nearest to the given coordinates, in degrees,
+        | the longitudes wrapping around at the antimeridian.
+
+        :param lat: Geographical coordinates of the location (latitude)
+        :type lat: float, range [-90; 90]
+
+        :param lon: Geographical coordinates of the location (longitude)
+        :type lon: float, range [-180; 180]
+
+        :return: The index of the nearest location
+        :rtype: int
+        """
+        if len(self) == 0:
+            raise ValueError("The fleet holds no location")
+        dlon = (self.coords[:, 1] - lon + 180.0) % 360.0 - 180.0
+        return int(numpy.argmin(numpy.hypot(self.coords[:, 0] - lat, dlon)))
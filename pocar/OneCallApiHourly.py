@@ -1,6 +1,5 @@
 """This module provides a base class to handle One Call Api response from OpenWeatherMap."""
 import logging
-from datetime import datetime
 
 import requests
 
@@ -16,6 +15,23 @@ requests.packages.urllib3.disable_warnings()
 # Set local logger to the root logger, to inherit root settings
 logger = logging.getLogger(__name__)
 
+# The numeric fields of Hourly entries held as columns, with their array typecode
+HOURLY_COLUMNS = {
+    "dt": "q",
+    "temp": "d",
+    "feels_like": "d",
+    "pressure": "q",
+    "humidity": "q",
+    "dew_point": "d",
+    "uvi": "d",
+    "clouds": "q",
+    "visibility": "q",
+    "wind_speed": "d",
+    "wind_deg": "q",
+    "wind_gust": "d",
+    "pop": "d",
+}
+
 
 # Derived Class to handle Hourly weather data API response
 # Hourly holds the weather forecast for the next 48 hours in a hourly basis
@@ -27,6 +43,18 @@ class OneCallApiHourly(OneCallApi):
         """This is the constructor method."""
         super().__init__(lat, lon, key, "current,daily,minutely,alerts")
 
+    def columns(self):
+        """
+        | The columns method.
+
+        | Returns the numeric fields of the Hourly section as columns, see :data:`HOURLY_COLUMNS`.
+        | The columns are built once per response, on first use, and rebuilt when the response changes.
+
+        :return: The Hourly columns, holding no entry if the response holds no Hourly section
+        :rtype: :class:`~pocar.OneCallApiColumns.OneCallApiColumns`
+        """
+        return self._columns("hourly", HOURLY_COLUMNS)
+
     def __is_data_available(self, hour, field):
         """TBD."""
         value = False
@@ -39,31 +67,26 @@ class OneCallApiHourly(OneCallApi):
         value = "N/A"
         if self.__is_data_available(hour, field) is True:
             if metrics == 0:
-                dt = datetime.fromtimestamp(self._rawdata["hourly"][hour][field])
-                value = f"{dt:%Y-%m-%d %H:%M:%S}"
+                value = self._format_time(self._rawdata["hourly"][hour][field])
             else:
                 value = self._rawdata["hourly"][hour][field]
-        logger.debug("Value for %s is: %s", field, value)
-        return value
-
-    def __extract_value_field(self, hour, field):
-        """TBD."""
-        value = "N/A"
-        if self.__is_data_available(hour, field) is True:
-            value = self._rawdata["hourly"][hour][field]
-        logger.debug("Value for %s is: %s", field, value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_value_set(self, hour, field, all_values):
         """TBD."""
         if hour < 0 or hour > 48:
             raise ValueError("The 'hour' argument must be within range [0, 48]")
-        if all_values is True:
-            value = [0] * 48  # Initialize the 48 data time values
-            for idx in range(48):
-                value[idx] = self.__extract_value_field(idx, field)
+        columns = self.columns()
+        if all_values is True and self.numpy_series:
+            value = columns.array(field, 48)
+        elif all_values is True:
+            value = columns.values(field, 48)
         else:
-            value = self.__extract_value_field(hour, field)
+            value = columns.value(field, hour)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_weather_field(self, hour, field):
@@ -72,7 +95,8 @@ class OneCallApiHourly(OneCallApi):
         if ("hourly" in self._rawdata) and ("weather" in self._rawdata["hourly"][hour]):
             if field in self._rawdata["hourly"][hour]["weather"][0]:
                 value = self._rawdata["hourly"][hour]["weather"][0][field]
-        logger.debug("Value for %s is: %s", field, value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def __extract_weather_set(self, hour, field, all_values):
@@ -98,10 +122,14 @@ class OneCallApiHourly(OneCallApi):
         """TBD."""
         if hour < 0 or hour > 48:
             raise ValueError("The 'hour' argument must be within range [0, 48]")
-        if all_values is True:
-            value = [0] * 48  # Initialize the 48 data time values
-            for idx in range(48):
-                value[idx] = self.__extract_date_field(idx, "dt", metrics)
+        if all_values is True and self.numpy_series:
+            value = self.columns().datetimes("dt", 48)
+        elif metrics != 0:
+            value = self.__extract_value_set(hour, "dt", all_values)
+        elif all_values is True:
+            value = self._format_times(self.columns(), "dt", 48)
+            if self.trace_access:
+                logger.debug("Value for %s is: %s", "dt", value)
         else:
             value = self.__extract_date_field(hour, "dt", metrics)
         return value
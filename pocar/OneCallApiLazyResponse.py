@@ -0,0 +1,172 @@
+"""This module provides a One Call Api response decoding each of its sections on first access."""
+import json
+import logging
+from collections.abc import Mapping
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The keys of the sections of One Call Api response, as found in the response body, in the order they are sent
+_SECTION_KEYS = {name: f'"{name}"'.encode() for name in ("current", "minutely", "hourly", "daily", "alerts")}
+
+# The white spaces and separators around a value in the response body
+_SPACES = (b" ", b"\t", b"\r", b"\n")
+_SEPARATORS = b" \t\r\n,"
+
+
+class OneCallApiLazyResponse(Mapping):
+    """
+    Class to hold a One Call Api response as the bytes received, decoding each section on first access.
+
+    | On construction, the response body is scanned for the sections keys, and only the head of the response
+    | (`lat`, `lon`, `timezone`, `timezone_offset`) is decoded.
+    | A section (`current`, `minutely`, `hourly`, `daily`, `alerts`) is decoded on its first access, and kept:
+    | it is decoded once, and the same object is returned by the following accesses.
+    | If the body can not be split into sections, e.g. the sections are not in the order they are sent
+    | by OpenWeatherMap or a key unknown to this class follows a section, the whole body is decoded,
+    | once, as it is without this class.
+    | The response is read as a dictionary, it can not be modified.
+
+    :param content: The response body
+    :type content: bytes
+
+    :param decode: The function decoding JSON from bytes, e.g.
+        :meth:`~pocar.OneCallApiDecoder.OneCallApiDecoder.decode`
+    :type decode: callable, optional
+
+    :raises ValueError: if the head of the body is not valid JSON
+    """
+
+    __slots__ = ("_content", "_decode", "_head", "_spans", "_sections")
+
+    def __init__(self, content, decode=json.loads):
+        """This is the constructor method."""
+        self._content = content
+        self._decode = decode
+        self._sections = {}
+        self._spans = self.__split(content)
+        if not self._spans:
+            self._head, self._spans = decode(content), None
+        else:
+            start = min(span[0] for span in self._spans.values())
+            self._head = decode(content[:start].rstrip(_SEPARATORS) + b"}")
+
+    @staticmethod
+    def __find_key(content, key, start):
+        """Returns the start of the key and of its value, searched from start, `None` if not found."""
+        pos = content.find(key, start)
+        while pos >= 0:
+            value = pos + len(key)
+            while content.startswith(_SPACES, value):
+                value += 1
+            if content.startswith(b":", value):
+                return pos, value + 1
+            pos = content.find(key, pos + 1)
+        return None
+
+    @classmethod
+    def __split(cls, content):
+        """Returns the (start of key, start of value, end of value) of each section, `None` if not in order."""
+        found = {}
+        start = 0
+        for name, key in _SECTION_KEYS.items():
+            span = cls.__find_key(content, key, start)
+            if span is not None:
+                found[name] = span
+                start = span[1]
+            elif cls.__find_key(content, key, 0) is not None:
+                # The sections are not in the order of One Call Api responses
+                return None
+        names = list(found)
+        spans = {}
+        for idx, name in enumerate(names):
+            if idx + 1 < len(names):
+                end = cls.__value_end(content, found[names[idx + 1]][0])
+            else:
+                end = cls.__value_end(content, len(content))
+                if not content.endswith(b"}", 0, end):
+                    return None
+                end = cls.__value_end(content, end - 1)
+            spans[name] = (found[name][0], found[name][1], end)
+        return spans
+
+    @staticmethod
+    def __value_end(content, end):
+        """Returns the end of the value preceding end, skipping white spaces and separators, without copy."""
+        while end > 0 and content[end - 1] in _SEPARATORS:
+            end -= 1
+        return end
+
+    @property
+    def content(self):
+        """The getter for attribute :attr:`content`, the response body."""
+        return self._content
+
+    def decoded(self):
+        """
+        | The decoded method.
+
+        :return: The sections decoded so far
+        :rtype: list of str
+        """
+        return list(self._sections)
+
+    def replace(self, key, value):
+        """
+        | The replace method.
+
+        | Returns a copy of the response with the value of the key replaced, without decoding any section:
+        | the copy shares the body and the sections decoded so far, and the response is left as it is.
+
+        :param key: The key, e.g. "daily"
+        :type key: str
+
+        :param value: The new value for the key
+        :type value: object
+
+        :return: The copy of the response
+        :rtype: :class:`~pocar.OneCallApiLazyResponse.OneCallApiLazyResponse`
+        """
+        # pylint: disable=protected-access
+        copy = self.__class__.__new__(self.__class__)
+        copy._content, copy._decode = self._content, self._decode
+        copy._head, copy._sections = self._head, dict(self._sections)
+        copy._spans = dict(self._spans) if self._spans is not None else None
+        if copy._spans is not None and key in copy._spans:
+            copy._sections[key] = value
+        else:
+            copy._head = dict(self._head)
+            copy._head[key] = value
+        return copy
+
+    def __getitem__(self, key):
+        """Returns the value for the key, decoding the section on its first access."""
+        if key in self._head:
+            return self._head[key]
+        if self._spans is None or key not in self._spans:
+            raise KeyError(key)
+        section = self._sections.get(key)
+        if section is None:
+            _, start, end = self._spans[key]
+            try:
+                section = self._decode(self._content[start:end])
+            except ValueError:
+                logger.debug("Section %s can not be decoded alone, decoding the whole response", key)
+                self._head, self._spans = self._decode(self._content), None
+                return self._head[key]
+            self._sections[key] = section
+        return section
+
+    def __contains__(self, key):
+        """Returns `True` if the response holds the key, without decoding its section."""
+        return key in self._head or (self._spans is not None and key in self._spans)
+
+    def __iter__(self):
+        """Returns an iterator over the keys of the response, without decoding the sections."""
+        yield from self._head
+        if self._spans is not None:
+            yield from self._spans
+
+    def __len__(self):
+        """Returns the number of keys of the response."""
+        return len(self._head) + (len(self._spans) if self._spans is not None else 0)
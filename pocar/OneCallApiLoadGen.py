@@ -0,0 +1,258 @@
+"""This module provides a load generator running One Call Api objects against the local stub server."""
+import argparse
+import asyncio
+import logging
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pocar import AsyncOneCallApi
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+from pocar.OneCallApiRateLimiter import OneCallApiRateLimiter
+from pocar.OneCallApiRetry import OneCallApiRetry
+from pocar.OneCallApiSession import OneCallApiSession
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The API key of the load, accepted by the stub server
+KEY = "0123456789abcdef0123456789abcdef"
+
+# The One Call Api classes the load can be run with
+CLASSES = {
+    "alerts": OneCallApiAlerts,
+    "combined": OneCallApiCombined,
+    "current": OneCallApiCurrent,
+    "daily": OneCallApiDaily,
+    "hourly": OneCallApiHourly,
+    "minutely": OneCallApiMinutely,
+}
+
+
+def percentile(values, pct):
+    """
+    | The percentile function.
+
+    | Returns the nearest-rank percentile of the values: the smallest value greater or equal to
+    | `pct` percent of the values.
+
+    :param values: The values, sorted
+    :type values: list of float
+
+    :param pct: The percentile, in ]0, 100]
+    :type pct: float
+
+    :return: The percentile, `None` if there is no value
+    :rtype: float
+    """
+    if not values:
+        return None
+    return values[min(max(math.ceil(pct / 100.0 * len(values)), 1), len(values)) - 1]
+
+
+def _async_class(name):
+    """Returns the asyncio class of a load class name."""
+    cls = getattr(AsyncOneCallApi, f"AsyncOneCallApi{name.capitalize()}", None)
+    if cls is None:
+        raise ValueError(f"The '{name}' class has no asyncio variant")
+    return cls
+
+
+def _run_threads(objects, requests, concurrency):
+    """Runs the requests with a pool of threads, returns the latency and outcome of each one."""
+
+    def call(idx):
+        start = time.perf_counter()
+        try:
+            done = objects[idx % len(objects)].update_data()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.debug("Request %s failed: %r", idx, err)
+            done = False
+        return time.perf_counter() - start, done
+
+    with ThreadPoolExecutor(concurrency, thread_name_prefix="pocar-loadgen") as executor:
+        return list(executor.map(call, range(requests)))
+
+
+async def _run_tasks(objects, requests, concurrency):
+    """Runs the requests as asyncio tasks, returns the latency and outcome of each one."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(idx):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                done = await objects[idx % len(objects)].update_data()
+            except Exception as err:  # pylint: disable=broad-except
+                logger.debug("Request %s failed: %r", idx, err)
+                done = False
+            return time.perf_counter() - start, done
+
+    try:
+        return list(await asyncio.gather(*(call(idx) for idx in range(requests))))
+    finally:
+        await AsyncOneCallApi.AsyncOneCallApiSession.shared().close()
+
+
+def run_load(
+    url, cls="hourly", *, locations=100, requests=1000, concurrency=10, use_async=False
+):  # pylint: disable=too-many-arguments
+    """
+    | The run_load function.
+
+    | Runs `requests` calls to `update_data`, spread over `locations` objects of class `cls`,
+    | with up to `concurrency` calls in flight, against the One Call Api endpoint `url`,
+    | and returns the measured throughput and latency.
+    | The objects are blocking objects run by a pool of threads, or asyncio objects with `use_async`.
+    | :attr:`~pocar.OneCallApi.OneCallApi.base_url` is set to `url` during the load.
+
+    :param url: The One Call Api endpoint, e.g. :attr:`~pocar.OneCallApiStubServer.OneCallApiStubServer.url`
+    :type url: str
+
+    :param cls: The name of the One Call Api class, a key of :data:`CLASSES`
+    :type cls: str, optional
+
+    :param locations: The number of locations
+    :type locations: int, optional
+
+    :param requests: The number of calls to `update_data`
+    :type requests: int, optional
+
+    :param concurrency: The maximum number of calls in flight
+    :type concurrency: int, optional
+
+    :param use_async: Run asyncio objects, see :mod:`~pocar.AsyncOneCallApi`
+    :type use_async: bool, optional
+
+    :return: The results: requests, ok, failed, elapsed (seconds), throughput (calls per second),
+        and the p50, p95 and p99 latencies (seconds)
+    :rtype: dict
+    """
+    if cls not in CLASSES:
+        raise ValueError(f"The 'cls' argument must be one of: {', '.join(sorted(CLASSES))}")
+    if min(locations, requests, concurrency) < 1:
+        raise ValueError("The 'locations', 'requests' and 'concurrency' arguments must be greater than 0")
+    factory = _async_class(cls) if use_async else CLASSES[cls]
+    previous_url, OneCallApi.base_url = OneCallApi.base_url, url
+    try:
+        # the objects build their request URL from base_url
+        objects = [factory(round(45.0 + idx * 0.01, 4), round(1.0 + idx * 0.01, 4), KEY) for idx in range(locations)]
+        start = time.perf_counter()
+        if use_async:
+            results = asyncio.run(_run_tasks(objects, requests, concurrency))
+        else:
+            results = _run_threads(objects, requests, concurrency)
+        elapsed = time.perf_counter() - start
+    finally:
+        OneCallApi.base_url = previous_url
+    latencies = sorted(latency for latency, _ in results)
+    ok = sum(1 for _, done in results if done is True)
+    return {
+        "requests": requests,
+        "ok": ok,
+        "failed": requests - ok,
+        "elapsed": elapsed,
+        "throughput": requests / elapsed,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
+
+
+def _parser():
+    """Returns the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="pocar-loadgen",
+        description="Runs One Call Api objects against a local stub server, and reports throughput and latency.",
+    )
+    parser.add_argument("--class", dest="cls", choices=sorted(CLASSES), default="hourly", help="One Call Api class")
+    parser.add_argument("--locations", type=int, default=100, help="number of locations")
+    parser.add_argument("--requests", type=int, default=1000, help="number of update_data calls")
+    parser.add_argument("--concurrency", type=int, default=10, help="maximum number of calls in flight")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="run asyncio objects")
+    parser.add_argument("--latency", type=float, default=0.0, help="server latency, in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--hours", type=int, default=48, help="hourly entries per response")
+    parser.add_argument("--days", type=int, default=8, help="daily entries per response")
+    parser.add_argument("--retry", type=int, default=0, help="attempts per request with a retry policy, 0 for none")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="requests per second allowed, 0 for no limit")
+    parser.add_argument(
+        "--log-level", default="CRITICAL", help="level of the log, failed requests are logged as errors"
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    | The main function.
+
+    | Entry point of the `pocar-loadgen` command: starts a stub server on localhost, with the latency,
+    | error rate, throttle rate and response size given, runs the load against it, and writes the results.
+    | The settings of :class:`~pocar.OneCallApi.OneCallApi` changed for the load are restored once it is done.
+    | An asyncio load (`--async`) of a class without asyncio variant, e.g. `combined`, is a usage error.
+
+    :param argv: The command line arguments, `sys.argv[1:]` if `None`
+    :type argv: list of str, optional
+
+    :return: The results of the load, see :func:`run_load`
+    :rtype: dict
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.use_async:
+        try:
+            _async_class(args.cls)
+        except ValueError as err:
+            parser.error(str(err))
+    logging.basicConfig(level=args.log_level.upper())
+    previous = (OneCallApi.session, OneCallApi.retry, OneCallApi.rate_limiter)
+    session = None
+    if not args.use_async:
+        session = OneCallApi.session = OneCallApiSession(pool_maxsize=max(args.concurrency, 1))
+    if args.retry > 0:
+        OneCallApi.retry = OneCallApiRetry(args.retry, backoff=0.05, max_backoff=1.0)
+    if args.rate_limit > 0:
+        OneCallApi.rate_limiter = OneCallApiRateLimiter(args.rate_limit, per=1.0)
+    server = OneCallApiStubServer(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        hours=args.hours,
+        days=args.days,
+    )
+    try:
+        with server:
+            results = run_load(
+                server.url,
+                args.cls,
+                locations=args.locations,
+                requests=args.requests,
+                concurrency=args.concurrency,
+                use_async=args.use_async,
+            )
+            statuses = dict(sorted(server.statuses.items()))
+    finally:
+        OneCallApi.session, OneCallApi.retry, OneCallApi.rate_limiter = previous
+        if session is not None:
+            session.close()
+    mode = "asyncio" if args.use_async else "threads"
+    sys.stdout.write(f"{args.cls} x {args.locations} locations, {mode}, concurrency {args.concurrency}\n")
+    sys.stdout.write(f"requests    {results['requests']:>10} ok {results['ok']}, failed {results['failed']}\n")
+    sys.stdout.write(f"throughput  {results['throughput']:>10.1f} /s in {results['elapsed']:.2f} s\n")
+    for name in ("p50", "p95", "p99"):
+        sys.stdout.write(f"{name:<12}{results[name] * 1000.0:>10.2f} ms\n")
+    sys.stdout.write(f"statuses    {statuses}\n")
+    return dict(results, statuses=statuses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,525 @@
+"""This module provides metrics of One Call Api calls: an in-memory registry, and an OpenMetrics exporter."""
+import bisect
+import contextvars
+import logging
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connection import HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, installed with extra "async"
+    aiohttp = None
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The metrics of One Call Api calls, counters are exposed with the suffix "_total"
+REQUESTS = "pocar_requests"
+RESPONSES = "pocar_responses"
+RECEIVED_BYTES = "pocar_received_bytes"
+CACHE_LOOKUPS = "pocar_cache_lookups"
+REQUEST_SECONDS = "pocar_request_seconds"
+DNS_SECONDS = "pocar_dns_seconds"
+CONNECT_SECONDS = "pocar_connect_seconds"
+TLS_SECONDS = "pocar_tls_seconds"
+DECODE_SECONDS = "pocar_decode_seconds"
+
+# The description of each metric, exported as HELP
+HELP = {
+    REQUESTS: "One Call Api calls, by outcome: ok, rejected by the circuit breaker, or the error class",
+    RESPONSES: "One Call Api responses, by HTTP status code",
+    RECEIVED_BYTES: "Bytes of the One Call Api responses decoded",
+    CACHE_LOOKUPS: "One Call Api cache lookups, by result: hit or miss",
+    REQUEST_SECONDS: "Duration of the One Call Api calls, waits and retries included",
+    DNS_SECONDS: "Duration of the host name resolutions of new connections",
+    CONNECT_SECONDS: "Duration of the TCP handshakes of new connections",
+    TLS_SECONDS: "Duration of the TLS handshakes of new connections",
+    DECODE_SECONDS: "Duration of the decoding of the One Call Api responses",
+}
+
+# The upper bounds, in seconds, of the histogram buckets, from decoding times to slow calls
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# The measures of the One Call Api call in progress, in the current thread or task, None when not measured
+_CALL = contextvars.ContextVar("pocar_call", default=None)
+
+
+def start_call():
+    """
+    | The start_call function.
+
+    | Starts measuring a One Call Api call in the current thread or asyncio task: the connections made,
+    | the status and the body received until :func:`report_call` are measured for it.
+
+    :return: The measures of the call, filled while it is made
+    :rtype: dict
+    """
+    call = {"start": time.perf_counter()}
+    _CALL.set(call)
+    return call
+
+
+def note(key, value):
+    """
+    | The note function.
+
+    | Adds a measure to the call in progress, if measured: durations and sizes are summed over the attempts,
+    | the status is replaced by the last one.
+
+    :param key: The measure: "dns", "connect", "tls", "decode", "bytes" or "status"
+    :type key: str
+
+    :param value: The value measured
+    :type value: float or int
+    """
+    call = _CALL.get()
+    if call is None:
+        return
+    if key == "status":
+        call[key] = value
+    else:
+        call[key] = call.get(key, 0) + value
+
+
+def decode_measured(decode, content):
+    """
+    | The decode_measured function.
+
+    | Returns `decode(content)`, noting the size of the content and the decoding time to the call in progress.
+
+    :param decode: The function decoding the response body
+    :type decode: callable
+
+    :param content: The response body
+    :type content: bytes
+
+    :return: The decoded response
+    """
+    start = time.perf_counter()
+    rawdata = decode(content)
+    note("decode", time.perf_counter() - start)
+    note("bytes", len(content))
+    return rawdata
+
+
+def report_call(sink, error=None):
+    """
+    | The report_call function.
+
+    | Reports the call in progress to a metrics sink, and ends its measure.
+
+    :param sink: The metrics sink, e.g. :class:`OneCallApiMetrics`
+    :type sink: object with `inc` and `observe` methods
+
+    :param error: The error raised by the call, `None` if it succeeded
+    :type error: Exception, optional
+    """
+    call = _CALL.get() or {}
+    _CALL.set(None)
+    sink.inc(REQUESTS, outcome="ok" if error is None else type(error).__name__)
+    status = call.get("status")
+    if status is None and error is not None:
+        status = getattr(getattr(error, "response", None), "status_code", None) or getattr(error, "status", None)
+    if isinstance(status, int):
+        sink.inc(RESPONSES, status=str(status))
+    if "start" in call:
+        sink.observe(REQUEST_SECONDS, time.perf_counter() - call["start"])
+    for name, key in ((DNS_SECONDS, "dns"), (CONNECT_SECONDS, "connect"), (TLS_SECONDS, "tls")):
+        if key in call:
+            sink.observe(name, call[key])
+    if "decode" in call:
+        sink.observe(DECODE_SECONDS, call["decode"])
+        sink.inc(RECEIVED_BYTES, call["bytes"])
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTP connection noting the name resolution and TCP handshake times of the call being measured."""
+
+    def _new_conn(self):
+        """Resolves the host, then connects to its addresses in turn, as urllib3 does, timing each step."""
+        if _CALL.get() is None:
+            return super()._new_conn()
+        start = time.perf_counter()
+        try:
+            infos = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except OSError:
+            return super()._new_conn()  # raises the resolution error of urllib3
+        resolved = time.perf_counter()
+        note("dns", resolved - start)
+        host, error = self._dns_host, None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in infos):
+                self._dns_host = address  # pylint: disable=attribute-defined-outside-init
+                try:
+                    sock = super()._new_conn()
+                except ConnectTimeoutError as err:  # NewConnectionError included
+                    error = err
+                    continue
+                note("connect", time.perf_counter() - resolved)
+                return sock
+        finally:
+            self._dns_host = host  # pylint: disable=attribute-defined-outside-init
+        if error is None:
+            return super()._new_conn()  # no address resolved, urllib3 raises its error
+        raise error
+
+
+class _TimedHTTPSConnection(HTTPSConnection, _TimedHTTPConnection):
+    """HTTPS connection also noting the TLS handshake time of the call being measured."""
+
+    def connect(self):
+        """Connects, the TLS handshake time is the connection time minus the resolution and TCP handshake."""
+        call = _CALL.get()
+        if call is None:
+            return super().connect()
+        before = call.get("dns", 0.0) + call.get("connect", 0.0)
+        start = time.perf_counter()
+        super().connect()
+        note("tls", time.perf_counter() - start - (call.get("dns", 0.0) + call.get("connect", 0.0) - before))
+        return None
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP connection pool of timed connections."""
+
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool of timed connections."""
+
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class OneCallApiTimedAdapter(HTTPAdapter):
+    """
+    Class to time the new connections of a `requests` session, for the calls measured by :func:`start_call`.
+
+    | It is the adapter of :class:`~pocar.OneCallApiSession.OneCallApiSession`.
+    | A connection made for a measured call notes its name resolution, TCP and TLS handshake times,
+    | a connection made otherwise is made as by `requests.adapters.HTTPAdapter`, without measure.
+    | Connections through a proxy are not timed.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Creates the pool manager, with pools of timed connections."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TimedHTTPConnectionPool, "https": _TimedHTTPSConnectionPool}
+
+
+async def _on_dns_start(session, context, params):  # pylint: disable=unused-argument
+    """Notes the start of a name resolution of aiohttp."""
+    context.dns_start = time.perf_counter()
+
+
+async def _on_dns_end(session, context, params):  # pylint: disable=unused-argument
+    """Notes the duration of a name resolution of aiohttp."""
+    note("dns", time.perf_counter() - context.dns_start)
+
+
+async def _on_connection_start(session, context, params):  # pylint: disable=unused-argument
+    """Notes the start of a new connection of aiohttp."""
+    call = _CALL.get()
+    context.connection_dns = call.get("dns", 0.0) if call is not None else 0.0
+    context.connection_start = time.perf_counter()
+
+
+async def _on_connection_end(session, context, params):  # pylint: disable=unused-argument
+    """Notes the duration of a new connection of aiohttp, its name resolution excluded."""
+    call = _CALL.get()
+    if call is not None:
+        resolution = call.get("dns", 0.0) - context.connection_dns
+        note("connect", time.perf_counter() - context.connection_start - resolution)
+
+
+async def _on_request_end(session, context, params):  # pylint: disable=unused-argument
+    """Notes the HTTP status of a response of aiohttp."""
+    note("status", params.response.status)
+
+
+def trace_config():
+    """
+    | The trace_config function.
+
+    | Returns the aiohttp trace configuration noting the name resolution and connection times,
+    | TLS handshake included, and the HTTP status, of the calls measured by :func:`start_call`.
+    | It is set on the sessions of :class:`~pocar.AsyncOneCallApi.AsyncOneCallApiSession`.
+
+    :return: The trace configuration
+    :rtype: aiohttp.TraceConfig
+    """
+    config = aiohttp.TraceConfig()
+    config.on_dns_resolvehost_start.append(_on_dns_start)
+    config.on_dns_resolvehost_end.append(_on_dns_end)
+    config.on_connection_create_start.append(_on_connection_start)
+    config.on_connection_create_end.append(_on_connection_end)
+    config.on_request_end.append(_on_request_end)
+    return config
+
+
+class OneCallApiMetrics:
+    """
+    Class to hold the metrics of One Call Api calls in memory.
+
+    | It is the default sink of :attr:`~pocar.OneCallApi.OneCallApi.metrics`: when set, each call
+    | of :meth:`~pocar.OneCallApi.OneCallApi.update_data` reports the metrics named by the constants of
+    | this module, e.g. :data:`REQUESTS` by outcome, :data:`RESPONSES` by HTTP status, and the histograms
+    | of latency, total and per step: DNS, TCP and TLS handshakes of new connections, decoding.
+    | Any object with the methods :meth:`inc` and :meth:`observe` can be a sink instead,
+    | e.g. to forward the metrics to another metrics library.
+    | The metrics are exported as OpenMetrics text by :meth:`openmetrics`, served by
+    | :class:`OneCallApiMetricsExporter`. Without sink, no measure is taken.
+
+    :param buckets: The upper bounds, in seconds, of the histogram buckets
+    :type buckets: tuple of float, optional
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        """This is the constructor method."""
+        if not buckets or list(buckets) != sorted(set(buckets)):
+            raise ValueError("The 'buckets' argument must hold increasing upper bounds")
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        """
+        | The inc method.
+
+        | Increments a counter.
+
+        :param name: The metric name, e.g. :data:`REQUESTS`
+        :type name: str
+
+        :param value: The increment
+        :type value: int or float, optional
+
+        :param labels: The labels of the counter, e.g. `outcome="ok"`
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        """
+        | The observe method.
+
+        | Adds a value to a histogram.
+
+        :param name: The metric name, e.g. :data:`REQUEST_SECONDS`
+        :type name: str
+
+        :param value: The value observed, in seconds
+        :type value: float
+
+        :param labels: The labels of the histogram
+        """
+        key = (name, tuple(sorted(labels.items())))
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self._buckets) + 1) + [0.0]
+            histogram[index] += 1
+            histogram[-1] += value
+
+    def counter(self, name, **labels):
+        """
+        | The counter method.
+
+        :return: The value of a counter, 0 if never incremented
+        :rtype: int or float
+        """
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def histogram(self, name, **labels):
+        """
+        | The histogram method.
+
+        | Returns a histogram, as a dictionary: count, sum, and buckets, the cumulative counts
+        | as a list of (upper bound, count), the last bound being infinity.
+
+        :return: The histogram, `None` if never observed
+        :rtype: dict
+        """
+        with self._lock:
+            histogram = self._histograms.get((name, tuple(sorted(labels.items()))))
+            if histogram is None:
+                return None
+            counts, total = histogram[:-1], histogram[-1]
+        cumulative, buckets = 0, []
+        for bound, count in zip(self._buckets + (float("inf"),), counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {"count": cumulative, "sum": total, "buckets": buckets}
+
+    def cache_hit_ratio(self):
+        """
+        | The cache_hit_ratio method.
+
+        :return: The share of cache lookups that were hits, `None` without lookup
+        :rtype: float
+        """
+        hits, misses = self.counter(CACHE_LOOKUPS, result="hit"), self.counter(CACHE_LOOKUPS, result="miss")
+        return hits / (hits + misses) if hits + misses else None
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns a summary of the metrics, as a dictionary: requests, failures (calls that did not succeed,
+        | rejected ones included), received_bytes and cache_hit_ratio.
+
+        :return: Metrics summary
+        :rtype: dict
+        """
+        with self._lock:
+            outcomes = {
+                dict(labels).get("outcome"): value
+                for (name, labels), value in self._counters.items()
+                if name == REQUESTS
+            }
+        requests = sum(outcomes.values())
+        return {
+            "requests": requests,
+            "failures": requests - outcomes.get("ok", 0),
+            "received_bytes": self.counter(RECEIVED_BYTES),
+            "cache_hit_ratio": self.cache_hit_ratio(),
+        }
+
+    def reset(self):
+        """
+        | The reset method.
+
+        | Clears all metrics.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    @staticmethod
+    def __labels(labels, extra=()):
+        """Returns labels in the OpenMetrics text format, e.g. `{outcome="ok"}`."""
+        pairs = [f'{name}="{value}"' for name, value in tuple(labels) + tuple(extra)]
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def openmetrics(self):
+        """
+        | The openmetrics method.
+
+        | Returns the metrics in the OpenMetrics text format, read by Prometheus.
+
+        :return: The metrics exposition
+        :rtype: str
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms)
+        lines, declared = [], set()
+        for (name, labels), value in counters:
+            if name not in declared:
+                declared.add(name)
+                lines += [f"# TYPE {name} counter", f"# HELP {name} {HELP.get(name, name)}"]
+            lines.append(f"{name}_total{self.__labels(labels)} {value}")
+        for name, labels in histograms:
+            if name not in declared:
+                declared.add(name)
+                lines += [f"# TYPE {name} histogram", f"# HELP {name} {HELP.get(name, name)}"]
+            histogram = self.histogram(name, **dict(labels))
+            for bound, count in histogram["buckets"]:
+                bound = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{name}_bucket{self.__labels(labels, (('le', bound),))} {count}")
+            lines.append(f"{name}_count{self.__labels(labels)} {histogram['count']}")
+            lines.append(f"{name}_sum{self.__labels(labels)} {histogram['sum']}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+class _OneCallApiMetricsHandler(BaseHTTPRequestHandler):
+    """Request handler answering GET requests with the metrics."""
+
+    def do_GET(self):
+        """Answers with the metrics of the exporter registry."""
+        body = self.server.registry.openmetrics().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Routes the server access log to the module logger."""
+        logger.debug(format, *args)
+
+
+class OneCallApiMetricsExporter(ThreadingHTTPServer):
+    """
+    Class to serve the metrics of a registry over HTTP, in the OpenMetrics text format, for Prometheus.
+
+    | The server runs in a background thread and binds to localhost by default,
+    | any path answers the metrics, e.g. `http://127.0.0.1:9464/metrics`.
+
+    :param registry: The metrics registry served
+    :type registry: :class:`OneCallApiMetrics`
+
+    :param port: The TCP port to listen to, any free port if 0
+    :type port: int, optional
+
+    :param host: The address to listen to
+    :type host: str, optional
+    """
+
+    daemon_threads = True
+
+    def __init__(self, registry, port=9464, host="127.0.0.1"):
+        """This is the constructor method."""
+        super().__init__((host, port), _OneCallApiMetricsHandler)
+        self.registry = registry
+        self._thread = None
+
+    @property
+    def url(self):
+        """The URL of the metrics served by this server."""
+        return f"http://{self.server_address[0]}:{self.server_port}/metrics"
+
+    def start(self):
+        """
+        | The start method.
+
+        | Starts serving the metrics in a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, name="pocar-metrics", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        | The stop method.
+
+        | Stops serving the metrics and closes the listening socket.
+        """
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        """Starts the server when entering a with block."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stops the server when leaving a with block."""
+        self.stop()
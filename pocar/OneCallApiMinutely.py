@@ -1,6 +1,5 @@
 """This module provides a base class to handle One Call Api response from OpenWeatherMap."""
 import logging
-from datetime import datetime
 
 import requests
 
@@ -17,6 +16,9 @@ requests.packages.urllib3.disable_warnings()
 # Set local logger to the root logger, to inherit root settings
 logger = logging.getLogger(__name__)
 
+# The numeric fields of Minutely entries held as columns, with their array typecode
+MINUTELY_COLUMNS = {"dt": "q", "precipitation": "d"}
+
 
 # Derived Class to handle Minutely weather data API response
 # Minutely holds the precipitation forecast for the next hour in a minutely basis
@@ -28,6 +30,18 @@ class OneCallApiMinutely(OneCallApi):
         """This is the constructor method."""
         super().__init__(lat, lon, key, "current,daily,hourly,alerts")
 
+    def columns(self):
+        """
+        | The columns method.
+
+        | Returns the numeric fields of the Minutely section as columns, see :data:`MINUTELY_COLUMNS`.
+        | The columns are built once per response, on first use, and rebuilt when the response changes.
+
+        :return: The Minutely columns, holding no entry if the response holds no Minutely section
+        :rtype: :class:`~pocar.OneCallApiColumns.OneCallApiColumns`
+        """
+        return self._columns("minutely", MINUTELY_COLUMNS)
+
     def __is_data_available(self, minute, field):
         """TBD."""
         value = False
@@ -40,19 +54,11 @@ class OneCallApiMinutely(OneCallApi):
         value = "N/A"
         if self.__is_data_available(minute, field) is True:
             if metrics == 0:
-                dt = datetime.fromtimestamp(self._rawdata["minutely"][minute][field])
-                value = f"{dt:%Y-%m-%d %H:%M:%S}"
+                value = self._format_time(self._rawdata["minutely"][minute][field])
             else:
                 value = self._rawdata["minutely"][minute][field]
-        logger.debug("Value for %s is: %s", field, value)
-        return value
-
-    def __extract_value_field(self, minute, field):
-        """TBD."""
-        value = "N/A"
-        if self.__is_data_available(minute, field) is True:
-            value = self._rawdata["minutely"][minute][field]
-        logger.debug("Value for %s is: %s", field, value)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", field, value)
         return value
 
     def raw_data_minutely(self):
@@ -66,22 +72,30 @@ class OneCallApiMinutely(OneCallApi):
         """TBD."""
         if minute < 0 or minute > 60:
             raise ValueError("The 'minute' argument must be within range [0, 60]")
-        if all_values is True:
-            value = [0] * 61  # Initialize the 61 precipitation values
-            for idx in range(61):
-                value[idx] = self.__extract_value_field(idx, "precipitation")
+        columns = self.columns()
+        if all_values is True and self.numpy_series:
+            value = columns.array("precipitation", 61)
+        elif all_values is True:
+            value = columns.values("precipitation", 61)
         else:
-            value = self.__extract_value_field(minute, "precipitation")
+            value = columns.value("precipitation", minute)
+        if self.trace_access:
+            logger.debug("Value for %s is: %s", "precipitation", value)
         return value
 
     def data_time(self, minute=0, metrics=0, all_values=False):
         """TBD."""
         if minute < 0 or minute > 60:
             raise ValueError("The 'minute' argument must be within range [0, 60]")
-        if all_values is True:
-            value = [0] * 61  # Initialize the 61 data time values
-            for idx in range(61):
-                value[idx] = self.__extract_date_field(idx, "dt", metrics)
+        if all_values is True and self.numpy_series:
+            value = self.columns().datetimes("dt", 61)
+        elif all_values is True:
+            if metrics == 0:
+                value = self._format_times(self.columns(), "dt", 61)
+            else:
+                value = self.columns().values("dt", 61)
+            if self.trace_access:
+                logger.debug("Value for %s is: %s", "dt", value)
         else:
             value = self.__extract_date_field(minute, "dt", metrics)
         return value
@@ -0,0 +1,187 @@
+"""This module provides a token bucket limiting the rate of One Call Api requests, within and across processes."""
+import asyncio
+import logging
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # fcntl is not available on Windows, the limiter is then process-wide only
+    fcntl = None
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The state of a bucket shared through a file: tokens available, time they were counted
+_STATE = struct.Struct("<dd")
+
+
+class OneCallApiRateLimiter:
+    """
+    Class to keep One Call Api requests within a call budget, e.g. 60 calls per minute.
+
+    | The limiter is a token bucket: it holds up to `burst` tokens, refilled at `rate` tokens per `per` seconds,
+    | each request takes one token. When the bucket is empty, the request is queued, not failed: it takes
+    | a token in advance and waits until that token is refilled. Requests are served in the order they arrive.
+    | The limiter set to :attr:`~pocar.OneCallApi.OneCallApi.rate_limiter` is shared by all objects and threads
+    | of the process. With `path`, the bucket is kept in a file, locked on each request, and shared by
+    | all the processes of the host given the same path (not available on Windows), including processes
+    | forked after the limiter is created, which open the file again.
+    | The time spent waiting is measured, see :meth:`stats`.
+
+    :param rate: The number of requests allowed per `per` seconds
+    :type rate: float, greater than 0
+
+    :param per: The period, in seconds, of the budget
+    :type per: float, optional, greater than 0
+
+    :param burst: The number of requests allowed at once, `rate` if `None`
+    :type burst: int, optional, greater than 0
+
+    :param path: The file holding the bucket shared between processes, the bucket is in memory if `None`
+    :type path: str, optional
+    """
+
+    def __init__(self, rate, per=60.0, burst=None, path=None):
+        """This is the constructor method."""
+        if rate <= 0 or per <= 0:
+            raise ValueError("The 'rate' and 'per' arguments must be greater than 0")
+        if burst is None:
+            burst = max(int(rate), 1)
+        if burst < 1:
+            raise ValueError("The 'burst' argument must be greater than 0")
+        if path is not None and fcntl is None:
+            raise ImportError("OneCallApiRateLimiter shared through a file requires fcntl, not available here")
+        self._rate = rate
+        self._per = per
+        self._burst = burst
+        self._path = path
+        self._lock = threading.Lock()
+        self._state = (float(burst), time.time())
+        self._fd = None
+        self._pid = os.getpid()
+        if path is not None:
+            self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._stats = {"requests": 0, "delayed": 0, "wait_time": 0.0, "max_wait": 0.0}
+        logger.debug("Rate limiter: %s requests per %s s, burst %s, path %s", rate, per, burst, path)
+
+    def config(self):
+        """
+        | The config method.
+
+        | Returns a dictionary containing the configuration of the limiter.
+
+        :return: Configuration of the limiter
+        :rtype: dict
+        """
+        return {"rate": self._rate, "per": self._per, "burst": self._burst, "path": self._path}
+
+    def __file(self):
+        """Returns the descriptor of the file holding the bucket, opened again in a forked process, or `None`."""
+        # flock locks belong to the open file, a descriptor inherited through fork shares the lock of the parent
+        if self._fd is not None and self._pid != os.getpid():
+            os.close(self._fd)
+            self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._pid = os.getpid()
+        return self._fd
+
+    def __read(self):
+        """Returns the state of the bucket, from the file when shared, a full bucket if the file is new."""
+        if self._fd is None:
+            return self._state
+        data = os.pread(self._fd, _STATE.size, 0)
+        if len(data) < _STATE.size:
+            return (float(self._burst), time.time())
+        return _STATE.unpack(data)
+
+    def __write(self, state):
+        """Stores the state of the bucket, in the file when shared."""
+        if self._fd is None:
+            self._state = state
+        else:
+            os.pwrite(self._fd, _STATE.pack(*state), 0)
+
+    def reserve(self):
+        """
+        | The reserve method.
+
+        | Takes a token, in advance if the bucket is empty, without waiting.
+        | The caller must wait the returned delay before making its request, as :meth:`acquire` does.
+
+        :return: The delay, in seconds, before the token is available, 0 if available now
+        :rtype: float
+        """
+        with self._lock:
+            if self.__file() is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                tokens, counted = self.__read()
+                now = time.time()
+                # a clock set back must not remove tokens
+                tokens = min(self._burst, tokens + max(now - counted, 0.0) * self._rate / self._per) - 1.0
+                self.__write((tokens, now))
+            finally:
+                if self._fd is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+            wait = max(-tokens * self._per / self._rate, 0.0)
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["delayed"] += 1
+                self._stats["wait_time"] += wait
+                self._stats["max_wait"] = max(self._stats["max_wait"], wait)
+        return wait
+
+    def acquire(self):
+        """
+        | The acquire method.
+
+        | Waits until a request is allowed by the budget.
+
+        :return: The time waited, in seconds
+        :rtype: float
+        """
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug("Rate limited, waiting %.3f s", wait)
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """
+        | The acquire_async coroutine.
+
+        | Waits until a request is allowed by the budget, without blocking the event loop.
+
+        :return: The time waited, in seconds
+        :rtype: float
+        """
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug("Rate limited, waiting %.3f s", wait)
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the limiter counters of this process, as a dictionary: requests, delayed (requests that waited),
+        | wait_time (total time waited, in seconds) and max_wait (longest wait, in seconds).
+
+        :return: Limiter counters
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self):
+        """
+        | The close method.
+
+        | Closes the file holding the bucket, if shared.
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
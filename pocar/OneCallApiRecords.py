@@ -0,0 +1,191 @@
+"""This module provides compact record classes for the entries of One Call Api response."""
+import logging
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+class _OneCallApiRecord:
+    """
+    Base Class of the records: an entry of One Call Api response held in slots instead of a dictionary.
+
+    | Each slot holds the value of the field of the same name, `"N/A"` when the entry does not hold it.
+    | A slot can be read from a nested field, given by its path in :attr:`_paths`, e.g. `("rain", "1h")`,
+    | and can hold a nested record, given by its class in :attr:`_records`, that is an empty record
+    | (all its slots are `"N/A"`) when the entry does not hold it.
+    | The fields of the entry the slots do not hold as they are, e.g. a field unknown to the record
+    | or a `weather` list of more than one condition, are kept in :attr:`extra`, so that
+    | :meth:`as_dict` returns the entry the record was built from.
+    """
+
+    __slots__ = ("extra",)
+    _paths = {}
+    _records = {}
+
+    @classmethod
+    def from_dict(cls, entry):
+        """
+        | The from_dict method.
+
+        :param entry: The entry of One Call Api response
+        :type entry: dict
+
+        :return: The record of the entry
+        :rtype: :class:`_OneCallApiRecord`
+        """
+        record = cls.__new__(cls)
+        for name in cls.__slots__:
+            value = entry
+            for key in cls._paths.get(name, (name,)):
+                try:
+                    value = value[key]
+                except (KeyError, IndexError, TypeError):
+                    value = "N/A"
+                    break
+            if name in cls._records:
+                value = cls._records[name].from_dict(value if value != "N/A" else {})
+            setattr(record, name, value)
+        # pylint: disable=attribute-defined-outside-init
+        record.extra = {}
+        if entry and isinstance(entry, dict):
+            built = record.as_dict()
+            record.extra = {key: value for key, value in entry.items() if built.get(key, "N/A") != value}
+        return record
+
+    def as_dict(self):
+        """
+        | The as_dict method.
+
+        | Returns the record as the entry of One Call Api response it was built from,
+        | without the fields the entry did not hold.
+
+        :return: The entry of One Call Api response
+        :rtype: dict
+        """
+        data = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if isinstance(value, _OneCallApiRecord):
+                value = value.as_dict()
+                if not value:
+                    continue
+            elif value == "N/A":
+                continue
+            path = self._paths.get(name, (name,))
+            target = data
+            for key, next_key in zip(path, path[1:]):
+                target = target.setdefault(key, [] if isinstance(next_key, int) else {})
+            if isinstance(path[-1], int):
+                target.append(value)
+            else:
+                target[path[-1]] = value
+        data.update(self.extra)
+        return data
+
+    def get(self, field, default=None):
+        """
+        | The get method.
+
+        :param field: The slot name
+        :type field: str
+
+        :param default: The value returned if the record does not hold the field
+        :type default: object, optional
+
+        :return: The value of the field, `default` if the record does not hold it
+        :rtype: object
+        """
+        value = getattr(self, field, "N/A")
+        return default if value == "N/A" else value
+
+    def __eq__(self, other):
+        """Returns `True` if both records are of the same class and hold the same values."""
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.extra == other.extra and all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Returns the record class and values."""
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__ + ("extra",))
+        return f"{self.__class__.__name__}({values})"
+
+
+class OneCallApiWeatherRecord(_OneCallApiRecord):
+    """Class to hold the weather condition of an entry, the first one of its `weather` list."""
+
+    __slots__ = ("id", "main", "description", "icon")
+
+
+class OneCallApiTempRecord(_OneCallApiRecord):
+    """Class to hold the temperatures of a Daily entry, `temp` or `feels_like`, the latter has no min and max."""
+
+    __slots__ = ("day", "min", "max", "night", "eve", "morn")
+
+
+class OneCallApiCurrentRecord(_OneCallApiRecord):
+    """
+    Class to hold the Current section of One Call Api response.
+
+    | Slots `rain_1h` and `snow_1h` hold fields `rain.1h` and `snow.1h`,
+    | slot `weather` holds the first weather condition as :class:`OneCallApiWeatherRecord`,
+    | the whole `weather` list is kept in :attr:`extra` if it holds more than one condition.
+    """
+
+    __slots__ = (
+        "dt",
+        "sunrise",
+        "sunset",
+        "temp",
+        "feels_like",
+        "pressure",
+        "humidity",
+        "dew_point",
+        "uvi",
+        "clouds",
+        "visibility",
+        "wind_speed",
+        "wind_deg",
+        "wind_gust",
+        "rain_1h",
+        "snow_1h",
+        "weather",
+    )
+    _paths = {"rain_1h": ("rain", "1h"), "snow_1h": ("snow", "1h"), "weather": ("weather", 0)}
+    _records = {"weather": OneCallApiWeatherRecord}
+
+
+class OneCallApiDailyRecord(_OneCallApiRecord):
+    """
+    Class to hold an entry of the Daily section of One Call Api response.
+
+    | Slots `temp` and `feels_like` hold :class:`OneCallApiTempRecord`,
+    | slot `weather` holds the first weather condition as :class:`OneCallApiWeatherRecord`,
+    | the whole `weather` list is kept in :attr:`extra` if it holds more than one condition.
+    """
+
+    __slots__ = (
+        "dt",
+        "sunrise",
+        "sunset",
+        "moonrise",
+        "moonset",
+        "moon_phase",
+        "temp",
+        "feels_like",
+        "pressure",
+        "humidity",
+        "dew_point",
+        "wind_speed",
+        "wind_deg",
+        "wind_gust",
+        "clouds",
+        "pop",
+        "uvi",
+        "rain",
+        "snow",
+        "weather",
+    )
+    _paths = {"weather": ("weather", 0)}
+    _records = {"temp": OneCallApiTempRecord, "feels_like": OneCallApiTempRecord, "weather": OneCallApiWeatherRecord}
@@ -0,0 +1,315 @@
+"""This module provides a retry policy for One Call Api requests, with timeouts, backoff and a deadline."""
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency, installed with extra "async"
+    aiohttp = None
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The HTTP status codes of the responses worth retrying: rate limited, or a transient server error
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class OneCallApiRetry:
+    """
+    Class to retry One Call Api requests failing on a transient error.
+
+    | Each attempt is bounded by a connect timeout and a read timeout, all attempts by a deadline.
+    | An attempt is retried on a connection error, a timeout, or an HTTP status of :data:`RETRY_STATUSES`,
+    | after an exponential backoff with full jitter: a random delay in [0, min(max_backoff, backoff * 2^n)].
+    | A 429 (or 503) response carrying a `Retry-After` header is retried after the delay it asks for,
+    | unless it asks for more than `max_retry_after` seconds: the error is raised at once then.
+    | When the next attempt would not start before the deadline, the last error is raised: a caller
+    | waits at most `deadline` seconds, plus the read timeout of the attempt in flight.
+    | The latency and outcome of the last attempts are kept, see :meth:`latencies` and :meth:`stats`.
+    | A policy can be shared by many objects and threads, see :attr:`~pocar.OneCallApi.OneCallApi.retry`.
+    | All arguments but `attempts` are keyword only.
+
+    :param attempts: Maximum number of attempts per request, 1 disables retries
+    :type attempts: int, optional, greater than 0
+
+    :param connect_timeout: Time, in seconds, to establish the connection
+    :type connect_timeout: float, optional
+
+    :param read_timeout: Time, in seconds, to wait for data from the server
+    :type read_timeout: float, optional
+
+    :param backoff: Base delay, in seconds, before the first retry, doubled at each retry
+    :type backoff: float, optional
+
+    :param max_backoff: Maximum delay, in seconds, between two attempts
+    :type max_backoff: float, optional
+
+    :param max_retry_after: Maximum delay, in seconds, a `Retry-After` header can ask for
+    :type max_retry_after: float, optional
+
+    :param deadline: Time, in seconds, after which no attempt is started, no deadline if `None`
+    :type deadline: float, optional
+
+    :param jitter: Randomize the delays, to spread the retries of many clients
+    :type jitter: bool, optional
+
+    :param history: Number of attempts whose latency is kept
+    :type history: int, optional
+    """
+
+    def __init__(
+        self,
+        attempts=3,
+        *,
+        connect_timeout=3.05,
+        read_timeout=10.0,
+        backoff=0.5,
+        max_backoff=30.0,
+        max_retry_after=60.0,
+        deadline=30.0,
+        jitter=True,
+        history=1000,
+    ):  # pylint: disable=too-many-arguments
+        """This is the constructor method."""
+        if attempts < 1:
+            raise ValueError("The 'attempts' argument must be greater than 0")
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("The 'connect_timeout' and 'read_timeout' arguments must be greater than 0")
+        if backoff < 0 or max_backoff < 0 or max_retry_after < 0:
+            raise ValueError(
+                "The 'backoff', 'max_backoff' and 'max_retry_after' arguments must be greater or equal to 0"
+            )
+        if deadline is not None and deadline <= 0:
+            raise ValueError("The 'deadline' argument must be greater than 0")
+        self._attempts = attempts
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._max_retry_after = max_retry_after
+        self._deadline = deadline
+        self._jitter = jitter
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=history)
+        self._counters = {"requests": 0, "attempts": 0, "retries": 0, "failures": 0}
+
+    def config(self):
+        """
+        | The config method.
+
+        | Returns a dictionary containing the configuration of the policy.
+
+        :return: Configuration of the policy
+        :rtype: dict
+        """
+        return {
+            "attempts": self._attempts,
+            "connect_timeout": self._connect_timeout,
+            "read_timeout": self._read_timeout,
+            "backoff": self._backoff,
+            "max_backoff": self._max_backoff,
+            "max_retry_after": self._max_retry_after,
+            "deadline": self._deadline,
+            "jitter": self._jitter,
+        }
+
+    def timeout(self, remaining=None):
+        """
+        | The timeout method.
+
+        | Returns the timeouts of an attempt, as the tuple (connect, read) taken by `requests`,
+        | each one cut to the time remaining before the deadline.
+
+        :param remaining: Time, in seconds, remaining before the deadline, no limit if `None`
+        :type remaining: float, optional
+
+        :return: The connect and read timeouts, in seconds
+        :rtype: tuple
+        """
+        if remaining is None:
+            return (self._connect_timeout, self._read_timeout)
+        return (min(self._connect_timeout, remaining), min(self._read_timeout, remaining))
+
+    def delay(self, retry, retry_after=None):
+        """
+        | The delay method.
+
+        | Returns the delay before a retry: the `Retry-After` delay if the server gave one,
+        | cut to `max_retry_after`, the exponential backoff, with full jitter if enabled, otherwise.
+
+        :param retry: The retry number, 0 for the first retry
+        :type retry: int
+
+        :param retry_after: The delay, in seconds, asked by the server
+        :type retry_after: float, optional
+
+        :return: The delay, in seconds
+        :rtype: float
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self._max_retry_after)
+        delay = min(self._max_backoff, self._backoff * 2**retry)
+        if self._jitter:
+            delay = self._random.uniform(0.0, delay)
+        return delay
+
+    @staticmethod
+    def retry_after(headers):
+        """
+        | The retry_after method.
+
+        | Returns the delay asked by the `Retry-After` header, given in seconds or as an HTTP date.
+
+        :param headers: The headers of the HTTP response
+        :type headers: dict-like
+
+        :return: The delay, in seconds, `None` if the header is missing or invalid
+        :rtype: float
+        """
+        value = headers.get("Retry-After") if headers is not None else None
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+        try:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+        except (TypeError, ValueError):
+            logger.debug("Invalid Retry-After header: %s", value)
+            return None
+
+    def __classify(self, err):
+        """Returns the outcome of a failed attempt, if it is worth retrying, and the Retry-After delay."""
+        if isinstance(err, requests.exceptions.HTTPError) and err.response is not None:
+            status = err.response.status_code
+            return status, status in RETRY_STATUSES, self.retry_after(err.response.headers)
+        if aiohttp is not None and isinstance(err, aiohttp.ClientResponseError):
+            return err.status, err.status in RETRY_STATUSES, self.retry_after(err.headers)
+        retried = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, asyncio.TimeoutError)
+        if aiohttp is not None:
+            retried += (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+        return type(err).__name__, isinstance(err, retried), None
+
+    def __record(self, attempt, start, outcome):
+        """Keeps the latency and outcome of an attempt."""
+        with self._lock:
+            self._latencies.append((attempt, time.monotonic() - start, outcome))
+            self._counters["attempts"] += 1
+            self._counters["retries"] += attempt > 0
+
+    def __next_delay(self, attempt, err, start, deadline_at):
+        """Returns the delay before the next attempt, raises err if there is none."""
+        outcome, retried, retry_after = self.__classify(err)
+        self.__record(attempt, start, outcome)
+        if retry_after is not None and retry_after > self._max_retry_after:
+            logger.debug("Attempt %s failed (%s), Retry-After %.3f s is too long", attempt + 1, outcome, retry_after)
+            retried = False
+        if retried and attempt + 1 < self._attempts:
+            delay = self.delay(attempt, retry_after)
+            if deadline_at is None or time.monotonic() + delay < deadline_at:
+                logger.debug("Attempt %s failed (%s), retrying in %.3f s", attempt + 1, outcome, delay)
+                return delay
+        with self._lock:
+            self._counters["failures"] += 1
+        raise err
+
+    def __start(self):
+        """Counts a request, and returns the time of its deadline, `None` without deadline."""
+        with self._lock:
+            self._counters["requests"] += 1
+        return None if self._deadline is None else time.monotonic() + self._deadline
+
+    @staticmethod
+    def __remaining(deadline_at):
+        """Returns the time remaining before the deadline, `None` without deadline."""
+        if deadline_at is None:
+            return None
+        return max(deadline_at - time.monotonic(), 0.001)
+
+    def call(self, func):
+        """
+        | The call method.
+
+        | Returns the result of `func(timeout)`, retried as set by the policy.
+        | `func` performs one attempt with the given timeouts, and raises on failure, e.g. with
+        | `requests.Response.raise_for_status`.
+
+        :param func: The function performing one attempt, called with the (connect, read) timeouts
+        :type func: callable
+
+        :return: The result of `func(timeout)`
+        :raises Exception: the exception raised by the last attempt
+        """
+        deadline_at = self.__start()
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            try:
+                result = func(self.timeout(self.__remaining(deadline_at)))
+            except Exception as err:  # pylint: disable=broad-except
+                time.sleep(self.__next_delay(attempt, err, start, deadline_at))
+                attempt += 1
+            else:
+                self.__record(attempt, start, "ok")
+                return result
+
+    async def call_async(self, func):
+        """
+        | The call_async coroutine.
+
+        | Returns the result of `await func(timeout)`, retried as set by the policy, see :meth:`call`.
+
+        :param func: The coroutine function performing one attempt, called with the (connect, read) timeouts
+        :type func: callable
+
+        :return: The result of `await func(timeout)`
+        :raises Exception: the exception raised by the last attempt
+        """
+        deadline_at = self.__start()
+        attempt = 0
+        while True:
+            start = time.monotonic()
+            try:
+                result = await func(self.timeout(self.__remaining(deadline_at)))
+            except Exception as err:  # pylint: disable=broad-except
+                await asyncio.sleep(self.__next_delay(attempt, err, start, deadline_at))
+                attempt += 1
+            else:
+                self.__record(attempt, start, "ok")
+                return result
+
+    def latencies(self):
+        """
+        | The latencies method.
+
+        | Returns the last attempts, oldest first, as tuples (attempt, latency, outcome):
+        | the attempt number (0 for the first attempt of a request), its latency in seconds,
+        | and its outcome: "ok", the HTTP status code, or the name of the exception raised.
+
+        :return: The last attempts
+        :rtype: list of tuple
+        """
+        with self._lock:
+            return list(self._latencies)
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the policy counters, as a dictionary: requests, attempts, retries,
+        | and failures (requests that failed after their last attempt).
+
+        :return: Policy counters
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._counters)
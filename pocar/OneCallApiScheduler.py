@@ -0,0 +1,315 @@
+"""This module provides a scheduler refreshing many One Call Api objects in the background."""
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+# The refresh interval, in seconds, of each section of One Call Api response, about the update cadence of
+# OpenWeatherMap: minute forecast every minute, current weather and alerts every 10 minutes, and so on
+SECTION_INTERVALS = {"minutely": 60.0, "current": 600.0, "alerts": 600.0, "hourly": 3600.0, "daily": 10800.0}
+
+# The fractional part of the golden ratio, spreading the phases of any number of objects evenly over the period
+_GOLDEN = 0.6180339887498949
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    """Holds an object registered to the scheduler, with its interval, phase and priority."""
+
+    __slots__ = ("oca", "interval", "phase", "priority", "active")
+
+    def __init__(self, oca, interval, phase, priority):
+        """This is the constructor method."""
+        self.oca = oca
+        self.interval = interval
+        self.phase = phase
+        self.priority = priority
+        self.active = True
+
+    def next_slot(self, now):
+        """Returns the first time after now in the slots of the entry: phase + n * interval."""
+        delay = (self.phase - now) % self.interval
+        return now + (delay if delay > 0 else self.interval)
+
+
+class OneCallApiScheduler:
+    """
+    Class to refresh the One Call Api response of many objects, each one at the interval of its sections.
+
+    | An object is refreshed at the interval of the section it holds that is refreshed most often,
+    | see :data:`SECTION_INTERVALS`, e.g. every 10 minutes for
+    | :class:`~pocar.OneCallApiCurrent.OneCallApiCurrent`, every 3 hours for
+    | :class:`~pocar.OneCallApiDaily.OneCallApiDaily`, unless an interval is given on :meth:`register`.
+    | The refreshes are spread over the interval: each object has its own phase, the phases of the objects
+    | registered follow the golden ratio sequence, even for any number of objects,
+    | so that the objects are not refreshed all at the same second.
+    | An object without response, or with a response older than its interval, is refreshed at once.
+    | When many objects are due at the same time, they are refreshed by decreasing priority,
+    | then the most stale first, e.g. give the locations read the most a higher priority.
+    | The scheduler runs in a single thread, see :meth:`start`, or in an event loop, see :meth:`run_async`,
+    | whatever the number of objects; with `max_workers`, up to `max_workers` refreshes are in flight.
+
+    :param intervals: The refresh interval, in seconds, of each section, overriding :data:`SECTION_INTERVALS`
+    :type intervals: dict, optional
+
+    :param max_workers: Maximum number of refreshes in flight at the same time
+    :type max_workers: int, optional, greater than 0
+    """
+
+    def __init__(self, intervals=None, max_workers=1):
+        """This is the constructor method."""
+        if max_workers < 1:
+            raise ValueError("The 'max_workers' argument must be greater than 0")
+        self._intervals = dict(SECTION_INTERVALS, **(intervals or {}))
+        if any(interval <= 0 for interval in self._intervals.values()):
+            raise ValueError("The 'intervals' argument must hold intervals greater than 0")
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._heap = []
+        self._entries = {}
+        self._counter = itertools.count()
+        self._thread = None
+        self._executor = None
+        self._stats = {"refreshes": 0, "failures": 0, "max_lag": 0.0}
+
+    def interval(self, oca):
+        """
+        | The interval method.
+
+        | Returns the refresh interval of an object: the shortest interval of the sections it does not exclude.
+
+        :param oca: The One Call Api object
+        :type oca: :class:`~pocar.OneCallApi.OneCallApi`
+
+        :return: The refresh interval, in seconds
+        :rtype: float
+        """
+        excluded = set(oca.exc.split(","))
+        intervals = [interval for section, interval in self._intervals.items() if section not in excluded]
+        return min(intervals, default=max(self._intervals.values()))
+
+    def register(self, oca, interval=None, priority=0):
+        """
+        | The register method.
+
+        | Adds an object to the refreshed objects, or updates its interval and priority if already registered.
+
+        :param oca: The One Call Api object
+        :type oca: :class:`~pocar.OneCallApi.OneCallApi`
+
+        :param interval: The refresh interval, in seconds, the one of its sections if `None`, see :meth:`interval`
+        :type interval: float, optional
+
+        :param priority: The priority of the object, when many objects are due at the same time
+        :type priority: int, optional
+        """
+        if interval is None:
+            interval = self.interval(oca)
+        if interval <= 0:
+            raise ValueError("The 'interval' argument must be greater than 0")
+        now = time.time()
+        with self._lock:
+            previous = self._entries.get(oca)
+            if previous is not None:
+                previous.active = False
+            seq = next(self._counter)
+            entry = _Entry(oca, interval, (seq * _GOLDEN % 1.0) * interval, priority)
+            self._entries[oca] = entry
+            due = now if oca.timestamp() + interval <= now else entry.next_slot(now)
+            heapq.heappush(self._heap, (due, seq, entry))
+        logger.debug("Registered lat=%s, lon=%s, interval=%s s, priority=%s", oca.lat, oca.lon, interval, priority)
+        self._wake.set()
+
+    def unregister(self, oca):
+        """
+        | The unregister method.
+
+        | Removes an object from the refreshed objects.
+
+        :param oca: The One Call Api object
+        :type oca: :class:`~pocar.OneCallApi.OneCallApi`
+        """
+        with self._lock:
+            entry = self._entries.pop(oca, None)
+            if entry is not None:
+                entry.active = False
+
+    def __len__(self):
+        """Returns the number of objects registered."""
+        return len(self._entries)
+
+    def __contains__(self, oca):
+        """Returns `True` if the object is registered."""
+        return oca in self._entries
+
+    def next_due(self):
+        """
+        | The next_due method.
+
+        :return: The time of the next refresh, as a Unix time, `None` if no object is registered
+        :rtype: float
+        """
+        with self._lock:
+            while self._heap and not self._heap[0][2].active:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def __pop_due(self, now):
+        """Returns the entries due at now, by decreasing priority then the most stale first, rescheduled."""
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                slot, seq, entry = heapq.heappop(self._heap)
+                if entry.active:
+                    due.append((slot, entry))
+                    # the next slot at least half an interval later, an object refreshed at once on register
+                    # is then refreshed in its own slots
+                    heapq.heappush(self._heap, (entry.next_slot(max(now, slot + entry.interval / 2)), seq, entry))
+            if due:
+                self._stats["max_lag"] = max(self._stats["max_lag"], now - min(slot for slot, _ in due))
+        due.sort(key=lambda item: (-item[1].priority, item[1].oca.timestamp()))
+        return [entry.oca for _, entry in due]
+
+    def __count(self, results):
+        """Counts the refreshes and their failures."""
+        with self._lock:
+            self._stats["refreshes"] += len(results)
+            self._stats["failures"] += results.count(False)
+
+    @staticmethod
+    def __refresh(oca):
+        """Refreshes one object, reporting an unexpected error as a failed refresh."""
+        try:
+            return oca.update_data()
+        except Exception as err:  # pylint: disable=broad-except
+            logger.warning("Refresh failed for lat=%s, lon=%s: %r", oca.lat, oca.lon, err)
+            return False
+
+    def run_pending(self):
+        """
+        | The run_pending method.
+
+        | Refreshes the objects that are due, with up to `max_workers` refreshes in flight,
+        | and returns once they are refreshed.
+
+        :return: The number of objects refreshed
+        :rtype: int
+        """
+        objects = self.__pop_due(time.time())
+        if self._max_workers == 1 or len(objects) < 2:
+            results = [self.__refresh(oca) for oca in objects]
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix="pocar-scheduler")
+            results = list(self._executor.map(self.__refresh, objects))
+        self.__count(results)
+        return len(results)
+
+    async def run_pending_async(self):
+        """
+        | The run_pending_async coroutine.
+
+        | Refreshes the objects that are due, with up to `max_workers` refreshes in flight.
+        | Objects with a coroutine `update_data` (see :mod:`~pocar.AsyncOneCallApi`) are awaited,
+        | the others are run in the default executor of the event loop.
+
+        :return: The number of objects refreshed
+        :rtype: int
+        """
+        objects = self.__pop_due(time.time())
+        semaphore = asyncio.Semaphore(self._max_workers)
+        loop = asyncio.get_running_loop()
+
+        async def refresh(oca):
+            async with semaphore:
+                if asyncio.iscoroutinefunction(oca.update_data):
+                    try:
+                        return await oca.update_data()
+                    except Exception as err:  # pylint: disable=broad-except
+                        logger.warning("Refresh failed for lat=%s, lon=%s: %r", oca.lat, oca.lon, err)
+                        return False
+                return await loop.run_in_executor(None, self.__refresh, oca)
+
+        results = list(await asyncio.gather(*(refresh(oca) for oca in objects)))
+        self.__count(results)
+        return len(results)
+
+    def __wait_time(self, limit):
+        """Returns the time to wait until the next refresh, at most limit."""
+        next_due = self.next_due()
+        if next_due is None:
+            return limit
+        return min(max(next_due - time.time(), 0.0), limit)
+
+    def start(self):
+        """
+        | The start method.
+
+        | Starts refreshing the objects in a background thread, until :meth:`stop`.
+
+        :return: The scheduler
+        :rtype: :class:`OneCallApiScheduler`
+        """
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("The scheduler is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.__run, name="pocar-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __run(self):
+        """Refreshes the objects that are due, then sleeps until the next one is due, until stopped."""
+        while not self._stop.is_set():
+            self._wake.clear()
+            self.run_pending()
+            self._wake.wait(self.__wait_time(60.0))
+
+    async def run_async(self, poll=1.0):
+        """
+        | The run_async coroutine.
+
+        | Refreshes the objects in the running event loop, until :meth:`stop` or cancellation.
+        | Objects registered while waiting are taken into account within `poll` seconds.
+
+        :param poll: Maximum time, in seconds, between two checks for objects due
+        :type poll: float, optional
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            await self.run_pending_async()
+            await asyncio.sleep(self.__wait_time(poll))
+
+    def stop(self):
+        """
+        | The stop method.
+
+        | Stops refreshing the objects, once the refreshes in flight are done.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self):
+        """
+        | The stats method.
+
+        | Returns the scheduler counters, as a dictionary: registered (objects), refreshes, failures,
+        | and max_lag (longest delay, in seconds, between the time an object was due and its refresh).
+
+        :return: Scheduler counters
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._stats, registered=len(self._entries))
@@ -0,0 +1,126 @@
+"""This module provides a class to share pooled HTTP connections between One Call Api requests."""
+import logging
+import threading
+
+import requests
+
+from pocar.OneCallApiMetrics import OneCallApiTimedAdapter
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+class OneCallApiSession:
+    """
+    Class to handle a pooled and reusable HTTP session to OpenWeatherMap.
+
+    | A single session keeps the TCP (and TLS) connections to OpenWeatherMap open between requests,
+    | so that consecutive calls to :meth:`~pocar.OneCallApi.OneCallApi.update_data` skip the handshake.
+    | The session returned by :meth:`shared` is used by every :class:`~pocar.OneCallApi.OneCallApi` object
+    | that has no session of its own.
+
+    :param pool_connections: Number of connection pools to cache, one pool per host
+    :type pool_connections: int, optional, greater than 0
+
+    :param pool_maxsize: Maximum number of connections kept alive in each pool
+    :type pool_maxsize: int, optional, greater than 0
+
+    :param keep_alive: Keep connections open after each request
+    :type keep_alive: bool, optional
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, keep_alive=True):
+        """This is the constructor method."""
+        if pool_connections < 1:
+            raise ValueError("The 'pool_connections' argument must be greater than 0")
+        if pool_maxsize < 1:
+            raise ValueError("The 'pool_maxsize' argument must be greater than 0")
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._keep_alive = keep_alive
+        self._session = requests.Session()
+        adapter = OneCallApiTimedAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        if keep_alive is False:
+            self._session.headers["Connection"] = "close"
+        logger.debug(
+            "Created session: pool_connections=%s, pool_maxsize=%s, keep_alive=%s",
+            pool_connections,
+            pool_maxsize,
+            keep_alive,
+        )
+
+    @classmethod
+    def shared(cls):
+        """
+        | The shared method.
+
+        | Returns the session shared by all One Call Api objects, created on first use.
+
+        :return: The shared session
+        :rtype: OneCallApiSession
+        """
+        if cls.__shared is None:
+            with cls.__shared_lock:
+                if cls.__shared is None:
+                    cls.__shared = cls()
+        return cls.__shared
+
+    @classmethod
+    def configure(cls, pool_connections=10, pool_maxsize=10, keep_alive=True):
+        """
+        | The configure method.
+
+        | Replaces the shared session by a new one with the given settings.
+        | The previous shared session, if any, is closed.
+
+        :return: The new shared session
+        :rtype: OneCallApiSession
+        """
+        session = cls(pool_connections, pool_maxsize, keep_alive)
+        with cls.__shared_lock:
+            previous, cls.__shared = cls.__shared, session
+        if previous is not None:
+            previous.close()
+        return session
+
+    def config(self):
+        """
+        | The config method.
+
+        | Returns a dictionary containing the configuration of the session.
+
+        :return: Configuration of the session
+        :rtype: dict
+        """
+        return {
+            "pool_connections": self._pool_connections,
+            "pool_maxsize": self._pool_maxsize,
+            "keep_alive": self._keep_alive,
+        }
+
+    def get(self, url, **kwargs):
+        """
+        | The get method.
+
+        | Makes an HTTP GET request reusing a pooled connection when one is available.
+
+        :param url: The URL to request
+        :type url: str
+
+        :return: The HTTP response
+        :rtype: requests.Response
+        """
+        return self._session.get(url, **kwargs)
+
+    def close(self):
+        """
+        | The close method.
+
+        | Closes all pooled connections of the session.
+        """
+        self._session.close()
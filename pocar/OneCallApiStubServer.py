@@ -0,0 +1,323 @@
+"""This module provides a local HTTP server that mimics One Call Api, for tests and benchmarks."""
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+# Set local logger to the root logger, to inherit root settings
+logger = logging.getLogger(__name__)
+
+
+def _weather(hour):
+    """Returns a weather condition list, alternating clear and cloudy sky."""
+    if hour % 2 == 0:
+        return [{"id": 800, "main": "Clear", "description": "clear sky", "icon": "01d"}]
+    return [{"id": 803, "main": "Clouds", "description": "broken clouds", "icon": "04d"}]
+
+
+def _hourly_entry(now, hour):
+    """Returns one hourly forecast entry."""
+    return {
+        "dt": now + hour * 3600,
+        "temp": round(20.0 + (hour % 12) * 0.75, 2),
+        "feels_like": round(19.5 + (hour % 12) * 0.8, 2),
+        "pressure": 1012 + hour % 5,
+        "humidity": 40 + hour % 30,
+        "dew_point": round(10.0 + (hour % 7) * 0.5, 2),
+        "uvi": round((hour % 10) * 0.6, 2),
+        "clouds": (hour * 7) % 100,
+        "visibility": 10000,
+        "wind_speed": round(1.5 + (hour % 6) * 0.4, 2),
+        "wind_deg": (hour * 15) % 360,
+        "wind_gust": round(2.5 + (hour % 6) * 0.6, 2),
+        "weather": _weather(hour),
+        "pop": round((hour % 5) * 0.2, 2),
+    }
+
+
+def _daily_entry(now, day):
+    """Returns one daily forecast entry."""
+    return {
+        "dt": now + day * 86400,
+        "sunrise": now + day * 86400 - 21600,
+        "sunset": now + day * 86400 + 21600,
+        "moonrise": now + day * 86400 - 3600,
+        "moonset": now + day * 86400 + 36000,
+        "moon_phase": round((day % 8) * 0.125, 3),
+        "temp": {"day": 24.5 + day, "min": 15.2 + day, "max": 27.9 + day, "night": 18.1, "eve": 22.3, "morn": 16.4},
+        "feels_like": {"day": 24.9 + day, "night": 18.3, "eve": 22.6, "morn": 16.2},
+        "pressure": 1014 + day,
+        "humidity": 55 + day,
+        "dew_point": 14.7 + day * 0.1,
+        "wind_speed": 3.2 + day * 0.1,
+        "wind_deg": (day * 45) % 360,
+        "wind_gust": 6.8 + day * 0.2,
+        "weather": _weather(day),
+        "clouds": (day * 11) % 100,
+        "pop": round((day % 4) * 0.25, 2),
+        "uvi": 6.5 - day * 0.5,
+    }
+
+
+def build_payload(lat, lon, exclude="", now=None, *, hours=48, days=8):  # pylint: disable=too-many-arguments
+    """
+    | The build_payload function.
+
+    | Returns a One Call Api response, as a dictionary, for the given location.
+    | The response holds 61 minutely, 48 hourly and 8 daily entries, and one alert,
+    | minus the sections listed in `exclude`.
+    | The numbers of hourly and daily entries can be changed, to change the size of the response.
+
+    :param lat: Geographical coordinates of the location (latitude)
+    :type lat: float
+
+    :param lon: Geographical coordinates of the location (longitude)
+    :type lon: float
+
+    :param exclude: The excluded fields in One Call Api response
+    :type exclude: comma separated str, optional
+
+    :param now: Unix UTC time of the response, current time if `None`
+    :type now: int, optional
+
+    :param hours: The number of hourly entries
+    :type hours: int, optional
+
+    :param days: The number of daily entries
+    :type days: int, optional
+
+    :return: One Call Api response
+    :rtype: dict
+    """
+    if now is None:
+        now = int(time.time()) // 60 * 60
+    excluded = set(exclude.split(",")) if exclude else set()
+    payload = {"lat": lat, "lon": lon, "timezone": "Europe/Paris", "timezone_offset": 7200}
+    if "current" not in excluded:
+        payload["current"] = dict(_hourly_entry(now, 0), sunrise=now - 21600, sunset=now + 21600)
+        del payload["current"]["pop"]
+    if "minutely" not in excluded:
+        payload["minutely"] = [{"dt": now + minute * 60, "precipitation": minute % 4 * 0.1} for minute in range(61)]
+    if "hourly" not in excluded:
+        payload["hourly"] = [_hourly_entry(now, hour) for hour in range(hours)]
+    if "daily" not in excluded:
+        payload["daily"] = [_daily_entry(now, day) for day in range(days)]
+    if "alerts" not in excluded:
+        payload["alerts"] = [
+            {
+                "sender_name": "METEO-FRANCE",
+                "event": "Moderate thunderstorm warning",
+                "start": now,
+                "end": now + 43200,
+                "description": "Moderate damages may occur, especially in vulnerable or in exposed areas.",
+                "tags": ["Thunderstorm"],
+            }
+        ]
+    return payload
+
+
+class _OneCallApiStubHandler(BaseHTTPRequestHandler):
+    """Request handler answering One Call Api GET requests."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        """Counts each new client connection."""
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        """Answers a One Call Api request."""
+        query = parse_qs(urlparse(self.path).query, keep_blank_values=True)
+        status, body, headers = self.server.answer({name: values[0] for name, values in query.items()})
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Routes the server access log to the module logger."""
+        logger.debug(format, *args)
+
+
+class OneCallApiStubServer(ThreadingHTTPServer):
+    """
+    Class to run a local HTTP server that answers like One Call Api.
+
+    | The server runs in a background thread and binds to localhost only.
+    | It is meant for tests, benchmarks and load tests, set :attr:`~pocar.OneCallApi.OneCallApi.base_url`
+    | to :attr:`url` to have One Call Api objects call it instead of OpenWeatherMap.
+    | As One Call Api, it checks `appid` (401), `lat` and `lon` (400), and honors `exclude`.
+    | It can be made slow and unreliable: each answer is delayed by `latency`, a share `error_rate`
+    | of the requests is answered with 503, and a share `throttle_rate` with 429 and a `Retry-After` header.
+    | These settings are attributes, they can be changed while serving.
+    | The response bodies are kept per location and minute, answering is not slowed by their encoding.
+    | All arguments but `port` are keyword only.
+
+    :param port: The TCP port to listen to, any free port if 0
+    :type port: int, optional
+
+    :param latency: Time, in seconds, each answer is delayed
+    :type latency: float, optional
+
+    :param error_rate: Share of the requests answered with 503, in [0, 1]
+    :type error_rate: float, optional
+
+    :param throttle_rate: Share of the requests answered with 429, in [0, 1]
+    :type throttle_rate: float, optional
+
+    :param hours: The number of hourly entries of the responses, see :func:`build_payload`
+    :type hours: int, optional
+
+    :param days: The number of daily entries of the responses, see :func:`build_payload`
+    :type days: int, optional
+
+    :param appid: The only API key accepted, any 32 hexadecimal digits if `None`
+    :type appid: str, optional
+
+    :ivar connections: Number of client connections accepted
+
+    :ivar requests: Number of requests answered
+
+    :ivar statuses: Number of requests answered per HTTP status code
+    :vartype statuses: dict
+
+    :ivar retry_after: The `Retry-After` header of 429 answers, in seconds
+    :vartype retry_after: int
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, port=0, *, latency=0.0, error_rate=0.0, throttle_rate=0.0, hours=48, days=8, appid=None
+    ):  # pylint: disable=too-many-arguments
+        """This is the constructor method."""
+        if not 0.0 <= error_rate + throttle_rate <= 1.0 or min(error_rate, throttle_rate) < 0.0:
+            raise ValueError("The 'error_rate' and 'throttle_rate' arguments must be shares within [0, 1]")
+        super().__init__(("127.0.0.1", port), _OneCallApiStubHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+        self.statuses = {}
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = 1
+        self._hours = hours
+        self._days = days
+        self._appid = appid
+        self._random = random.Random()
+        self._bodies = {}
+        self._thread = None
+
+    @staticmethod
+    def __error(status, message):
+        """Returns an error answer, with the body of One Call Api errors."""
+        return status, json.dumps({"cod": status, "message": message}).encode(), {}
+
+    def __check(self, query):
+        """Returns the error answer of an invalid request, `None` if the request is valid."""
+        appid = query.get("appid", "")
+        valid_key = len(appid) == 32 and all(char in "0123456789abcdefABCDEF" for char in appid)
+        if not valid_key or (self._appid is not None and appid != self._appid):
+            return self.__error(
+                401, "Invalid API key. Please see https://openweathermap.org/faq#error401 for more info."
+            )
+        if "lat" not in query or "lon" not in query:
+            return self.__error(400, "Nothing to geocode")
+        for name, limit in (("lat", 90.0), ("lon", 180.0)):
+            try:
+                value = float(query[name])
+            except ValueError:
+                return self.__error(400, f"wrong {name}itude")
+            if not -limit <= value <= limit:
+                return self.__error(400, f"wrong {name}itude")
+        return None
+
+    def __body(self, lat, lon, exclude):
+        """Returns the encoded response of a location, kept for the current minute."""
+        now = int(time.time()) // 60 * 60
+        key = (lat, lon, exclude, now)
+        body = self._bodies.get(key)
+        if body is None:
+            body = json.dumps(build_payload(lat, lon, exclude, now, hours=self._hours, days=self._days)).encode()
+            with self.lock:
+                if len(self._bodies) >= 4096 or any(item[3] != now for item in self._bodies):
+                    self._bodies.clear()
+                self._bodies[key] = body
+        return body
+
+    def answer(self, query):
+        """
+        | The answer method.
+
+        | Returns the answer of the server to a One Call Api request.
+
+        :param query: The query parameters of the request, e.g. `{"lat": "45.1", "lon": "1.2", "appid": ...}`
+        :type query: dict
+
+        :return: The HTTP status code, the body, and the extra headers of the answer
+        :rtype: tuple
+        """
+        with self.lock:
+            self.requests += 1
+            draw = self._random.random()
+        answer = self.__check(query)
+        if answer is None and draw < self.error_rate:
+            answer = self.__error(503, "Service Unavailable")
+        elif answer is None and draw < self.error_rate + self.throttle_rate:
+            status, body, _ = self.__error(
+                429, "Your account is temporary blocked due to exceeding of requests limitation"
+            )
+            answer = (status, body, {"Retry-After": str(self.retry_after)})
+        elif answer is None:
+            answer = (200, self.__body(float(query["lat"]), float(query["lon"]), query.get("exclude", "")), {})
+        with self.lock:
+            self.statuses[answer[0]] = self.statuses.get(answer[0], 0) + 1
+        return answer
+
+    @property
+    def url(self):
+        """The One Call Api endpoint served by this server."""
+        return f"http://127.0.0.1:{self.server_port}/data/2.5/onecall"
+
+    def start(self):
+        """
+        | The start method.
+
+        | Starts serving requests in a background thread.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        | The stop method.
+
+        | Stops serving requests and closes the listening socket.
+        """
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        """Starts the server when entering a with block."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stops the server when leaving a with block."""
+        self.stop()
@@ -0,0 +1,13 @@
+"""Test Fixtures: shared by the test modules."""
+import pytest
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+
+@pytest.fixture(name="stub_server")
+def fixture_stub_server(monkeypatch):
+    """Fixture: run a local One Call Api server and point OneCallApi to it."""
+    with OneCallApiStubServer() as server:
+        monkeypatch.setattr(OneCallApi, "base_url", server.url)
+        yield server
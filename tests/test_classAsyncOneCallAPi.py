@@ -0,0 +1,126 @@
+"""Test Module: AsyncOneCallApi."""
+import asyncio
+
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApi
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiDaily
+from pocar.AsyncOneCallApi import AsyncOneCallApiHourly
+from pocar.AsyncOneCallApi import AsyncOneCallApiMinutely
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCache import OneCallApiCache
+from pocar.OneCallApiDecoder import OneCallApiDecoder
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+pytestmark = pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def test_0000():
+    """Test: validate constructor nominal case."""
+    oca = AsyncOneCallApiHourly(LAT, LON, KEY)
+    assert oca.exc == "current,daily,minutely,alerts"
+    assert isinstance(oca, AsyncOneCallApi)
+    assert asyncio.iscoroutinefunction(oca.update_data)
+
+
+def test_0001():
+    """Test: validate session constructor and shared session per event loop."""
+    with pytest.raises(ValueError):
+        AsyncOneCallApiSession(limit=-1)
+    assert AsyncOneCallApiSession(limit=5).config()["limit"] == 5
+
+    async def shared_twice():
+        return AsyncOneCallApiSession.shared() is AsyncOneCallApiSession.shared()
+
+    assert asyncio.run(shared_twice()) is True
+
+
+def test_0002(stub_server):
+    """Test: validate update_data and accessors on the fetched data."""
+
+    async def update_all():
+        session = AsyncOneCallApiSession(limit=4)
+        objs = [AsyncOneCallApiHourly(lat, LON, KEY) for lat in range(-40, 40, 4)]
+        objs += [AsyncOneCallApiCurrent(LAT, LON, KEY), AsyncOneCallApiDaily(LAT, LON, KEY)]
+        objs += [AsyncOneCallApiMinutely(LAT, LON, KEY)]
+        for oca in objs:
+            oca.session = session
+        results = await asyncio.gather(*(oca.update_data() for oca in objs))
+        await session.close()
+        return objs, results
+
+    objs, results = asyncio.run(update_all())
+    assert all(results)
+    assert stub_server.requests == len(objs)
+    assert stub_server.connections <= 4
+    assert len(objs[0].temp(all_values=True)) == 48
+    assert objs[0].raw_data()["lat"] == -40
+    assert objs[0].timestamp() > 0
+    assert "current" not in objs[0].raw_data()
+    assert objs[-3].temperature() == 20.0
+    assert objs[-2].temp_max(1) == 28.9
+    assert len(objs[-1].precipitation(all_values=True)) == 61
+
+
+def test_0003(monkeypatch):
+    """Test: validate update_data failure on connection error."""
+    server = OneCallApiStubServer()
+    monkeypatch.setattr(OneCallApi, "base_url", server.url)
+    server.server_close()
+    oca = AsyncOneCallApiCurrent(LAT, LON, KEY)
+
+    async def update():
+        result = await oca.update_data()
+        await AsyncOneCallApiSession.shared().close()
+        return result
+
+    assert asyncio.run(update()) is False
+    assert not oca.raw_data()
+
+
+def test_0004(stub_server, monkeypatch):
+    """Test: validate update_data is served from the cache without network request."""
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache())
+
+    async def update_twice():
+        first, second = AsyncOneCallApiCurrent(LAT, LON, KEY), AsyncOneCallApiCurrent(LAT, LON, KEY)
+        results = [await first.update_data(), await second.update_data()]
+        await AsyncOneCallApiSession.shared().close()
+        return results, first, second
+
+    results, first, second = asyncio.run(update_twice())
+    assert results == [True, True]
+    assert second.raw_data() is first.raw_data()
+    assert stub_server.requests == 1
+
+
+def test_0005(stub_server, monkeypatch):
+    """Test: validate update_data decodes with the decoder of the object, and fails on invalid JSON."""
+    monkeypatch.setattr(OneCallApi, "decoder", OneCallApiDecoder("json"))
+
+    async def update(decoder):
+        valid, invalid = AsyncOneCallApiCurrent(LAT, LON, KEY), AsyncOneCallApiCurrent(LAT, LON, KEY)
+        invalid.decoder = decoder
+        results = [await valid.update_data(), await invalid.update_data()]
+        await AsyncOneCallApiSession.shared().close()
+        return results, valid
+
+    class FailingDecoder:  # pylint: disable=too-few-public-methods
+        """Decoder raising the error of an invalid response body."""
+
+        def decode(self, content):
+            """Raises ValueError."""
+            raise ValueError(f"invalid body of {len(content)} bytes")
+
+    results, valid = asyncio.run(update(FailingDecoder()))
+    assert results == [True, False]
+    assert valid.temperature() == 20.0
+    assert stub_server.requests == 2
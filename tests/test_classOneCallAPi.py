@@ -1,4 +1,8 @@
 """Test Module: OneCallApiAlerts."""
+import json
+import logging
+from datetime import datetime
+
 import pytest
 
 from pocar.OneCallApi import OneCallApi
@@ -122,3 +126,42 @@ def test_0010():
     oca = OneCallApi(LAT, LON, KEY, EXC)
     oca._timestamp = value
     assert oca.timestamp() == value
+
+
+def test_0011(caplog):
+    """Test: validate the response is logged as JSON only when the payload logger is enabled."""
+    oca = OneCallApi(LAT, LON, KEY, EXC)
+    with caplog.at_level(logging.INFO, logger="pocar.OneCallApi"):
+        oca._store_data(RAW_DATA)
+    assert "json raw data" not in caplog.text
+    assert oca.raw_data() is RAW_DATA
+    assert oca.timestamp() > 0
+    with caplog.at_level(logging.DEBUG, logger="pocar.OneCallApi.payload"):
+        oca._store_data(RAW_DATA)
+    assert json.dumps(RAW_DATA, indent=2) in caplog.text
+
+
+def test_0012(caplog, monkeypatch):
+    """Test: validate attribute reads are not logged when trace_access is disabled."""
+    oca = OneCallApi(LAT, LON, KEY, EXC)
+    with caplog.at_level(logging.DEBUG, logger="pocar.OneCallApi"):
+        assert oca.lat == LAT
+    assert "Get method for 'lat' attribute" in caplog.text
+    caplog.clear()
+    monkeypatch.setattr(OneCallApi, "trace_access", False)
+    with caplog.at_level(logging.DEBUG, logger="pocar.OneCallApi"):
+        assert (oca.lat, oca.lon, oca.key, oca.exc) == (LAT, LON, KEY, EXC)
+    assert not caplog.records
+
+
+def test_0013(monkeypatch):
+    """Test: validate formatted times are kept per response, in the host or the response time zone."""
+    oca = OneCallApi(LAT, LON, KEY, EXC)
+    oca._rawdata = dict(RAW_DATA)
+    formatted = oca._format_time(1628526292)
+    assert formatted == f"{datetime.fromtimestamp(1628526292):%Y-%m-%d %H:%M:%S}"
+    assert oca._format_time(1628526292) is formatted
+    monkeypatch.setattr(OneCallApi, "response_timezone", True)
+    assert oca._format_time(1628526292) == "2021-08-09 18:24:52"
+    oca._rawdata = dict(RAW_DATA, timezone_offset=-3600)
+    assert oca._format_time(1628526292) == "2021-08-09 15:24:52"
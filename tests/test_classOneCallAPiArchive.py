@@ -0,0 +1,166 @@
+"""Test Module: OneCallApiArchive."""
+import asyncio
+import zipfile
+
+import pytest
+import requests
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiHourly
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiArchive import OneCallApiRecordSession
+from pocar.OneCallApiArchive import OneCallApiReplaySession
+from pocar.OneCallApiArchive import request_key
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiRetry import OneCallApiRetry
+from pocar.OneCallApiSession import OneCallApiSession
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+class ErrorSession:  # pylint: disable=too-few-public-methods
+    """Support class: a session answering every request with an error status."""
+
+    def get(self, url, **kwargs):  # pylint: disable=unused-argument
+        """Returns a 503 response."""
+        resp = requests.Response()
+        resp.status_code = 503
+        resp._content = b'{"cod": 503}'
+        resp.url = url
+        return resp
+
+
+class FlakySession(OneCallApiSession):
+    """Support class: a session answering its first request with an error status."""
+
+    def __init__(self):
+        """This is the constructor method."""
+        super().__init__()
+        self.failed = False
+
+    def get(self, url, **kwargs):
+        """Returns a 503 response for the first request, makes the HTTP GET request otherwise."""
+        if not self.failed:
+            self.failed = True
+            return ErrorSession().get(url)
+        return super().get(url, **kwargs)
+
+
+@pytest.fixture(name="archive")
+def fixture_archive(tmp_path, monkeypatch):
+    """Fixture: record the responses of a local One Call Api server for Current and Hourly, return the path."""
+    path = str(tmp_path / "responses.zip")
+    with OneCallApiStubServer() as server:
+        monkeypatch.setattr(OneCallApi, "base_url", server.url)
+        with OneCallApiRecordSession(path) as recorder:
+            monkeypatch.setattr(OneCallApi, "session", recorder)
+            assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+            assert OneCallApiHourly(LAT, LON, KEY).update_data() is True
+            assert OneCallApiHourly(LAT, LON, KEY).update_data() is True
+            assert recorder.recorded() == 2
+        assert server.requests == 3
+    return path
+
+
+def test_0000():
+    """Test: validate function request_key drops the API key and sorts the query."""
+    url = f"http://127.0.0.1:8080/data/2.5/onecall?lon=1.2&lat=45.1&exclude=&units=metric&appid={KEY}"
+    assert request_key(url) == "data/2.5/onecall?exclude=&lat=45.1&lon=1.2&units=metric"
+    assert request_key(url.replace("127.0.0.1:8080", "api.openweathermap.org")) == request_key(url)
+
+
+def test_0001(archive, monkeypatch):
+    """Test: validate responses recorded are replayed without network, and the archive holds no API key."""
+    with zipfile.ZipFile(archive) as content:
+        assert len(content.namelist()) == 2
+        assert all(KEY not in name for name in content.namelist())
+        assert all(info.compress_type == zipfile.ZIP_DEFLATED for info in content.infolist())
+    monkeypatch.setattr(OneCallApi, "base_url", "http://127.0.0.1:1/data/2.5/onecall")
+    with OneCallApiReplaySession(archive) as replay:
+        monkeypatch.setattr(OneCallApi, "session", replay)
+        ocah = OneCallApiHourly(LAT, LON, KEY)
+        assert ocah.update_data() is True
+        assert ocah.temp(hour=3) == 22.25
+        assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+        assert replay.stats() == {"hits": 2, "misses": 0}
+        assert len(replay.keys()) == 2
+
+
+def test_0002(tmp_path, monkeypatch):
+    """Test: validate stored archives are replayed from the mapping, the same body object for the same request."""
+    path = str(tmp_path / "stored.zip")
+    with OneCallApiStubServer() as server:
+        monkeypatch.setattr(OneCallApi, "base_url", server.url)
+        with OneCallApiRecordSession(path, compression=zipfile.ZIP_STORED) as recorder:
+            monkeypatch.setattr(OneCallApi, "session", recorder)
+            assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+        url = OneCallApiCurrent(LAT, LON, KEY).url
+    with OneCallApiReplaySession(path) as replay:
+        first, second = replay.get(url), replay.get(url)
+        assert first.content is second.content
+        assert first.json()["current"]["temp"] == 20.0
+
+
+def test_0003(archive, monkeypatch):
+    """Test: validate requests missing from the archive fail when strict, are answered in turn otherwise."""
+    with OneCallApiReplaySession(archive) as replay:
+        monkeypatch.setattr(OneCallApi, "session", replay)
+        assert OneCallApiHourly(LAT + 1.0, LON, KEY).update_data() is False
+    with OneCallApiReplaySession(archive, strict=False) as replay:
+        monkeypatch.setattr(OneCallApi, "session", replay)
+        assert [OneCallApiHourly(LAT + idx, LON, KEY).update_data() for idx in range(1, 5)] == [True] * 4
+        assert replay.stats() == {"hits": 0, "misses": 4}
+
+
+def test_0004(tmp_path, monkeypatch):
+    """Test: validate error statuses are recorded and replayed."""
+    path = str(tmp_path / "errors.zip")
+    with OneCallApiRecordSession(path, session=ErrorSession()) as recorder:
+        monkeypatch.setattr(OneCallApi, "session", recorder)
+        assert OneCallApiCurrent(LAT, LON, KEY).update_data() is False
+    with OneCallApiReplaySession(path) as replay:
+        monkeypatch.setattr(OneCallApi, "session", replay)
+        assert OneCallApiCurrent(LAT, LON, KEY).update_data() is False
+        with pytest.raises(requests.exceptions.HTTPError):
+            replay.get(OneCallApiCurrent(LAT, LON, KEY).url).raise_for_status()
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0005(archive, monkeypatch):
+    """Test: validate asyncio objects replay the archive."""
+    with OneCallApiReplaySession(archive) as replay:
+
+        async def update():
+            ocah, missing = AsyncOneCallApiHourly(LAT, LON, KEY), AsyncOneCallApiHourly(LAT + 1.0, LON, KEY)
+            ocah.session = missing.session = replay
+            return [await ocah.update_data(), await missing.update_data()], ocah
+
+        results, ocah = asyncio.run(update())
+        assert results == [True, False]
+        assert ocah.temp(hour=3) == 22.25
+
+
+def test_0006(stub_server, tmp_path, monkeypatch):
+    """Test: validate a request retried after an error status records, and replays, its success."""
+    path = str(tmp_path / "retried.zip")
+    monkeypatch.setattr(OneCallApi, "retry", OneCallApiRetry(2, backoff=0.001))
+    session = FlakySession()
+    with OneCallApiRecordSession(path, session=session) as recorder:
+        monkeypatch.setattr(OneCallApi, "session", recorder)
+        assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+        assert recorder.recorded() == 1
+    session.close()
+    assert stub_server.requests == 1
+    with OneCallApiReplaySession(path) as replay:
+        monkeypatch.setattr(OneCallApi, "session", replay)
+        monkeypatch.setattr(OneCallApi, "retry", None)
+        ocac = OneCallApiCurrent(LAT, LON, KEY)
+        assert ocac.update_data() is True
+        assert ocac.temperature() == 20.0
+    with zipfile.ZipFile(path) as content:
+        assert [info.comment for info in content.infolist()] == [b"200"]
@@ -0,0 +1,81 @@
+"""Test Module: OneCallApiBatch."""
+import asyncio
+
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiDaily
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiBatch import OneCallApiBatch
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+KEY = "abcdef1234567890abcdef1234567890"
+LOCATIONS = [(float(lat), float(lon)) for lat in range(-60, 60, 10) for lon in range(-90, 90, 30)]
+
+
+def test_0000():
+    """Test: validate constructor nominal case."""
+    oca = OneCallApiHourly(45.0, 1.0, KEY)
+    batch = OneCallApiBatch([oca, (10.0, 20.0)], KEY, OneCallApiHourly)
+    assert batch.objects()[0] is oca
+    assert isinstance(batch.objects()[1], OneCallApiHourly)
+    assert batch.objects()[1].lat == 10.0
+    batch = OneCallApiBatch([(10.0, 20.0)], KEY, exc="alerts")
+    assert batch.objects()[0].exc == "alerts"
+
+
+def test_0001():
+    """Test: validate constructor error cases."""
+    with pytest.raises(ValueError):
+        OneCallApiBatch([(10.0, 20.0)])
+    with pytest.raises(ValueError):
+        OneCallApiBatch([(10.0, 20.0)], KEY, max_workers=0)
+    with pytest.raises(ValueError):
+        OneCallApiBatch([(100.0, 20.0)], KEY)
+
+
+def test_0002(stub_server):
+    """Test: validate method update_data with the thread pool backend."""
+    batch = OneCallApiBatch(LOCATIONS, KEY, OneCallApiHourly, max_workers=8)
+    assert batch.update_data() == [True] * len(LOCATIONS)
+    assert stub_server.requests == len(LOCATIONS)
+    for (lat, lon), oca in zip(LOCATIONS, batch.objects()):
+        assert oca.raw_data()["lat"] == lat
+        assert oca.raw_data()["lon"] == lon
+        assert oca.timestamp() > 0
+        assert len(oca.temp(all_values=True)) == 48
+
+
+def test_0003(monkeypatch):
+    """Test: validate method update_data reports failures per location."""
+    server = OneCallApiStubServer()
+    monkeypatch.setattr(OneCallApi, "base_url", server.url)
+    server.server_close()
+    batch = OneCallApiBatch(LOCATIONS[:3], KEY, max_workers=2)
+    assert batch.update_data() == [False, False, False]
+
+
+def test_0004(stub_server):
+    """Test: validate method async_update_data with blocking objects."""
+    batch = OneCallApiBatch(LOCATIONS[:10], KEY, OneCallApiHourly, max_workers=3)
+    assert asyncio.run(batch.async_update_data()) == [True] * 10
+    assert stub_server.requests == 10
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0005(stub_server):
+    """Test: validate method async_update_data with asyncio objects."""
+    batch = OneCallApiBatch(LOCATIONS, KEY, AsyncOneCallApiDaily, max_workers=5)
+
+    async def update():
+        results = await batch.async_update_data()
+        await AsyncOneCallApiSession.shared().close()
+        return results
+
+    assert asyncio.run(update()) == [True] * len(LOCATIONS)
+    assert stub_server.requests == len(LOCATIONS)
+    assert batch.objects()[-1].raw_data()["lat"] == LOCATIONS[-1][0]
+    assert len(batch.objects()[-1].temp_max(all_values=True)) == 7
@@ -0,0 +1,78 @@
+"""Test Module: OneCallApiCache."""
+import time
+
+import pytest
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCache import OneCallApiCache
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+KEY_HOURLY = (LAT, LON, ("alerts", "current", "daily", "minutely"), "metric")
+KEY_ALL = (LAT, LON, (), "metric")
+
+
+def test_0000():
+    """Test: validate constructor and method ttl."""
+    cache = OneCallApiCache(10, {"hourly": 120})
+    assert cache.ttl(KEY_HOURLY) == 120
+    assert cache.ttl(KEY_ALL) == 60
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "size": 0}
+    with pytest.raises(ValueError):
+        OneCallApiCache(0)
+    with pytest.raises(ValueError):
+        OneCallApiCache(ttl={"weekly": 10})
+
+
+def test_0001():
+    """Test: validate method cache_key."""
+    assert OneCallApiHourly(LAT, LON, KEY).cache_key() == KEY_HOURLY
+    assert OneCallApi(LAT, LON, KEY, "daily,current,alerts,minutely").cache_key() == KEY_HOURLY
+    assert OneCallApi(LAT, LON, KEY).cache_key() == KEY_ALL
+
+
+def test_0002():
+    """Test: validate methods get and put, with expiration."""
+    cache = OneCallApiCache()
+    rawdata = {"lat": LAT}
+    assert cache.get(KEY_HOURLY) is None
+    cache.put(KEY_HOURLY, rawdata, time.time())
+    assert cache.get(KEY_HOURLY)[0] is rawdata
+    cache.put(KEY_ALL, rawdata, time.time() - 61)
+    assert cache.get(KEY_ALL) is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "evictions": 0, "expirations": 1, "size": 1}
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+def test_0003():
+    """Test: validate LRU eviction."""
+    cache = OneCallApiCache(maxsize=2)
+    now = time.time()
+    cache.put((1.0, 1.0, (), "metric"), {}, now)
+    cache.put((2.0, 2.0, (), "metric"), {}, now)
+    assert cache.get((1.0, 1.0, (), "metric")) is not None
+    cache.put((3.0, 3.0, (), "metric"), {}, now)
+    assert cache.get((2.0, 2.0, (), "metric")) is None
+    assert cache.get((1.0, 1.0, (), "metric")) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_0004(stub_server, monkeypatch):
+    """Test: validate update_data is served from the cache without network request."""
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache())
+    first = OneCallApiHourly(LAT, LON, KEY)
+    assert first.update_data() is True
+    second = OneCallApiHourly(LAT, LON, KEY)
+    assert second.update_data() is True
+    assert second.raw_data() is first.raw_data()
+    assert second.timestamp() == first.timestamp()
+    assert stub_server.requests == 1
+    # a different section is a different key
+    assert OneCallApiMinutely(LAT, LON, KEY).update_data() is True
+    assert stub_server.requests == 2
+    assert OneCallApi.cache.stats()["hits"] == 1
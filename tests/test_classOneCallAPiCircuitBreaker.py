@@ -0,0 +1,237 @@
+"""Test Module: OneCallApiCircuitBreaker."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCircuitBreaker import CLOSED
+from pocar.OneCallApiCircuitBreaker import HALF_OPEN
+from pocar.OneCallApiCircuitBreaker import OPEN
+from pocar.OneCallApiCircuitBreaker import OneCallApiCircuitBreaker
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiSession import OneCallApiSession
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def http_error(status):
+    """Support function: returns the error raised by raise_for_status for an HTTP status."""
+    resp = requests.Response()
+    resp.status_code = status
+    return requests.exceptions.HTTPError(f"{status} Error", response=resp)
+
+
+class DownSession(OneCallApiSession):
+    """Support class: a session failing its requests while down."""
+
+    def __init__(self):
+        """This is the constructor method."""
+        super().__init__()
+        self.down = False
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        """Raises a connection error while down, makes the HTTP GET request otherwise."""
+        self.calls += 1
+        if self.down:
+            raise requests.exceptions.ConnectionError("OpenWeatherMap is down")
+        return super().get(url, **kwargs)
+
+
+def test_0000():
+    """Test: validate constructor nominal case and arguments range."""
+    breaker = OneCallApiCircuitBreaker(3, cooldown=10.0, probes=2)
+    assert breaker.config() == {"failures": 3, "cooldown": 10.0, "probes": 2}
+    assert breaker.state() == CLOSED
+    with pytest.raises(ValueError):
+        OneCallApiCircuitBreaker(0)
+    with pytest.raises(ValueError):
+        OneCallApiCircuitBreaker(cooldown=-1.0)
+    with pytest.raises(ValueError):
+        OneCallApiCircuitBreaker(probes=0)
+
+
+def test_0001():
+    """Test: validate the states: closed, open after consecutive failures, half-open after the cooldown."""
+    breaker = OneCallApiCircuitBreaker(2, cooldown=0.05)
+    breaker.record(http_error(503))
+    breaker.record()
+    breaker.record(http_error(503))
+    assert breaker.state() == CLOSED
+    breaker.record(requests.exceptions.ConnectTimeout())
+    assert breaker.state() == OPEN
+    assert breaker.allow() is False
+    time.sleep(0.06)
+    assert breaker.state() == HALF_OPEN
+    assert [breaker.allow(), breaker.allow()] == [True, False]
+    breaker.record(http_error(502))
+    assert breaker.state() == OPEN
+    time.sleep(0.06)
+    assert breaker.allow() is True
+    breaker.record()
+    assert breaker.stats() == {"state": CLOSED, "failures": 0, "opened": 2, "rejected": 2}
+
+
+def test_0002():
+    """Test: validate method is_outage."""
+    assert OneCallApiCircuitBreaker.is_outage(http_error(429)) is True
+    assert OneCallApiCircuitBreaker.is_outage(http_error(500)) is True
+    assert OneCallApiCircuitBreaker.is_outage(http_error(401)) is False
+    assert OneCallApiCircuitBreaker.is_outage(requests.exceptions.ConnectionError()) is True
+    assert OneCallApiCircuitBreaker.is_outage(ValueError("invalid JSON")) is True
+    if aiohttp is not None:
+        error = aiohttp.ClientResponseError(None, (), status=404)
+        assert OneCallApiCircuitBreaker.is_outage(error) is False
+
+
+def test_0003(stub_server, monkeypatch):
+    """Test: validate update_data fails fast while the breaker is open, and serves the last response as stale."""
+    session = DownSession()
+    monkeypatch.setattr(OneCallApi, "session", session)
+    monkeypatch.setattr(OneCallApi, "breaker", OneCallApiCircuitBreaker(2, cooldown=0.1))
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    assert ocac.update_data() is True
+    assert ocac.stale() is False
+    temperature = ocac.temperature()
+    session.down = True
+    assert [ocac.update_data(), ocac.update_data(), ocac.update_data()] == [False] * 3
+    assert session.calls == 3
+    assert ocac.stale() is True
+    assert ocac.temperature() == temperature
+    session.down = False
+    time.sleep(0.11)
+    assert ocac.update_data() is True
+    assert ocac.stale() is False
+    assert OneCallApi.breaker.stats() == {"state": CLOSED, "failures": 0, "opened": 1, "rejected": 1}
+    assert stub_server.requests == 2
+    session.close()
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0004(monkeypatch):
+    """Test: validate asyncio update_data fails fast while the breaker is open."""
+    server = OneCallApiStubServer()
+    monkeypatch.setattr(OneCallApi, "base_url", server.url)
+    server.server_close()
+    monkeypatch.setattr(OneCallApi, "breaker", OneCallApiCircuitBreaker(1, cooldown=60.0))
+
+    async def update():
+        ocac = AsyncOneCallApiCurrent(LAT, LON, KEY)
+        results = [await ocac.update_data(), await ocac.update_data()]
+        await AsyncOneCallApiSession.shared().close()
+        return results, ocac
+
+    results, ocac = asyncio.run(update())
+    assert results == [False, False]
+    assert ocac.stale() is True
+    assert OneCallApi.breaker.stats()["rejected"] == 1
+
+
+def test_0005(monkeypatch):
+    """Test: validate a probe ending with an unexpected error releases its slot."""
+
+    class BrokenSession(OneCallApiSession):
+        """Support class: a session failing its requests with an unexpected error."""
+
+        def get(self, url, **kwargs):
+            """Raises an unexpected error."""
+            raise RuntimeError("unexpected")
+
+    breaker = OneCallApiCircuitBreaker(1, cooldown=0.0)
+    breaker.record(http_error(503))
+    monkeypatch.setattr(OneCallApi, "session", BrokenSession())
+    monkeypatch.setattr(OneCallApi, "breaker", breaker)
+    with pytest.raises(RuntimeError):
+        OneCallApiCurrent(LAT, LON, KEY).update_data()
+    assert breaker.state() == HALF_OPEN
+    assert [breaker.allow(), breaker.allow()] == [True, False]
+    breaker.release()
+    assert breaker.allow() is True
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0006(monkeypatch):
+    """Test: validate a cancelled asyncio probe releases its slot."""
+    breaker = OneCallApiCircuitBreaker(1, cooldown=0.0)
+    breaker.record(http_error(503))
+    monkeypatch.setattr(OneCallApi, "breaker", breaker)
+
+    async def update():
+        probe = asyncio.ensure_future(AsyncOneCallApiCurrent(LAT, LON, KEY).update_data())
+        await asyncio.sleep(0.1)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        await AsyncOneCallApiSession.shared().close()
+
+    with OneCallApiStubServer(latency=0.5) as server:
+        monkeypatch.setattr(OneCallApi, "base_url", server.url)
+        asyncio.run(update())
+    assert breaker.state() == HALF_OPEN
+    assert breaker.allow() is True
+
+
+@pytest.mark.skipif(aiohttp is not None, reason="aiohttp is installed")
+def test_0007(monkeypatch):
+    """Test: validate asyncio update_data raises ImportError without aiohttp, leaving the breaker untouched."""
+    breaker = OneCallApiCircuitBreaker(1, cooldown=0.0)
+    monkeypatch.setattr(OneCallApi, "breaker", breaker)
+    with pytest.raises(ImportError):
+        asyncio.run(AsyncOneCallApiCurrent(LAT, LON, KEY).update_data())
+    assert breaker.stats() == {"state": CLOSED, "failures": 0, "opened": 0, "rejected": 0}
+
+
+def test_0008(monkeypatch):
+    """Test: validate only the probes decide whether a half-open breaker closes, late calls are ignored."""
+    breaker = OneCallApiCircuitBreaker(1, cooldown=0.0)
+    late = breaker.acquire()
+    breaker.record(http_error(503), breaker.acquire())
+    probe = breaker.acquire()
+    assert breaker.state() == HALF_OPEN
+    assert probe is not None and probe != late
+    breaker.record(None, late)
+    assert breaker.state() == HALF_OPEN
+    breaker.record(http_error(503), late)
+    breaker.release(late)
+    assert breaker.state() == HALF_OPEN
+    assert breaker.acquire() is None
+    breaker.record(None, probe)
+    assert breaker.stats() == {"state": CLOSED, "failures": 0, "opened": 1, "rejected": 1}
+
+    class BlockedSession(OneCallApiSession):
+        """Support class: a session failing its requests once released."""
+
+        def __init__(self):
+            """This is the constructor method."""
+            super().__init__()
+            self.released = threading.Event()
+
+        def get(self, url, **kwargs):
+            """Raises a connection error once released."""
+            self.released.wait(5.0)
+            raise requests.exceptions.ConnectionError("OpenWeatherMap is down")
+
+    session = BlockedSession()
+    monkeypatch.setattr(OneCallApi, "session", session)
+    monkeypatch.setattr(OneCallApi, "breaker", breaker)
+    with ThreadPoolExecutor(1) as executor:
+        update = executor.submit(OneCallApiCurrent(LAT, LON, KEY).update_data)
+        time.sleep(0.1)
+        breaker.record(http_error(503), breaker.acquire())
+        probe = breaker.acquire()
+        session.released.set()
+        assert update.result() is False
+    assert breaker.state() == HALF_OPEN
+    breaker.record(None, probe)
+    assert breaker.state() == CLOSED
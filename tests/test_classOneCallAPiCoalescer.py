@@ -0,0 +1,149 @@
+"""Test Module: OneCallApiCoalescer."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCoalescer import OneCallApiCoalescer
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiSession import OneCallApiSession
+
+# CONSTANT DATA
+KEY = "abcdef1234567890abcdef1234567890"
+POINTS = [(45.121 + idx * 0.0001, 1.2345 - idx * 0.0001) for idx in range(20)]
+
+
+class SlowSession(OneCallApiSession):
+    """Support class: a session whose requests take some time, to have them overlap."""
+
+    def get(self, url, **kwargs):
+        """Makes an HTTP GET request after a delay."""
+        time.sleep(0.2)
+        return super().get(url, **kwargs)
+
+
+def test_0000(monkeypatch):
+    """Test: validate coordinates snapping in URL and cache key."""
+    monkeypatch.setattr(OneCallApi, "snap", 0.01)
+    oca = OneCallApi(45.1234, 1.2361, KEY, "alerts")
+    assert oca.lat == 45.1234
+    assert oca.cache_key() == (45.12, 1.24, ("alerts",), "metric")
+    assert "lat=45.12&lon=1.24&" in oca.url
+    assert OneCallApi(45.1235, 1.2449, KEY, "alerts").url == oca.url
+    monkeypatch.setattr(OneCallApi, "snap", 0.25)
+    assert OneCallApi(-45.13, 179.9, KEY).cache_key()[:2] == (-45.25, 180.0)
+
+
+def test_0001():
+    """Test: validate method run shares one call between concurrent callers."""
+    coalescer = OneCallApiCoalescer()
+    calls = []
+    barrier = threading.Barrier(5)
+
+    def slow_call():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"lat": 1.0}
+
+    def run():
+        barrier.wait()
+        return coalescer.run("key", slow_call)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        results = list(executor.map(lambda _: run(), range(5)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert coalescer.stats() == {"requests": 1, "coalesced": 4}
+    # once done, a new call is performed
+    coalescer.run("key", slow_call)
+    assert len(calls) == 2
+
+
+def test_0002():
+    """Test: validate method run shares errors between concurrent callers."""
+    coalescer = OneCallApiCoalescer()
+
+    def failing_call():
+        time.sleep(0.1)
+        raise ValueError("failure")
+
+    def run():
+        with pytest.raises(ValueError):
+            coalescer.run("key", failing_call)
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert coalescer.stats()["requests"] + coalescer.stats()["coalesced"] == 3
+
+
+def test_0003(stub_server, monkeypatch):
+    """Test: validate nearby locations updated concurrently share a single request."""
+    monkeypatch.setattr(OneCallApi, "snap", 0.01)
+    monkeypatch.setattr(OneCallApi, "coalescer", OneCallApiCoalescer())
+    monkeypatch.setattr(OneCallApi, "session", SlowSession())
+    ocas = [OneCallApiCurrent(lat, lon, KEY) for lat, lon in POINTS]
+    with ThreadPoolExecutor(max_workers=len(ocas)) as executor:
+        assert list(executor.map(lambda oca: oca.update_data(), ocas)) == [True] * len(ocas)
+    assert stub_server.requests == 1
+    assert all(oca.raw_data() is ocas[0].raw_data() for oca in ocas)
+    assert ocas[0].raw_data()["lat"] == 45.12
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0004(stub_server, monkeypatch):
+    """Test: validate nearby locations updated concurrently with asyncio share a single request."""
+    monkeypatch.setattr(OneCallApi, "snap", 0.01)
+    monkeypatch.setattr(OneCallApi, "coalescer", OneCallApiCoalescer())
+    ocas = [AsyncOneCallApiCurrent(lat, lon, KEY) for lat, lon in POINTS]
+
+    async def update_all():
+        results = await asyncio.gather(*(oca.update_data() for oca in ocas))
+        await AsyncOneCallApiSession.shared().close()
+        return results
+
+    assert asyncio.run(update_all()) == [True] * len(ocas)
+    assert stub_server.requests == 1
+    assert OneCallApi.coalescer.stats() == {"requests": 1, "coalesced": len(ocas) - 1}
+
+
+def test_0005():
+    """Test: validate method run_async lets waiting tasks retry when the leader task is cancelled."""
+    coalescer = OneCallApiCoalescer()
+    calls = []
+
+    async def slow_call():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return len(calls)
+
+    async def run_all():
+        leader = asyncio.ensure_future(coalescer.run_async("key", slow_call))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(coalescer.run_async("key", slow_call)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*followers)
+
+    assert asyncio.run(run_all()) == [2, 2, 2]
+    assert coalescer.stats() == {"requests": 2, "coalesced": 2}
+
+
+def test_0006(monkeypatch):
+    """Test: validate coordinates snapping stays within range at the poles and the antimeridian."""
+    monkeypatch.setattr(OneCallApi, "snap", 0.7)
+    assert OneCallApi(90.0, -180.0, KEY).cache_key()[:2] == (90.0, -180.0)
+    assert OneCallApi(-90.0, 180.0, KEY).cache_key()[:2] == (-90.0, 180.0)
+    assert OneCallApi(89.9, 179.99, KEY).cache_key()[:2] == (90.0, 180.0)
+    assert OneCallApi(89.5, -179.5, KEY).cache_key()[:2] == (89.6, -179.2)
+    assert "lat=90.0&lon=-180.0&" in OneCallApi(90.0, -180.0, KEY).url
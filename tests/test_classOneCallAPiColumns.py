@@ -0,0 +1,90 @@
+"""Test Module: OneCallApiColumns."""
+from array import array
+
+import pytest
+
+from pocar.OneCallApiColumns import numpy
+from pocar.OneCallApiColumns import OneCallApiColumns
+
+# CONSTANT DATA
+ENTRIES = [
+    {"dt": 1628690400, "temp": 31.52, "pressure": 1016, "pop": 0, "feels": {"day": 30.1}},
+    {"dt": 1628694000, "temp": 30.88, "pop": 0.2, "feels": {"day": 29.4}},
+    {"dt": 1628697600, "temp": 29, "pressure": 1015.5},
+]
+FIELDS = {"dt": "q", "temp": "d", "pressure": "q", "pop": "d", ("feels", "day"): "d"}
+
+
+def test_0000():
+    """Test: validate the columns are typed arrays holding the values of the entries."""
+    columns = OneCallApiColumns(ENTRIES, FIELDS)
+    assert len(columns) == 3
+    assert "temp" in columns
+    assert "humidity" not in columns
+    assert columns.column("dt") == array("q", [1628690400, 1628694000, 1628697600])
+    assert columns.column("temp") == array("d", [31.52, 30.88, 29.0])
+    assert columns.values("temp") == [31.52, 30.88, 29.0]
+
+
+def test_0001():
+    """Test: validate missing values are masked and read as N/A."""
+    columns = OneCallApiColumns(ENTRIES, FIELDS)
+    assert columns.mask("pop") == bytearray([1, 1, 0])
+    assert columns.column("pop")[2] == 0
+    assert columns.value("pop", 1) == 0.2
+    assert columns.value("pop", 2) == "N/A"
+    assert columns.values("pop") == [0, 0.2, "N/A"]
+    assert columns.values(("feels", "day")) == [30.1, 29.4, "N/A"]
+
+
+def test_0002():
+    """Test: validate an integer field holding floats falls back to a float column."""
+    columns = OneCallApiColumns(ENTRIES, FIELDS)
+    assert columns.column("pressure").typecode == "d"
+    assert columns.values("pressure") == [1016, "N/A", 1015.5]
+
+
+def test_0003():
+    """Test: validate values are cut or padded with N/A to the requested size."""
+    columns = OneCallApiColumns(ENTRIES, FIELDS)
+    assert columns.values("temp", 2) == [31.52, 30.88]
+    assert columns.values("temp", 5) == [31.52, 30.88, 29.0, "N/A", "N/A"]
+    assert OneCallApiColumns([], FIELDS).values("temp", 2) == ["N/A", "N/A"]
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+def test_0004():
+    """Test: validate the numpy arrays hold NaN for missing values and are shared between readers."""
+    columns = OneCallApiColumns(ENTRIES, FIELDS)
+    values = columns.array("pop")
+    assert values.dtype == numpy.float64
+    assert values[:2].tolist() == [0.0, 0.2]
+    assert numpy.isnan(values[2])
+    assert columns.array("pop") is values
+    assert not values.flags.writeable
+    padded = columns.array("temp", 5)
+    assert padded[:3].tolist() == [31.52, 30.88, 29.0]
+    assert numpy.isnan(padded[3:]).all()
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+def test_0005():
+    """Test: validate the numpy datetimes hold NaT for missing values."""
+    columns = OneCallApiColumns(ENTRIES + [{"temp": 28.0}], FIELDS)
+    values = columns.datetimes("dt")
+    assert values.dtype == numpy.dtype("datetime64[s]")
+    assert values[0] == numpy.datetime64("2021-08-11T14:00:00")
+    assert numpy.isnat(values[3])
+    assert numpy.isnat(columns.datetimes("dt", 6)[4:]).all()
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+def test_0006():
+    """Test: validate many fields are written into the columns of a 2-D array."""
+    columns = OneCallApiColumns(ENTRIES, FIELDS)
+    out = numpy.zeros((4, 2))
+    columns.fill_fields(["temp", "pop"], out)
+    assert out[:3, 0].tolist() == [31.52, 30.88, 29.0]
+    assert out[:2, 1].tolist() == [0.0, 0.2]
+    assert numpy.isnan(out[2, 1])
+    assert numpy.isnan(out[3]).all()
@@ -0,0 +1,101 @@
+"""Test Module: OneCallApiCombined."""
+from pocar.OneCallApiAlerts import OneCallApiAlerts
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMinutely import OneCallApiMinutely
+from pocar.OneCallApiStubServer import build_payload
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def test_0000():
+    """Test: validate constructor nominal case."""
+    oca = OneCallApiCombined(LAT, LON, KEY)
+    assert oca.exc == ""
+    assert isinstance(oca.current(), OneCallApiCurrent)
+    assert isinstance(oca.minutely(), OneCallApiMinutely)
+    assert isinstance(oca.hourly(), OneCallApiHourly)
+    assert isinstance(oca.daily(), OneCallApiDaily)
+    assert isinstance(oca.alerts(), OneCallApiAlerts)
+    assert oca.hourly().lat == LAT
+
+
+def test_0001():
+    """Test: validate the views share the response of the combined object, without copy."""
+    oca = OneCallApiCombined(LAT, LON, KEY)
+    rawdata = build_payload(LAT, LON)
+    oca._rawdata = rawdata
+    oca._timestamp = 12345
+    assert oca.current().raw_data() is rawdata
+    assert oca.hourly().raw_data_hourly() is rawdata["hourly"]
+    assert oca.daily().timestamp() == 12345
+    assert oca.current().temperature() == rawdata["current"]["temp"]
+    assert oca.minutely().precipitation(3) == rawdata["minutely"][3]["precipitation"]
+    assert oca.hourly().temp(all_values=True) == [entry["temp"] for entry in rawdata["hourly"]]
+    assert oca.daily().temp_max(2) == rawdata["daily"][2]["temp"]["max"]
+    assert oca.alerts().event() == rawdata["alerts"][0]["event"]
+
+
+def test_0002(stub_server):
+    """Test: validate one update feeds all views with a single request."""
+    oca = OneCallApiCombined(LAT, LON, KEY)
+    assert oca.hourly().update_data() is True
+    assert stub_server.requests == 1
+    for view in (oca.current(), oca.minutely(), oca.hourly(), oca.daily(), oca.alerts()):
+        assert view.raw_data() is oca.raw_data()
+        assert view.timestamp() == oca.timestamp()
+    assert oca.current().humidity() != "N/A"
+    assert len(oca.minutely().precipitation(all_values=True)) == 61
+    assert oca.alerts().sender_name() == "METEO-FRANCE"
+    assert oca.update_data() is True
+    assert stub_server.requests == 2
+    assert oca.daily().raw_data() is oca.raw_data()
+
+
+def test_0003(stub_server):
+    """Test: validate the views report the stale flag of the combined object."""
+    oca = OneCallApiCombined(LAT, LON, KEY)
+    assert oca.daily().update_data() is True
+    assert oca.daily().stale() is False
+    stub_server.error_rate = 1.0
+    assert oca.current().update_data() is False
+    assert oca.stale() is True
+    assert oca.current().stale() is True
+    assert oca.alerts().stale() is True
+    stub_server.error_rate = 0.0
+    assert oca.update_data() is True
+    assert oca.hourly().stale() is False
+
+
+def test_0004():
+    """Test: validate the switches set on the combined object apply to its views."""
+    oca = OneCallApiCombined(LAT, LON, KEY)
+    oca._rawdata = build_payload(LAT, LON)
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    ocac._rawdata = oca._rawdata
+    oca.response_timezone = ocac.response_timezone = True
+    oca.trace_access = False
+    assert oca.current().response_timezone is True
+    assert oca.current().sunrise() == ocac.sunrise()
+    assert oca.hourly().trace_access is False and oca.daily().trace_access is False
+    oca.hourly().numpy_series = False
+    assert oca.numpy_series is False
+    assert OneCallApiCombined(LAT, LON, KEY).hourly().response_timezone is False
+
+
+def test_0005():
+    """Test: validate sections compacted through the views are returned rebuilt by the combined object."""
+    oca = OneCallApiCombined(LAT, LON, KEY)
+    rawdata = build_payload(LAT, LON)
+    oca._rawdata = rawdata
+    oca.current().compact()
+    oca.daily().compact()
+    assert oca._rawdata["current"] is oca.current().record()
+    assert oca._rawdata["daily"] is oca.daily().records()
+    assert oca.raw_data() == rawdata
+    assert oca.hourly().raw_data() == rawdata
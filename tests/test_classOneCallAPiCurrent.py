@@ -1,5 +1,8 @@
 """Test Module: OneCallApiCurrent."""
+import json
+
 from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiRecords import OneCallApiCurrentRecord
 
 # CONSTANT DATA
 LAT = 45.1234
@@ -186,3 +189,39 @@ def test_0021():
     ocac = OneCallApiCurrent(LAT, LON, KEY)
     ocac._rawdata = RAW_DATA_CURRENT
     assert ocac.raw_data_current() == RAW_DATA_CURRENT["current"]
+
+
+def test_0022(monkeypatch):
+    """Test: validate date methods format times in the response time zone when response_timezone is enabled."""
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    ocac._rawdata = RAW_DATA_CURRENT
+    monkeypatch.setattr(OneCallApiCurrent, "response_timezone", True)
+    assert ocac.data_time() == "2021-08-09 18:24:52"
+    assert ocac.sunrise() == "2021-08-09 06:29:39"
+
+
+def test_0023():
+    """Test: validate method compact keeps the values, and leaves the response it was given untouched."""
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    ocac._rawdata = RAW_DATA_CURRENT
+    assert ocac.record() is ocac.record()
+    temp, sunrise, icon = ocac.temperature(), ocac.sunrise(), ocac.weather_condition_icon()
+    ocac.compact()
+    assert isinstance(RAW_DATA_CURRENT["current"], dict)
+    assert ocac._rawdata["current"] is ocac.record()
+    assert (ocac.temperature(), ocac.sunrise(), ocac.weather_condition_icon()) == (temp, sunrise, icon)
+    assert ocac.rain_volume() == "N/A"
+    assert ocac.raw_data_current() == RAW_DATA_CURRENT["current"]
+
+
+def test_0024():
+    """Test: validate method raw_data returns the same response, as plain dictionaries, before and after compact."""
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    rain = {"main": "Rain", "id": 500, "description": "light rain", "icon": "10d"}
+    current = dict(RAW_DATA_CURRENT["current"], weather=RAW_DATA_CURRENT["current"]["weather"] + [rain], extra=1)
+    ocac._rawdata = dict(RAW_DATA_CURRENT, current=current)
+    before = json.dumps(ocac.raw_data(), sort_keys=True)
+    ocac.compact()
+    assert isinstance(ocac._rawdata["current"], OneCallApiCurrentRecord)
+    assert json.dumps(ocac.raw_data(), sort_keys=True) == before
+    assert ocac.raw_data_current() == current
@@ -1,7 +1,11 @@
 """Test Module: OneCallApiDaily."""
+import json
+
 import pytest
 
+from pocar.OneCallApiColumns import numpy
 from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiRecords import OneCallApiDailyRecord
 
 # CONSTANT DATA
 LAT = 45.1234
@@ -468,3 +472,45 @@ def test_0029():
     ocad = OneCallApiDaily(LAT, LON, KEY)
     ocad._rawdata = RAW_DATA_DAILY
     validate_weather_func(ocad.weather_condition_icon, "icon")
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+def test_0030(monkeypatch):
+    """Test: validate series are numpy arrays when numpy_series is enabled."""
+    ocad = OneCallApiDaily(LAT, LON, KEY)
+    ocad._rawdata = RAW_DATA_DAILY
+    monkeypatch.setattr(OneCallApiDaily, "numpy_series", True)
+    assert ocad.temp_max(all_values=True).tolist() == [entry["temp"]["max"] for entry in RAW_DATA_DAILY["daily"][:7]]
+    assert ocad.humidity(all_values=True).dtype == numpy.float64
+    sunrise = ocad.sunrise(all_values=True)
+    assert sunrise[1] == numpy.datetime64(RAW_DATA_DAILY["daily"][1]["sunrise"], "s")
+
+
+def test_0031():
+    """Test: validate method compact keeps the values, and leaves the response it was given untouched."""
+    ocad = OneCallApiDaily(LAT, LON, KEY)
+    ocad._rawdata = RAW_DATA_DAILY
+    assert ocad.records() is ocad.records()
+    temps, sunrise, icon = ocad.temp_max(all_values=True), ocad.sunrise(day=2), ocad.weather_condition_icon(day=3)
+    ocad.compact()
+    assert isinstance(RAW_DATA_DAILY["daily"][0], dict)
+    assert ocad._rawdata["daily"] is ocad.records()
+    assert ocad.temp_max(all_values=True) == temps
+    assert (ocad.sunrise(day=2), ocad.weather_condition_icon(day=3)) == (sunrise, icon)
+    assert ocad.temp_max(day=7) == RAW_DATA_DAILY["daily"][7]["temp"]["max"]
+    assert ocad.raw_data_daily() == RAW_DATA_DAILY["daily"]
+
+
+def test_0032():
+    """Test: validate method raw_data returns the same response, as plain dictionaries, before and after compact."""
+    ocad = OneCallApiDaily(LAT, LON, KEY)
+    rain = {"main": "Rain", "id": 500, "description": "light rain", "icon": "10d"}
+    daily = [dict(entry, summary="Expect a day of rain") for entry in RAW_DATA_DAILY["daily"]]
+    daily[2]["weather"] = daily[2]["weather"] + [rain]
+    ocad._rawdata = dict(RAW_DATA_DAILY, daily=daily)
+    before = json.dumps(ocad.raw_data(), sort_keys=True)
+    ocad.compact()
+    assert isinstance(ocad._rawdata["daily"][0], OneCallApiDailyRecord)
+    assert json.dumps(ocad.raw_data(), sort_keys=True) == before
+    assert ocad.raw_data_daily() == daily
+    assert ocad.weather_condition_main(day=2) == daily[2]["weather"][0]["main"]
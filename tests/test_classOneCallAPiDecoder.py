@@ -0,0 +1,60 @@
+"""Test Module: OneCallApiDecoder."""
+import json
+
+import pytest
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiDecoder import BACKENDS
+from pocar.OneCallApiDecoder import OneCallApiDecoder
+from pocar.OneCallApiStubServer import build_payload
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+class FailingDecoder:  # pylint: disable=too-few-public-methods
+    """Decoder raising the error of an invalid response body."""
+
+    def decode(self, content):
+        """Raises ValueError."""
+        raise ValueError(f"invalid body of {len(content)} bytes")
+
+
+def test_0000():
+    """Test: validate the default decoder uses the fastest library installed."""
+    available = OneCallApiDecoder.available()
+    assert available[-1] == "json"
+    assert OneCallApiDecoder().backend == available[0]
+    assert OneCallApiDecoder.shared() is OneCallApiDecoder.shared()
+    with pytest.raises(ValueError):
+        OneCallApiDecoder("yaml")
+    missing = [name for name in BACKENDS if name not in available]
+    if missing:
+        with pytest.raises(ImportError):
+            OneCallApiDecoder(missing[0])
+
+
+def test_0001():
+    """Test: validate every library installed decodes a full response from bytes, and rejects invalid JSON."""
+    payload = build_payload(LAT, LON)
+    content = json.dumps(payload).encode()
+    for backend in OneCallApiDecoder.available():
+        decoder = OneCallApiDecoder(backend)
+        assert decoder.decode(content) == payload
+        with pytest.raises(ValueError):
+            decoder.decode(b'{"current": ')
+
+
+def test_0002(stub_server, monkeypatch):
+    """Test: validate update_data decodes with the decoder of the object, and fails on invalid JSON."""
+    oca = OneCallApi(LAT, LON, KEY)
+    oca.decoder = OneCallApiDecoder("json")
+    assert oca.update_data() is True
+    assert oca.raw_data()["lat"] == LAT
+    monkeypatch.setattr(OneCallApi, "decoder", FailingDecoder())
+    oca = OneCallApi(LAT, LON, KEY)
+    assert oca.update_data() is False
+    assert oca.raw_data() == {}
+    assert stub_server.requests == 2
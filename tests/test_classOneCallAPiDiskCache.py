@@ -0,0 +1,97 @@
+"""Test Module: OneCallApiDiskCache."""
+import multiprocessing
+import time
+
+import pytest
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCache import OneCallApiCache
+from pocar.OneCallApiDiskCache import OneCallApiDiskCache
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiLazyResponse import OneCallApiLazyResponse
+from pocar.OneCallApiStubServer import build_payload
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+KEY_HOURLY = (LAT, LON, ("alerts", "current", "daily", "minutely"), "metric")
+
+
+def write_entries(path, first, count):
+    """Support function to write cache entries from another process."""
+    cache = OneCallApiDiskCache(path)
+    for lat in range(first, first + count):
+        cache.put((float(lat), LON, (), "metric"), build_payload(lat, LON), time.time())
+
+
+def test_0000(tmp_path):
+    """Test: validate constructor and method ttl."""
+    cache = OneCallApiDiskCache(str(tmp_path / "cache.sqlite"), {"hourly": 120})
+    assert cache.ttl(KEY_HOURLY) == 120
+    assert cache.stats() == {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "size": 0}
+    with pytest.raises(ValueError):
+        OneCallApiDiskCache(str(tmp_path / "cache.sqlite"), {"weekly": 10})
+
+
+def test_0001(tmp_path):
+    """Test: validate methods get, put, purge and clear."""
+    cache = OneCallApiDiskCache(str(tmp_path / "cache.sqlite"))
+    rawdata = build_payload(LAT, LON, "current,daily,minutely,alerts")
+    assert cache.get(KEY_HOURLY) is None
+    now = time.time()
+    cache.put(KEY_HOURLY, rawdata, now)
+    assert cache.get(KEY_HOURLY) == (rawdata, now)
+    cache.put((LAT, LON, (), "metric"), rawdata, time.time() - 61)
+    assert cache.get((LAT, LON, (), "metric")) is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.purge() == 1
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+def test_0002(tmp_path):
+    """Test: validate concurrent writers and readers from several processes."""
+    path = str(tmp_path / "cache.sqlite")
+    OneCallApiDiskCache(path)
+    procs = [multiprocessing.Process(target=write_entries, args=(path, idx * 20, 20)) for idx in range(4)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+        assert proc.exitcode == 0
+    cache = OneCallApiDiskCache(path)
+    assert cache.stats()["size"] == 80
+    for lat in range(80):
+        assert cache.get((float(lat), LON, (), "metric"))[0]["lat"] == lat
+
+
+def test_0003(tmp_path, stub_server, monkeypatch):
+    """Test: validate a cold process warms from the disk cache, through a memory cache."""
+    path = str(tmp_path / "cache.sqlite")
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache(backend=OneCallApiDiskCache(path)))
+    assert OneCallApiHourly(LAT, LON, KEY).update_data() is True
+    assert stub_server.requests == 1
+    # a new memory cache, as in a newly started worker
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache(backend=OneCallApiDiskCache(path)))
+    ocah = OneCallApiHourly(LAT, LON, KEY)
+    assert ocah.update_data() is True
+    assert stub_server.requests == 1
+    assert len(ocah.temp(all_values=True)) == 48
+    assert OneCallApiHourly(LAT, LON, KEY).update_data() is True
+    assert OneCallApi.cache.stats()["hits"] == 1
+
+
+def test_0004(tmp_path, stub_server, monkeypatch):
+    """Test: validate a disk cache hit is decoded as the response received, with lazy sections."""
+    path = str(tmp_path / "cache.sqlite")
+    monkeypatch.setattr(OneCallApi, "lazy_sections", True)
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiDiskCache(path))
+    assert OneCallApiHourly(LAT, LON, KEY).update_data() is True
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache(backend=OneCallApiDiskCache(path)))
+    ocah = OneCallApiHourly(LAT, LON, KEY)
+    assert ocah.update_data() is True
+    assert stub_server.requests == 1
+    assert isinstance(ocah.raw_data(), OneCallApiLazyResponse)
+    assert ocah.raw_data().decoded() == []
+    assert len(ocah.temp(all_values=True)) == 48
@@ -0,0 +1,90 @@
+"""Test Module: OneCallApiFleet."""
+import pytest
+
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiFleet import numpy
+from pocar.OneCallApiFleet import OneCallApiFleet
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiStubServer import build_payload
+
+pytestmark = pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+NOW = 1628690400
+
+
+def build_objects(cls, count):
+    """Returns objects of class cls holding a response, one per location."""
+    objects = []
+    for idx in range(count):
+        oca = cls(LAT + idx, LON, KEY)
+        oca._rawdata = build_payload(LAT + idx, LON, now=NOW)
+        objects.append(oca)
+    return objects
+
+
+def test_0000():
+    """Test: validate the fleet stacks the hourly forecasts of all locations."""
+    objects = build_objects(OneCallApiHourly, 3)
+    fleet = OneCallApiFleet(objects)
+    assert len(fleet) == 3
+    assert fleet.data.shape == (3, 48, len(fleet.fields))
+    assert "dt" not in fleet.fields
+    assert fleet.data.flags.c_contiguous
+    for row, oca in enumerate(objects):
+        assert fleet.field("wind_gust")[row].tolist() == oca.wind_gust(all_values=True)
+        assert fleet.times[row, 5] == numpy.datetime64(oca.data_time(5, 1), "s")
+        assert fleet.coords[row].tolist() == [oca.lat, oca.lon]
+    with pytest.raises(ValueError):
+        fleet.field("unknown")
+
+
+def test_0001():
+    """Test: validate reductions ignore missing values, and a location with no value reduces to NaN."""
+    objects = build_objects(OneCallApiHourly, 3)
+    del objects[1]._rawdata["hourly"][2]["wind_gust"]
+    objects[2]._rawdata = {}
+    fleet = OneCallApiFleet(objects, fields=["wind_gust", "temp"], steps=12)
+    assert fleet.data.shape == (3, 12, 2)
+    gusts = objects[0].wind_gust(all_values=True)[:12]
+    assert fleet.reduce("wind_gust", "max")[0] == max(gusts)
+    assert fleet.reduce("wind_gust", "min", steps=3)[1] == min(gusts[0], gusts[1])
+    assert numpy.isnan(fleet.field("wind_gust")[1, 2])
+    assert numpy.isnan(fleet.reduce("temp", "mean")[2])
+    assert numpy.isnat(fleet.times[2]).all()
+    with pytest.raises(ValueError):
+        fleet.reduce("temp", "first")
+
+
+def test_0002():
+    """Test: validate locations are selected by mask and located by coordinates."""
+    fleet = OneCallApiFleet(build_objects(OneCallApiHourly, 4))
+    selected = fleet.select(fleet.coords[:, 0] > LAT + 1.5)
+    assert len(selected) == 2
+    assert selected.field("temp").shape == (2, 48)
+    assert selected.coords[:, 0].tolist() == [LAT + 2, LAT + 3]
+    assert fleet.locate(LAT + 2.2, LON) == 2
+    with pytest.raises(ValueError):
+        OneCallApiFleet([]).locate(LAT, LON)
+
+
+def test_0003():
+    """Test: validate the fleet stacks daily forecasts, with nested fields, in the requested type."""
+    objects = build_objects(OneCallApiDaily, 2)
+    fleet = OneCallApiFleet(objects, dtype=numpy.float32)
+    assert fleet.data.dtype == numpy.float32
+    assert ("temp", "max") in fleet.fields
+    assert fleet.reduce(("temp", "max"), "max", steps=7)[1] == pytest.approx(max(objects[1].temp_max(all_values=True)))
+
+
+def test_0004():
+    """Test: validate locations are located across the antimeridian."""
+    objects = [OneCallApiHourly(LAT, lon, KEY) for lon in (-179.9, 170.0, 0.0)]
+    fleet = OneCallApiFleet(objects)
+    assert fleet.locate(LAT, 179.9) == 0
+    assert fleet.locate(LAT, -175.0) == 0
+    assert fleet.locate(LAT, 172.0) == 1
+    assert fleet.locate(LAT, -10.0) == 2
@@ -1,6 +1,10 @@
 """Test Module: OneCallApiHourly."""
+import logging
+from datetime import datetime
+
 import pytest
 
+from pocar.OneCallApiColumns import numpy
 from pocar.OneCallApiHourly import OneCallApiHourly
 
 # CONSTANT DATA
@@ -1223,3 +1227,64 @@ def test_0018():
     ocah = OneCallApiHourly(LAT, LON, KEY)
     ocah._rawdata = RAW_DATA_HOURLY
     validate_value_func(ocah.pop, "pop")
+
+
+def test_0019(caplog, monkeypatch):
+    """Test: validate field reads are not logged when trace_access is disabled."""
+    ocah = OneCallApiHourly(LAT, LON, KEY)
+    ocah._rawdata = RAW_DATA_HOURLY
+    monkeypatch.setattr(OneCallApiHourly, "trace_access", False)
+    with caplog.at_level(logging.DEBUG, logger="pocar.OneCallApiHourly"):
+        assert ocah.temp(all_values=True) == [entry["temp"] for entry in RAW_DATA_HOURLY["hourly"]]
+        assert ocah.weather_icon(3) == RAW_DATA_HOURLY["hourly"][3]["weather"][0]["icon"]
+    assert not caplog.records
+
+
+def test_0020():
+    """Test: validate the Hourly columns are built once per response and rebuilt on a new response."""
+    ocah = OneCallApiHourly(LAT, LON, KEY)
+    assert len(ocah.columns()) == 0
+    assert ocah.temp(all_values=True) == ["N/A"] * 48
+    ocah._rawdata = RAW_DATA_HOURLY
+    columns = ocah.columns()
+    assert len(columns) == len(RAW_DATA_HOURLY["hourly"])
+    assert ocah.columns() is columns
+    assert ocah.pressure(all_values=True) == [entry["pressure"] for entry in RAW_DATA_HOURLY["hourly"]]
+    ocah._rawdata = {"hourly": [{"dt": 1628690400, "temp": 12.5}]}
+    assert ocah.columns() is not columns
+    assert ocah.temp() == 12.5
+    assert ocah.wind_gust() == "N/A"
+    assert ocah.temp(all_values=True) == [12.5] + ["N/A"] * 47
+    assert ocah.data_time(metrics=1, all_values=True) == [1628690400] + ["N/A"] * 47
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+def test_0021(monkeypatch):
+    """Test: validate series are numpy arrays, built once per response, when numpy_series is enabled."""
+    ocah = OneCallApiHourly(LAT, LON, KEY)
+    ocah._rawdata = RAW_DATA_HOURLY
+    monkeypatch.setattr(OneCallApiHourly, "numpy_series", True)
+    temp = ocah.temp(all_values=True)
+    assert temp.dtype == numpy.float64
+    assert temp.tolist() == [entry["temp"] for entry in RAW_DATA_HOURLY["hourly"]]
+    assert ocah.temp(all_values=True) is temp
+    assert ocah.temp(3) == RAW_DATA_HOURLY["hourly"][3]["temp"]
+    data_time = ocah.data_time(all_values=True)
+    assert data_time.dtype == numpy.dtype("datetime64[s]")
+    assert data_time[0] == numpy.datetime64(RAW_DATA_HOURLY["hourly"][0]["dt"], "s")
+    ocah._rawdata = {}
+    assert numpy.isnan(ocah.pressure(all_values=True)).all()
+
+
+def test_0022():
+    """Test: validate formatted data times are kept per response and returned as copies."""
+    ocah = OneCallApiHourly(LAT, LON, KEY)
+    ocah._rawdata = RAW_DATA_HOURLY
+    values = ocah.data_time(all_values=True)
+    expected = [f"{datetime.fromtimestamp(entry['dt']):%Y-%m-%d %H:%M:%S}" for entry in RAW_DATA_HOURLY["hourly"]]
+    assert values == expected
+    assert values == [ocah.data_time(idx) for idx in range(48)]
+    values[0] = "changed"
+    assert ocah.data_time(all_values=True) == expected
+    ocah._rawdata = {"hourly": [{"dt": 1628690400}]}
+    assert ocah.data_time(all_values=True) == [f"{datetime.fromtimestamp(1628690400):%Y-%m-%d %H:%M:%S}"] + ["N/A"] * 47
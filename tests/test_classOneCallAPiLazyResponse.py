@@ -0,0 +1,96 @@
+"""Test Module: OneCallApiLazyResponse."""
+import json
+
+import pytest
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiDiskCache import OneCallApiDiskCache
+from pocar.OneCallApiLazyResponse import OneCallApiLazyResponse
+from pocar.OneCallApiStubServer import build_payload
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+PAYLOAD = build_payload(LAT, LON)
+
+
+def test_0000():
+    """Test: validate sections are decoded on first access only, and once."""
+    response = OneCallApiLazyResponse(json.dumps(PAYLOAD).encode())
+    assert response.decoded() == []
+    assert response["timezone_offset"] == PAYLOAD["timezone_offset"]
+    assert "hourly" in response
+    assert "unknown" not in response
+    assert list(response) == list(PAYLOAD)
+    assert response.decoded() == []
+    current = response["current"]
+    assert current == PAYLOAD["current"]
+    assert response["current"] is current
+    assert response.decoded() == ["current"]
+    assert response.get("unknown") is None
+    assert response == PAYLOAD
+
+
+def test_0001():
+    """Test: validate indented bodies, and bodies holding some of the sections."""
+    assert OneCallApiLazyResponse(json.dumps(PAYLOAD, indent=2).encode()) == PAYLOAD
+    hourly = {key: PAYLOAD[key] for key in ("lat", "lon", "timezone", "timezone_offset", "hourly")}
+    response = OneCallApiLazyResponse(json.dumps(hourly).encode())
+    assert len(response) == 5
+    assert "daily" not in response
+    assert response["hourly"] == PAYLOAD["hourly"]
+    assert OneCallApiLazyResponse(b'{"lat": 1.0, "lon": 2.0}') == {"lat": 1.0, "lon": 2.0}
+    assert OneCallApiLazyResponse(b'{"current": {"dt": 1}}') == {"current": {"dt": 1}}
+
+
+def test_0002():
+    """Test: validate the whole body is decoded when it can not be split into sections."""
+    out_of_order = b'{"lat": 1.0, "daily": [1], "current": {"main": "daily"}}'
+    assert OneCallApiLazyResponse(out_of_order) == {"lat": 1.0, "daily": [1], "current": {"main": "daily"}}
+    unknown_key = b'{"lat": 1.0, "current": {"dt": 1}, "extra": 3}'
+    response = OneCallApiLazyResponse(unknown_key)
+    assert response["current"] == {"dt": 1}
+    assert response["extra"] == 3
+    with pytest.raises(ValueError):
+        OneCallApiLazyResponse(b'{"lat": 1.0 2, "current": {}}')
+
+
+def test_0003(stub_server, monkeypatch, tmp_path):
+    """Test: validate update_data with lazy sections, read through views and stored in a disk cache."""
+    monkeypatch.setattr(OneCallApi, "lazy_sections", True)
+    cache = OneCallApiDiskCache(str(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(OneCallApi, "cache", cache)
+    ocac = OneCallApiCombined(LAT, LON, KEY)
+    assert ocac.update_data() is True
+    assert isinstance(ocac.raw_data(), OneCallApiLazyResponse)
+    assert ocac.current().temperature() == 20.0
+    assert ocac.raw_data().decoded() == ["current"]
+    assert ocac.hourly().temp(all_values=True) == [entry["temp"] for entry in ocac.raw_data()["hourly"]]
+    assert cache.get(ocac.cache_key())[0] == ocac.raw_data()
+    assert stub_server.requests == 1
+
+
+def test_0004():
+    """Test: validate a section is replaced, and a lazy response compacted, without decoding the other sections."""
+    response = OneCallApiLazyResponse(json.dumps(PAYLOAD).encode())
+    replaced = response.replace("daily", [])
+    assert replaced["daily"] == []
+    assert response["daily"] == PAYLOAD["daily"]
+    assert replaced.replace("extra", 1)["extra"] == 1
+    assert "extra" not in replaced
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    ocac._rawdata = OneCallApiLazyResponse(json.dumps(PAYLOAD).encode())
+    ocac.compact()
+    assert isinstance(ocac.raw_data(), OneCallApiLazyResponse)
+    assert ocac.raw_data().decoded() == ["current"]
+    assert ocac.temperature() == PAYLOAD["current"]["temp"]
+    ocad = OneCallApiDaily(LAT, LON, KEY)
+    ocad._rawdata = OneCallApiLazyResponse(json.dumps(PAYLOAD).encode())
+    expected = ocad.temp_max(all_values=True)
+    ocad.compact()
+    assert ocad._rawdata.decoded() == ["daily"]
+    assert ocad.temp_max(all_values=True) == expected
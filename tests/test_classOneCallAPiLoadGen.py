@@ -0,0 +1,66 @@
+"""Test Module: OneCallApiLoadGen."""
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiLoadGen import main
+from pocar.OneCallApiLoadGen import percentile
+from pocar.OneCallApiLoadGen import run_load
+from pocar.OneCallApiSession import OneCallApiSession
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+
+def test_0000():
+    """Test: validate function percentile returns the nearest-rank percentile."""
+    values = [float(idx) for idx in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile(values, 100) == 100.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) is None
+
+
+def test_0001():
+    """Test: validate function run_load runs the requests with threads, and restores the endpoint."""
+    base_url = OneCallApi.base_url
+    with OneCallApiStubServer() as server:
+        results = run_load(server.url, "current", locations=5, requests=20, concurrency=4)
+        assert server.statuses == {200: 20}
+    assert OneCallApi.base_url == base_url
+    assert results["requests"] == 20 and results["ok"] == 20 and results["failed"] == 0
+    assert 0 < results["p50"] <= results["p95"] <= results["p99"]
+    assert results["throughput"] > 0
+    with pytest.raises(ValueError):
+        run_load(server.url, "weekly")
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0002():
+    """Test: validate function run_load counts failed requests, and runs asyncio objects."""
+    with OneCallApiStubServer(error_rate=1.0) as server:
+        results = run_load(server.url, "daily", locations=2, requests=6, concurrency=2, use_async=True)
+    assert results["ok"] == 0 and results["failed"] == 6
+    with pytest.raises(ValueError):
+        run_load(server.url, "combined", use_async=True)
+
+
+def test_0003(capsys):
+    """Test: validate function main runs the load against a local server, and writes the latency percentiles."""
+    shared = OneCallApiSession.shared()
+    results = main(["--class", "hourly", "--locations", "3", "--requests", "12", "--throttle-rate", "0.5"])
+    output = capsys.readouterr().out
+    for name in ("throughput", "p50", "p95", "p99", "statuses"):
+        assert name in output
+    assert results["ok"] + results["failed"] == 12
+    assert sum(results["statuses"].values()) == 12
+    assert OneCallApi.retry is None and OneCallApi.rate_limiter is None
+    assert OneCallApi.session is None and OneCallApiSession.shared() is shared
+
+
+def test_0004(capsys):
+    """Test: validate function main rejects a class without asyncio variant for an asyncio load."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--class", "combined", "--async"])
+    assert exc_info.value.code == 2
+    assert "'combined' class has no asyncio variant" in capsys.readouterr().err
+    assert OneCallApi.session is None
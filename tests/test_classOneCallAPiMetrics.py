@@ -0,0 +1,161 @@
+"""Test Module: OneCallApiMetrics."""
+import asyncio
+import socket
+
+import pytest
+import requests
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiHourly
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCache import OneCallApiCache
+from pocar.OneCallApiCircuitBreaker import OneCallApiCircuitBreaker
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiMetrics import CACHE_LOOKUPS
+from pocar.OneCallApiMetrics import CONNECT_SECONDS
+from pocar.OneCallApiMetrics import DECODE_SECONDS
+from pocar.OneCallApiMetrics import DNS_SECONDS
+from pocar.OneCallApiMetrics import OneCallApiMetrics
+from pocar.OneCallApiMetrics import OneCallApiMetricsExporter
+from pocar.OneCallApiMetrics import RECEIVED_BYTES
+from pocar.OneCallApiMetrics import REQUEST_SECONDS
+from pocar.OneCallApiMetrics import REQUESTS
+from pocar.OneCallApiMetrics import RESPONSES
+from pocar.OneCallApiSession import OneCallApiSession
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+@pytest.fixture(name="registry")
+def fixture_registry(monkeypatch):
+    """Fixture: set an in-memory registry as the metrics sink of One Call Api objects."""
+    registry = OneCallApiMetrics()
+    monkeypatch.setattr(OneCallApi, "metrics", registry)
+    return registry
+
+
+def test_0000():
+    """Test: validate counters and histograms of the registry, by labels."""
+    registry = OneCallApiMetrics(buckets=(0.1, 1.0))
+    registry.inc(REQUESTS, outcome="ok")
+    registry.inc(REQUESTS, 2, outcome="ok")
+    registry.inc(REQUESTS, outcome="Timeout")
+    assert registry.counter(REQUESTS, outcome="ok") == 3
+    assert registry.counter(REQUESTS, outcome="HTTPError") == 0
+    for value in (0.05, 0.1, 0.5, 3.0):
+        registry.observe(REQUEST_SECONDS, value)
+    histogram = registry.histogram(REQUEST_SECONDS)
+    assert histogram["count"] == 4 and histogram["sum"] == pytest.approx(3.65)
+    assert histogram["buckets"] == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+    assert registry.histogram(DNS_SECONDS) is None
+    assert registry.stats() == {"requests": 4, "failures": 1, "received_bytes": 0, "cache_hit_ratio": None}
+    registry.reset()
+    assert registry.counter(REQUESTS, outcome="ok") == 0
+    with pytest.raises(ValueError):
+        OneCallApiMetrics(buckets=(1.0, 0.1))
+
+
+def test_0001():
+    """Test: validate the OpenMetrics text of the registry."""
+    registry = OneCallApiMetrics(buckets=(0.1,))
+    registry.inc(RESPONSES, status="200")
+    registry.observe(DECODE_SECONDS, 0.05)
+    lines = registry.openmetrics().splitlines()
+    assert "# TYPE pocar_responses counter" in lines
+    assert 'pocar_responses_total{status="200"} 1' in lines
+    assert "# TYPE pocar_decode_seconds histogram" in lines
+    assert 'pocar_decode_seconds_bucket{le="0.1"} 1' in lines
+    assert 'pocar_decode_seconds_bucket{le="+Inf"} 1' in lines
+    assert "pocar_decode_seconds_count 1" in lines
+    assert lines[-1] == "# EOF"
+
+
+def test_0002(stub_server, registry, monkeypatch):
+    """Test: validate update_data reports outcome, status, bytes, and DNS, connect, decode and total latency."""
+    monkeypatch.setattr(OneCallApi, "base_url", stub_server.url.replace("127.0.0.1", "localhost"))
+    monkeypatch.setattr(OneCallApi, "session", OneCallApiSession())
+    oca = OneCallApiHourly(LAT, LON, KEY)
+    assert oca.update_data() is True
+    assert oca.update_data() is True
+    stub_server.error_rate = 1.0
+    assert oca.update_data() is False
+    assert registry.counter(REQUESTS, outcome="ok") == 2
+    assert registry.counter(REQUESTS, outcome="HTTPError") == 1
+    assert registry.counter(RESPONSES, status="200") == 2
+    assert registry.counter(RESPONSES, status="503") == 1
+    assert registry.counter(RECEIVED_BYTES) > 2 * 10000
+    assert registry.histogram(REQUEST_SECONDS)["count"] == 3
+    assert registry.histogram(DECODE_SECONDS)["count"] == 2
+    # the first call only makes a new connection, the next ones reuse it
+    assert registry.histogram(DNS_SECONDS)["count"] == 1
+    assert registry.histogram(CONNECT_SECONDS)["count"] == 1
+    assert registry.stats()["failures"] == 1
+    OneCallApi.session.close()
+
+
+def test_0003(stub_server, registry, monkeypatch):  # pylint: disable=unused-argument
+    """Test: validate the cache hit ratio, and calls rejected by the circuit breaker are reported."""
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache())
+    oca = OneCallApiCurrent(LAT, LON, KEY)
+    for _ in range(4):
+        assert oca.update_data() is True
+    assert registry.counter(CACHE_LOOKUPS, result="miss") == 1
+    assert registry.cache_hit_ratio() == 0.75
+    monkeypatch.setattr(OneCallApi, "cache", None)
+    breaker = OneCallApiCircuitBreaker(failures=1, cooldown=60.0)
+    breaker.record(requests.exceptions.ConnectionError())
+    monkeypatch.setattr(OneCallApi, "breaker", breaker)
+    assert oca.update_data() is False
+    assert registry.counter(REQUESTS, outcome="rejected") == 1
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0004(stub_server, registry):  # pylint: disable=unused-argument
+    """Test: validate asyncio update_data reports outcome, status, connect and decode latency."""
+
+    async def update():
+        oca = AsyncOneCallApiHourly(LAT, LON, KEY)
+        assert await oca.update_data() is True
+        assert await oca.update_data() is True
+        await AsyncOneCallApiSession.shared().close()
+
+    asyncio.run(update())
+    assert registry.counter(REQUESTS, outcome="ok") == 2
+    assert registry.counter(RESPONSES, status="200") == 2
+    assert registry.histogram(CONNECT_SECONDS)["count"] == 1
+    assert registry.histogram(DECODE_SECONDS)["count"] == 2
+
+
+def test_0005(stub_server, registry):  # pylint: disable=unused-argument
+    """Test: validate the exporter serves the metrics of the registry, as OpenMetrics text."""
+    assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+    with OneCallApiMetricsExporter(registry, port=0) as exporter:
+        resp = requests.get(exporter.url, timeout=5.0)
+    assert resp.headers["Content-Type"].startswith("application/openmetrics-text")
+    assert 'pocar_requests_total{outcome="ok"} 1' in resp.text.splitlines()
+
+
+def test_0006(stub_server, monkeypatch):  # pylint: disable=unused-argument
+    """Test: validate no measure is taken without metrics sink."""
+
+    def measure(*args):
+        raise AssertionError("measure taken without metrics sink")
+
+    for name in ("start_call", "report_call", "decode_measured", "note"):
+        monkeypatch.setattr(f"pocar.OneCallApi.{name}", measure)
+    assert OneCallApi.metrics is None
+    assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+
+
+def test_0007(stub_server, registry, monkeypatch):  # pylint: disable=unused-argument
+    """Test: validate a host resolved to no address fails as a connection error."""
+    monkeypatch.setattr(OneCallApi, "session", OneCallApiSession())
+    monkeypatch.setattr(socket, "getaddrinfo", lambda *args, **kwargs: [])
+    assert OneCallApiCurrent(LAT, LON, KEY).update_data() is False
+    assert registry.counter(REQUESTS, outcome="ConnectionError") == 1
+    OneCallApi.session.close()
@@ -1,6 +1,7 @@
 """Test Module: OneCallApiMinutely."""
 import pytest
 
+from pocar.OneCallApiColumns import numpy
 from pocar.OneCallApiMinutely import OneCallApiMinutely
 
 # CONSTANT DATA
@@ -133,3 +134,14 @@ def test_0003():
     values = ocam.data_time(idx, 1, True)
     for idx in range(61):
         assert RAW_DATA_MINUTELY["minutely"][idx]["dt"] == values[idx]
+
+
+@pytest.mark.skipif(numpy is None, reason="numpy is not installed")
+def test_0004(monkeypatch):
+    """Test: validate series are numpy arrays when numpy_series is enabled."""
+    ocam = OneCallApiMinutely(LAT, LON, KEY)
+    ocam._rawdata = RAW_DATA_MINUTELY
+    monkeypatch.setattr(OneCallApiMinutely, "numpy_series", True)
+    values = ocam.precipitation(all_values=True)
+    assert values.tolist() == [entry["precipitation"] for entry in RAW_DATA_MINUTELY["minutely"]]
+    assert ocam.data_time(all_values=True)[60] == numpy.datetime64(RAW_DATA_MINUTELY["minutely"][60]["dt"], "s")
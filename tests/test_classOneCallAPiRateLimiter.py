@@ -0,0 +1,114 @@
+"""Test Module: OneCallApiRateLimiter."""
+import asyncio
+import multiprocessing
+import sys
+import time
+
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiRateLimiter import OneCallApiRateLimiter
+from pocar.OneCallApiRateLimiter import fcntl
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def timed_reserve(limiter, min_wait):
+    """Support function to take a token from a forked process, exiting with 0 if it waited at least min_wait."""
+    start = time.monotonic()
+    limiter.reserve()
+    sys.exit(0 if time.monotonic() - start >= min_wait else 1)
+
+
+def test_0000():
+    """Test: validate constructor nominal case and arguments range."""
+    assert OneCallApiRateLimiter(60).config() == {"rate": 60, "per": 60.0, "burst": 60, "path": None}
+    assert OneCallApiRateLimiter(0.5, per=1.0).config()["burst"] == 1
+    with pytest.raises(ValueError):
+        OneCallApiRateLimiter(0)
+    with pytest.raises(ValueError):
+        OneCallApiRateLimiter(10, per=0)
+    with pytest.raises(ValueError):
+        OneCallApiRateLimiter(10, burst=0)
+
+
+def test_0001():
+    """Test: validate method reserve serves the burst at once, then queues the requests in order."""
+    limiter = OneCallApiRateLimiter(10, per=1.0, burst=2)
+    waits = [limiter.reserve() for _ in range(5)]
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+    stats = limiter.stats()
+    assert (stats["requests"], stats["delayed"]) == (5, 3)
+    assert stats["wait_time"] == pytest.approx(0.6, abs=0.03)
+    assert stats["max_wait"] == pytest.approx(0.3, abs=0.01)
+
+
+def test_0002():
+    """Test: validate method acquire waits for the budget."""
+    limiter = OneCallApiRateLimiter(20, per=1.0, burst=1)
+    start = time.monotonic()
+    waited = [limiter.acquire() for _ in range(3)]
+    assert time.monotonic() - start >= 0.09
+    assert waited[0] == 0.0 and waited[2] > 0.0
+
+
+@pytest.mark.skipif(fcntl is None, reason="fcntl is not available")
+def test_0003(tmp_path):
+    """Test: validate limiters given the same path share one budget."""
+    path = str(tmp_path / "bucket")
+    first, second = OneCallApiRateLimiter(10, per=1.0, burst=2, path=path), OneCallApiRateLimiter(10, 1.0, 2, path)
+    assert [first.reserve(), second.reserve()] == [0.0, 0.0]
+    assert second.reserve() == pytest.approx(0.1, abs=0.01)
+    assert first.reserve() == pytest.approx(0.2, abs=0.01)
+    assert OneCallApiRateLimiter(10, per=1.0, burst=2).reserve() == 0.0
+    first.close()
+    second.close()
+
+
+def test_0004(stub_server, monkeypatch):
+    """Test: validate update_data waits for the rate limiter."""
+    limiter = OneCallApiRateLimiter(20, per=1.0, burst=1)
+    monkeypatch.setattr(OneCallApi, "rate_limiter", limiter)
+    assert [OneCallApiCurrent(LAT, LON, KEY).update_data() for _ in range(3)] == [True] * 3
+    assert stub_server.requests == 3
+    assert limiter.stats()["delayed"] == 2
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0005(stub_server, monkeypatch):
+    """Test: validate asyncio update_data waits for the rate limiter without blocking the event loop."""
+    limiter = OneCallApiRateLimiter(20, per=1.0, burst=1)
+    monkeypatch.setattr(OneCallApi, "rate_limiter", limiter)
+
+    async def update():
+        results = await asyncio.gather(*(AsyncOneCallApiCurrent(LAT, LON, KEY).update_data() for _ in range(3)))
+        await AsyncOneCallApiSession.shared().close()
+        return results
+
+    start = time.monotonic()
+    assert asyncio.run(update()) == [True] * 3
+    assert 0.09 <= time.monotonic() - start < 0.5
+    assert stub_server.requests == 3
+    assert limiter.stats()["delayed"] == 2
+
+
+@pytest.mark.skipif(fcntl is None, reason="fcntl is not available")
+def test_0006(tmp_path):
+    """Test: validate a limiter inherited by a forked process does not share the file lock of its parent."""
+    limiter = OneCallApiRateLimiter(10, per=1.0, burst=2, path=str(tmp_path / "bucket"))
+    fcntl.flock(limiter._fd, fcntl.LOCK_EX)
+    proc = multiprocessing.get_context("fork").Process(target=timed_reserve, args=(limiter, 0.2))
+    proc.start()
+    time.sleep(0.3)
+    fcntl.flock(limiter._fd, fcntl.LOCK_UN)
+    proc.join()
+    assert proc.exitcode == 0
+    limiter.close()
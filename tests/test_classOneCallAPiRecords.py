@@ -0,0 +1,64 @@
+"""Test Module: OneCallApiRecords."""
+import pytest
+
+from pocar.OneCallApiRecords import OneCallApiCurrentRecord
+from pocar.OneCallApiRecords import OneCallApiDailyRecord
+from pocar.OneCallApiStubServer import build_payload
+
+# CONSTANT DATA
+PAYLOAD = build_payload(45.1234, 1.2345)
+
+
+def test_0000():
+    """Test: validate a Current record holds the fields of the section, nested fields included."""
+    current = dict(PAYLOAD["current"], rain={"1h": 0.4})
+    record = OneCallApiCurrentRecord.from_dict(current)
+    assert record.temp == current["temp"]
+    assert record.rain_1h == 0.4
+    assert record.snow_1h == "N/A"
+    assert record.weather.main == current["weather"][0]["main"]
+    assert record.as_dict() == current
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.unknown = 1
+
+
+def test_0001():
+    """Test: validate a Daily record holds nested temperatures, feels_like has no min and max."""
+    entry = PAYLOAD["daily"][2]
+    record = OneCallApiDailyRecord.from_dict(entry)
+    assert record.temp.max == entry["temp"]["max"]
+    assert record.feels_like.day == entry["feels_like"]["day"]
+    assert record.feels_like.min == "N/A"
+    assert record.weather.icon == entry["weather"][0]["icon"]
+    assert record.as_dict() == entry
+    assert record == OneCallApiDailyRecord.from_dict(entry)
+    assert record != OneCallApiDailyRecord.from_dict(PAYLOAD["daily"][3])
+    assert "temp=OneCallApiTempRecord(day=" in repr(record)
+
+
+def test_0002():
+    """Test: validate an empty entry gives a record of N/A, and empty nested records."""
+    record = OneCallApiDailyRecord.from_dict({})
+    assert record.dt == "N/A"
+    assert record.temp.day == "N/A"
+    assert record.weather.id == "N/A"
+    assert record.get("dt") is None
+    assert record.get("dt", 0) == 0
+    assert record.as_dict() == {}
+
+
+def test_0003():
+    """Test: validate a record keeps the fields its slots do not hold, and all weather conditions."""
+    rain = {"main": "Rain", "id": 500, "description": "light rain", "icon": "10d"}
+    entry = dict(PAYLOAD["daily"][1], summary="Rain in the afternoon", weather=PAYLOAD["daily"][1]["weather"] + [rain])
+    record = OneCallApiDailyRecord.from_dict(entry)
+    assert record.extra == {"summary": entry["summary"], "weather": entry["weather"]}
+    assert record.weather.main == entry["weather"][0]["main"]
+    assert record.as_dict() == entry
+    assert record != OneCallApiDailyRecord.from_dict(PAYLOAD["daily"][1])
+    current = dict(PAYLOAD["current"], rain={"1h": 0.4, "3h": 1.2})
+    record = OneCallApiCurrentRecord.from_dict(current)
+    assert record.rain_1h == 0.4
+    assert record.as_dict() == current
+    assert OneCallApiCurrentRecord.from_dict(PAYLOAD["current"]).extra == {}
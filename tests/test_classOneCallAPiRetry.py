@@ -0,0 +1,171 @@
+"""Test Module: OneCallApiRetry."""
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiRetry import OneCallApiRetry
+from pocar.OneCallApiSession import OneCallApiSession
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def http_error(status, headers=None):
+    """Support function: returns the error raised by raise_for_status for an HTTP status."""
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp.url = "http://127.0.0.1/data/2.5/onecall"
+    return requests.exceptions.HTTPError(f"{status} Error", response=resp)
+
+
+class FlakySession(OneCallApiSession):
+    """Support class: a session whose first requests are answered with an error status."""
+
+    def __init__(self, statuses):
+        """This is the constructor method."""
+        super().__init__()
+        self.statuses = list(statuses)
+        self.timeouts = []
+
+    def get(self, url, **kwargs):
+        """Raises the next error status, or makes the HTTP GET request."""
+        self.timeouts.append(kwargs.get("timeout"))
+        if self.statuses:
+            raise http_error(self.statuses.pop(0), {"Retry-After": "0"})
+        return super().get(url, **kwargs)
+
+
+def test_0000():
+    """Test: validate constructor nominal case and arguments range."""
+    retry = OneCallApiRetry(5, connect_timeout=1.0, read_timeout=2.0, deadline=None)
+    assert retry.config()["attempts"] == 5
+    assert retry.timeout() == (1.0, 2.0)
+    assert retry.timeout(0.5) == (0.5, 0.5)
+    with pytest.raises(ValueError):
+        OneCallApiRetry(0)
+    with pytest.raises(ValueError):
+        OneCallApiRetry(read_timeout=0)
+    with pytest.raises(ValueError):
+        OneCallApiRetry(backoff=-1.0)
+    with pytest.raises(ValueError):
+        OneCallApiRetry(deadline=0)
+    with pytest.raises(ValueError):
+        OneCallApiRetry(max_retry_after=-1.0)
+
+
+def test_0001():
+    """Test: validate method delay, exponential, capped, with and without jitter, and Retry-After."""
+    retry = OneCallApiRetry(backoff=0.5, max_backoff=3.0, jitter=False)
+    assert [retry.delay(idx) for idx in range(4)] == [0.5, 1.0, 2.0, 3.0]
+    assert retry.delay(0, retry_after=7.0) == 7.0
+    jittered = OneCallApiRetry(backoff=0.5, max_backoff=3.0)
+    delays = [jittered.delay(3) for _ in range(100)]
+    assert all(0.0 <= delay <= 3.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_0002():
+    """Test: validate method retry_after, given in seconds or as an HTTP date."""
+    assert OneCallApiRetry.retry_after({"Retry-After": "12"}) == 12.0
+    assert 25.0 < OneCallApiRetry.retry_after({"Retry-After": formatdate(time.time() + 30, usegmt=True)}) <= 30.0
+    assert OneCallApiRetry.retry_after({"Retry-After": "soon"}) is None
+    assert OneCallApiRetry.retry_after({}) is None
+
+
+def test_0003():
+    """Test: validate method call retries transient errors and keeps the attempts latency."""
+    retry = OneCallApiRetry(4, backoff=0.001)
+    errors = [requests.exceptions.ConnectTimeout("timed out"), http_error(503), http_error(429, {"Retry-After": "0"})]
+
+    def attempt(timeout):
+        assert timeout[0] <= 3.05
+        if errors:
+            raise errors.pop(0)
+        return "response"
+
+    assert retry.call(attempt) == "response"
+    assert [outcome for _, _, outcome in retry.latencies()] == ["ConnectTimeout", 503, 429, "ok"]
+    assert [idx for idx, _, _ in retry.latencies()] == [0, 1, 2, 3]
+    assert retry.stats() == {"requests": 1, "attempts": 4, "retries": 3, "failures": 0}
+
+
+def test_0004():
+    """Test: validate method call raises errors not worth retrying, and the last error after the last attempt."""
+    retry = OneCallApiRetry(3, backoff=0.001)
+    with pytest.raises(requests.exceptions.HTTPError):
+        retry.call(lambda timeout: (_ for _ in ()).throw(http_error(401)))
+    assert retry.stats()["attempts"] == 1
+    with pytest.raises(requests.exceptions.HTTPError):
+        retry.call(lambda timeout: (_ for _ in ()).throw(http_error(502)))
+    assert retry.stats() == {"requests": 2, "attempts": 4, "retries": 2, "failures": 2}
+
+
+def test_0005():
+    """Test: validate method call stops retrying when the next attempt would start after the deadline."""
+    retry = OneCallApiRetry(10, backoff=0.001, deadline=1.0)
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.HTTPError):
+        retry.call(lambda timeout: (_ for _ in ()).throw(http_error(429, {"Retry-After": "5"})))
+    assert time.monotonic() - start < 0.5
+    assert retry.stats()["attempts"] == 1
+
+
+def test_0006(stub_server, monkeypatch):
+    """Test: validate update_data retries transient errors and passes the timeouts to the session."""
+    session = FlakySession([503])
+    monkeypatch.setattr(OneCallApi, "session", session)
+    assert OneCallApiCurrent(LAT, LON, KEY).update_data() is False
+    assert session.timeouts == [(3.05, 30.0)]
+    monkeypatch.setattr(OneCallApi, "retry", OneCallApiRetry(3, backoff=0.001))
+    session.statuses = [503, 429]
+    assert OneCallApiCurrent(LAT, LON, KEY).update_data() is True
+    session.statuses = [503, 503, 503]
+    assert OneCallApiCurrent(LAT, LON, KEY).update_data() is False
+    assert OneCallApi.retry.stats() == {"requests": 2, "attempts": 6, "retries": 4, "failures": 1}
+    assert stub_server.requests == 1
+    assert session.timeouts[1:] == [(3.05, 10.0)] * 6
+    session.close()
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0007(monkeypatch):
+    """Test: validate asyncio update_data retries connection errors."""
+    server = OneCallApiStubServer()
+    monkeypatch.setattr(OneCallApi, "base_url", server.url)
+    server.server_close()
+    monkeypatch.setattr(OneCallApi, "retry", OneCallApiRetry(3, backoff=0.001))
+
+    async def update():
+        result = await AsyncOneCallApiCurrent(LAT, LON, KEY).update_data()
+        await AsyncOneCallApiSession.shared().close()
+        return result
+
+    assert asyncio.run(update()) is False
+    assert [outcome for _, _, outcome in OneCallApi.retry.latencies()] == ["ClientConnectorError"] * 3
+
+
+def test_0008():
+    """Test: validate a Retry-After longer than max_retry_after fails at once, without a deadline too."""
+    retry = OneCallApiRetry(3, max_retry_after=2.0, deadline=None, jitter=False)
+    assert retry.config()["max_retry_after"] == 2.0
+    assert retry.delay(0, retry_after=7.0) == 2.0
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.HTTPError):
+        retry.call(lambda timeout: (_ for _ in ()).throw(http_error(429, {"Retry-After": "3600"})))
+    assert time.monotonic() - start < 0.5
+    assert retry.stats() == {"requests": 1, "attempts": 1, "retries": 0, "failures": 1}
+    errors = [http_error(503, {"Retry-After": "0.01"})]
+    assert retry.call(lambda timeout: (_ for _ in ()).throw(errors.pop()) if errors else "ok") == "ok"
+    assert retry.stats()["retries"] == 1
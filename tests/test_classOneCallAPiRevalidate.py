@@ -0,0 +1,120 @@
+"""Test Module: OneCallApi stale-while-revalidate mode."""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiCache import OneCallApiCache
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiSession import OneCallApiSession
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+class SlowSession(OneCallApiSession):
+    """Support class: a session whose requests take some time."""
+
+    def get(self, url, **kwargs):
+        """Makes an HTTP GET request after a delay."""
+        time.sleep(0.3)
+        return super().get(url, **kwargs)
+
+
+def test_0000(stub_server, monkeypatch):
+    """Test: validate reads return the response held at once, and refresh it in the background once expired."""
+    executor = ThreadPoolExecutor(1)
+    monkeypatch.setattr(OneCallApi, "revalidate_executor", executor)
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    assert ocac.update_data() is True
+    monkeypatch.setattr(OneCallApi, "session", SlowSession())
+    monkeypatch.setattr(OneCallApi, "soft_ttl", 0.1)
+    first, timestamp = ocac.raw_data(), ocac.timestamp()
+    assert ocac.raw_data() is first
+    time.sleep(0.11)
+    start = time.monotonic()
+    assert [ocac.raw_data() is first for _ in range(10)] == [True] * 10
+    assert ocac.temperature() == 20.0
+    assert time.monotonic() - start < 0.1
+    executor.shutdown(wait=True)
+    assert ocac.raw_data() is not first
+    assert ocac.timestamp() > timestamp
+    assert stub_server.requests == 2
+    OneCallApi.session.close()
+
+
+def test_0001(stub_server, monkeypatch):
+    """Test: validate a refresh is triggered at most once per soft_ttl, and not before soft_ttl."""
+    submitted = []
+    monkeypatch.setattr(OneCallApi, "soft_ttl", 0.1)
+    monkeypatch.setattr(OneCallApiCurrent, "_revalidate", lambda oca: submitted.append(oca))
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    ocac.raw_data()
+    assert submitted == [ocac]
+    assert ocac.update_data() is True
+    ocac.raw_data()
+    time.sleep(0.11)
+    ocac.raw_data()
+    ocac.raw_data()
+    assert submitted == [ocac, ocac]
+    assert stub_server.requests == 1
+
+
+def test_0002(stub_server, monkeypatch):
+    """Test: validate the views of a combined object refresh their parent."""
+    submitted = []
+    monkeypatch.setattr(OneCallApiCombined, "_revalidate", lambda oca: submitted.append(oca))
+    combined = OneCallApiCombined(LAT, LON, KEY)
+    assert combined.update_data() is True
+    monkeypatch.setattr(OneCallApi, "soft_ttl", 0.0)
+    time.sleep(0.01)
+    combined.current().temperature()
+    assert submitted == [combined]
+    assert stub_server.requests == 1
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0003(stub_server, monkeypatch):
+    """Test: validate asyncio objects refresh in a task of the running event loop."""
+    monkeypatch.setattr(OneCallApi, "soft_ttl", 0.05)
+
+    async def read():
+        ocac = AsyncOneCallApiCurrent(LAT, LON, KEY)
+        assert await ocac.update_data() is True
+        first = ocac.raw_data()
+        await asyncio.sleep(0.06)
+        assert ocac.raw_data() is first
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if ocac.raw_data() is not first:
+                break
+        await AsyncOneCallApiSession.shared().close()
+        return ocac.raw_data() is not first
+
+    assert asyncio.run(read()) is True
+    assert stub_server.requests == 2
+
+
+def test_0004(stub_server, monkeypatch):
+    """Test: validate a refresh skips the cache holding the response being refreshed."""
+    executor = ThreadPoolExecutor(1)
+    monkeypatch.setattr(OneCallApi, "revalidate_executor", executor)
+    monkeypatch.setattr(OneCallApi, "cache", OneCallApiCache())
+    ocac = OneCallApiCurrent(LAT, LON, KEY)
+    assert ocac.update_data() is True
+    first = ocac.raw_data()
+    monkeypatch.setattr(OneCallApi, "soft_ttl", 0.05)
+    time.sleep(0.06)
+    assert ocac.raw_data() is first
+    executor.shutdown(wait=True)
+    assert ocac.raw_data() is not first
+    assert stub_server.requests == 2
+    assert OneCallApi.cache.get(ocac.cache_key())[0] is ocac.raw_data()
@@ -0,0 +1,121 @@
+"""Test Module: OneCallApiScheduler."""
+import asyncio
+import time
+
+import pytest
+
+from pocar.AsyncOneCallApi import aiohttp
+from pocar.AsyncOneCallApi import AsyncOneCallApiCurrent
+from pocar.AsyncOneCallApi import AsyncOneCallApiSession
+from pocar.OneCallApiCombined import OneCallApiCombined
+from pocar.OneCallApiCurrent import OneCallApiCurrent
+from pocar.OneCallApiDaily import OneCallApiDaily
+from pocar.OneCallApiScheduler import OneCallApiScheduler
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+class RecordingCurrent(OneCallApiCurrent):
+    """Support class: a Current object recording the order of its updates in a shared list."""
+
+    def __init__(self, name, updates, timestamp=0):
+        """This is the constructor method."""
+        super().__init__(LAT, LON, KEY)
+        self.name = name
+        self.updates = updates
+        self._timestamp = timestamp
+
+    def update_data(self):
+        """Records the update."""
+        self.updates.append(self.name)
+        self._timestamp = time.time()
+        return self.name != "failing"
+
+
+def test_0000():
+    """Test: validate constructor and method interval, from the sections of the objects."""
+    scheduler = OneCallApiScheduler()
+    assert scheduler.interval(OneCallApiCurrent(LAT, LON, KEY)) == 600.0
+    assert scheduler.interval(OneCallApiDaily(LAT, LON, KEY)) == 10800.0
+    assert scheduler.interval(OneCallApiCombined(LAT, LON, KEY)) == 60.0
+    assert OneCallApiScheduler({"current": 300.0}).interval(OneCallApiCurrent(LAT, LON, KEY)) == 300.0
+    with pytest.raises(ValueError):
+        OneCallApiScheduler(max_workers=0)
+    with pytest.raises(ValueError):
+        OneCallApiScheduler({"daily": 0})
+    with pytest.raises(ValueError):
+        scheduler.register(OneCallApiCurrent(LAT, LON, KEY), interval=-1.0)
+
+
+def test_0001():
+    """Test: validate the refreshes of objects with a fresh response are spread over the interval."""
+    scheduler = OneCallApiScheduler()
+    now = time.time()
+    objects = [RecordingCurrent(idx, [], now) for idx in range(100)]
+    for oca in objects:
+        scheduler.register(oca)
+    assert len(scheduler) == 100 and objects[0] in scheduler
+    slots = sorted(due for due, _, _ in scheduler._heap)
+    assert now < slots[0] and slots[-1] <= now + 600.0 + 1.0
+    assert max(second - first for first, second in zip(slots, slots[1:])) < 3 * 600.0 / 100
+    assert scheduler.run_pending() == 0
+    assert scheduler.next_due() == slots[0]
+
+
+def test_0002():
+    """Test: validate method run_pending refreshes the objects due by priority, then the most stale first."""
+    updates = []
+    scheduler = OneCallApiScheduler()
+    scheduler.register(RecordingCurrent("recent", updates, time.time() - 700))
+    scheduler.register(RecordingCurrent("failing", updates, 0))
+    scheduler.register(RecordingCurrent("old", updates, time.time() - 7000))
+    scheduler.register(RecordingCurrent("hot", updates, time.time() - 650), priority=1)
+    fresh = RecordingCurrent("fresh", updates, time.time())
+    scheduler.register(fresh)
+    removed = RecordingCurrent("removed", updates, 0)
+    scheduler.register(removed)
+    scheduler.unregister(removed)
+    assert scheduler.run_pending() == 4
+    assert updates == ["hot", "failing", "old", "recent"]
+    assert scheduler.run_pending() == 0
+    stats = scheduler.stats()
+    assert (stats["registered"], stats["refreshes"], stats["failures"]) == (5, 4, 1)
+
+
+def test_0003(stub_server):
+    """Test: validate methods start and stop refresh the objects in a background thread."""
+    scheduler = OneCallApiScheduler({"current": 0.1}, max_workers=2)
+    objects = [OneCallApiCurrent(LAT + idx, LON, KEY) for idx in range(3)]
+    scheduler.start()
+    for oca in objects:
+        scheduler.register(oca)
+    time.sleep(0.35)
+    scheduler.stop()
+    assert all(oca.temperature() == 20.0 for oca in objects)
+    assert 6 <= scheduler.stats()["refreshes"] <= 12
+    assert stub_server.requests == scheduler.stats()["refreshes"]
+
+
+@pytest.mark.skipif(aiohttp is None, reason="aiohttp is not installed")
+def test_0004(stub_server):
+    """Test: validate method run_async refreshes asyncio objects in the running event loop."""
+    scheduler = OneCallApiScheduler({"current": 0.1}, max_workers=4)
+
+    async def run():
+        objects = [AsyncOneCallApiCurrent(LAT + idx, LON, KEY) for idx in range(3)]
+        for oca in objects:
+            scheduler.register(oca)
+        task = asyncio.create_task(scheduler.run_async(poll=0.05))
+        await asyncio.sleep(0.25)
+        scheduler.stop()
+        await task
+        await AsyncOneCallApiSession.shared().close()
+        return objects
+
+    objects = asyncio.run(run())
+    assert all(oca.temperature() == 20.0 for oca in objects)
+    assert scheduler.stats()["refreshes"] >= 6
+    assert stub_server.requests == scheduler.stats()["refreshes"]
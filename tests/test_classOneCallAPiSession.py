@@ -0,0 +1,72 @@
+"""Test Module: OneCallApiSession."""
+import pytest
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiSession import OneCallApiSession
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+EXC = "minutely,hourly,daily,alerts"
+
+
+@pytest.fixture(name="shared_session")
+def fixture_shared_session(monkeypatch):
+    """Fixture: give the test a shared session of its own, the shared session of the process is restored after."""
+    monkeypatch.setattr(OneCallApiSession, "_OneCallApiSession__shared", None)
+    yield
+    OneCallApiSession.shared().close()
+
+
+def test_0000():
+    """Test: validate constructor nominal case."""
+    session = OneCallApiSession(4, 8, False)
+    assert session.config() == {"pool_connections": 4, "pool_maxsize": 8, "keep_alive": False}
+    session.close()
+
+
+def test_0001():
+    """Test: validate constructor for pool sizes."""
+    with pytest.raises(ValueError):
+        OneCallApiSession(pool_connections=0)
+    with pytest.raises(ValueError):
+        OneCallApiSession(pool_maxsize=0)
+
+
+def test_0002(shared_session):  # pylint: disable=unused-argument
+    """Test: validate methods shared and configure."""
+    shared = OneCallApiSession.shared()
+    assert OneCallApiSession.shared() is shared
+    configured = OneCallApiSession.configure(pool_maxsize=20)
+    assert OneCallApiSession.shared() is configured
+    assert configured.config()["pool_maxsize"] == 20
+    assert shared.config()["pool_maxsize"] == 10
+
+
+def test_0003(stub_server, shared_session):  # pylint: disable=unused-argument
+    """Test: validate connections are reused across objects with the shared session."""
+    OneCallApiSession.configure()
+    for lat in (10.0, 20.0, 30.0):
+        oca = OneCallApi(lat, LON, KEY, EXC)
+        assert oca.update_data() is True
+        assert oca.raw_data()["lat"] == lat
+        assert "current" in oca.raw_data()
+    assert stub_server.requests == 3
+    assert stub_server.connections == 1
+
+
+def test_0004(stub_server):
+    """Test: validate a new connection is made per request without keep alive."""
+    oca = OneCallApi(LAT, LON, KEY, EXC)
+    oca.session = OneCallApiSession(keep_alive=False)
+    assert oca.update_data() is True
+    assert oca.update_data() is True
+    assert stub_server.requests == 2
+    assert stub_server.connections == 2
+    oca.session.close()
+
+
+def test_0005():
+    """Test: validate the tests configuring the shared session restore the shared session of the process."""
+    assert OneCallApiSession.shared().config() == {"pool_connections": 10, "pool_maxsize": 10, "keep_alive": True}
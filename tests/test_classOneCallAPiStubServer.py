@@ -0,0 +1,77 @@
+"""Test Module: OneCallApiStubServer."""
+import time
+
+import pytest
+import requests
+
+from pocar.OneCallApi import OneCallApi
+from pocar.OneCallApiHourly import OneCallApiHourly
+from pocar.OneCallApiStubServer import OneCallApiStubServer
+
+# CONSTANT DATA
+LAT = 45.1234
+LON = 1.2345
+KEY = "abcdef1234567890abcdef1234567890"
+
+
+def get(server, **params):
+    """Support function: return the response of the server to a request with the given parameters."""
+    return requests.get(server.url, params=dict({"lat": LAT, "lon": LON, "appid": KEY}, **params), timeout=5.0)
+
+
+def test_0000():
+    """Test: validate the server honors exclude, and answers with the location requested."""
+    with OneCallApiStubServer() as server:
+        data = get(server, exclude="current,minutely,alerts").json()
+        assert set(data) == {"lat", "lon", "timezone", "timezone_offset", "hourly", "daily"}
+        assert (data["lat"], data["lon"]) == (LAT, LON)
+        assert {"current", "minutely", "hourly", "daily", "alerts"} <= set(get(server).json())
+        assert server.requests == 2 and server.statuses == {200: 2}
+
+
+def test_0001():
+    """Test: validate the server answers 401 for an invalid API key, and 400 for an invalid location."""
+    with OneCallApiStubServer(appid=KEY) as server:
+        assert get(server, appid="notakey").status_code == 401
+        assert get(server, appid="0123456789abcdef0123456789abcdef").status_code == 401
+        assert get(server, lat="north").status_code == 400
+        assert get(server, lon=181).status_code == 400
+        resp = requests.get(server.url, params={"appid": KEY}, timeout=5.0)
+        assert resp.status_code == 400 and resp.json()["message"] == "Nothing to geocode"
+        assert get(server).status_code == 200
+        assert server.statuses == {401: 2, 400: 3, 200: 1}
+
+
+def test_0002():
+    """Test: validate the server answers 503 at the error rate, and 429 with Retry-After at the throttle rate."""
+    with OneCallApiStubServer(error_rate=1.0) as server:
+        assert get(server).status_code == 503
+        server.error_rate, server.throttle_rate, server.retry_after = 0.0, 1.0, 7
+        resp = get(server)
+        assert resp.status_code == 429 and resp.headers["Retry-After"] == "7"
+        server.throttle_rate = 0.0
+        assert get(server).status_code == 200
+    with pytest.raises(ValueError):
+        OneCallApiStubServer(error_rate=0.6, throttle_rate=0.6)
+
+
+def test_0003(monkeypatch):
+    """Test: validate the size of the responses is set by the number of hourly and daily entries."""
+    with OneCallApiStubServer(hours=4, days=2) as server:
+        monkeypatch.setattr(OneCallApi, "base_url", server.url)
+        data = get(server).json()
+        assert len(data["hourly"]) == 4 and len(data["daily"]) == 2
+        small = len(get(server).content)
+        server_full = OneCallApiStubServer()
+        with server_full:
+            assert len(get(server_full).content) > small
+        oca = OneCallApiHourly(LAT, LON, KEY)
+        assert oca.update_data() is True
+
+
+def test_0004():
+    """Test: validate every answer of the server is delayed by its latency."""
+    with OneCallApiStubServer(latency=0.05) as server:
+        start = time.perf_counter()
+        assert get(server).status_code == 200
+        assert time.perf_counter() - start >= 0.05